@@ -0,0 +1,237 @@
+"""Benchmark of the startup and the screens, run with offscreen Qt.
+
+Measures, in milliseconds:
+    first_window             starting `main.py` until the start screen is shown, in a new interpreter
+    setup_ui/<screen>        building the widgets of every screen
+    categories/<terms>       `CategoriesScreen.refresh` until its first page of categories is shown
+    load_terms/<terms>       `DictionaryScreen.load_terms` until its first page of terms is shown
+    quiz_start/<terms>       `QuizScreen.refresh` until the first question is shown
+    on_submit/<terms>        `QuizScreen.on_submit` until the database thread and the GUI are idle again
+
+The sizes are synthetic databases made by `synthetic.py`. The results are written as
+JSON with the commit they were measured at, and `--compare` prints how they changed
+against an earlier file.
+
+Usage:
+    PYTHONPATH=helix python benchmarks/screens.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import PySide6
+import settings
+import shiboken6
+from authorization_screen import AuthorizationScreen
+from categories_screen import CategoriesScreen
+from database import close_store, get_async_store
+from dictionary_screen import DictionaryScreen
+from matching_screen import MatchingScreen
+from navigator import Navigator
+from PySide6.QtWidgets import QApplication, QMainWindow
+from quiz import MODE_WRITE
+from quiz_screen import QuizScreen
+from start_screen import StartScreen
+from stats_screen import StatsScreen
+from store import Store
+from synthetic import generate
+from welcome_screen import WelcomeScreen
+
+HELIX = Path(__file__).parent.parent / "helix"
+SIZES = (10, 1000, 100_000)
+# Callbacks may queue further jobs, e.g. the quiz prefetches the next questions once one is shown
+SETTLE_PASSES = 2
+SCREENS = (
+    StartScreen,
+    AuthorizationScreen,
+    WelcomeScreen,
+    CategoriesScreen,
+    DictionaryScreen,
+    QuizScreen,
+    MatchingScreen,
+    StatsScreen,
+)
+
+FIRST_WINDOW = """
+import sys
+from PySide6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+import main
+main.show_main_window()
+app.processEvents()
+"""
+
+
+def summarize(timings: list[float]) -> dict[str, float]:
+    return {
+        "median": round(statistics.median(timings), 3),
+        "min": round(min(timings), 3),
+        "max": round(max(timings), 3),
+        "runs": len(timings),
+    }
+
+
+def settle(app: QApplication, done: Callable[[], bool] = lambda: True) -> None:
+    """Run the database jobs and the events they cause until `done` is true, then the jobs those queued."""
+    while not done():
+        get_async_store().wait()
+        app.processEvents()
+    for _ in range(SETTLE_PASSES):
+        get_async_store().wait()
+        app.processEvents()
+
+
+def measure(app: QApplication, action: Callable[[], object], done: Callable[[], bool] = lambda: True) -> float:
+    start = time.perf_counter()
+    action()
+    settle(app, done)
+    return (time.perf_counter() - start) * 1000
+
+
+def first_window(repeat: int) -> list[float]:
+    env = {**os.environ, "PYTHONPATH": str(HELIX)}
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", FIRST_WINDOW], cwd=HELIX, env=env, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def setup_ui(navigator: Navigator, screen_type: type, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        screen = screen_type()
+        screen.setup_ui(navigator)
+        timings.append((time.perf_counter() - start) * 1000)
+        # Deleted right away, the screen is not refreshed and must not handle events
+        shiboken6.delete(screen.centralwidget)
+    return timings
+
+
+def page_loads(app: QApplication, model, reload: Callable[[], object], repeat: int) -> list[float]:
+    """Time `reload` until the model shows its first page."""
+    loaded = []
+    model.page_loaded.connect(lambda: loaded.append(True))
+    timings = []
+    for _ in range(repeat):
+        loaded.clear()
+        timings.append(measure(app, reload, lambda: bool(loaded)))
+    return timings
+
+
+def quiz(app: QApplication, screen: QuizScreen, group_id: int, user, answers: int) -> tuple[list[float], list[float]]:
+    """Time starting quizzes, and answering their questions until `answers` were given."""
+
+    def loaded() -> bool:
+        return not screen.term_input.isHidden() or not screen.final_label.isHidden()
+
+    starts, submits = [], []
+    while len(submits) < answers:
+        starts.append(measure(app, lambda: screen.refresh(group_id, user, MODE_WRITE), loaded))
+        while len(submits) < answers and screen.final_label.isHidden():
+            screen.term_input.setText(screen.term.term)
+            submits.append(measure(app, screen.on_submit))
+        settle(app)
+    return starts, submits
+
+
+def run_size(app: QApplication, navigator: Navigator, terms: int, args: argparse.Namespace, directory: str) -> dict:
+    path = Path(directory) / f"benchmark-{terms}.db"
+    store = Store(str(path))
+    data = generate(store, terms)
+    store.close()
+
+    close_store()
+    settings.DATABASE = str(path)
+    try:
+        categories = navigator.open(CategoriesScreen, data.user)
+        settle(app)
+        dictionary = navigator.open(DictionaryScreen, data.groups[0], data.user)
+        settle(app)
+        quiz_screen = navigator.open(QuizScreen, data.groups[0].id, data.user, MODE_WRITE)
+        settle(app)
+
+        results = {
+            f"categories/{terms}": page_loads(
+                app, categories.categories_model, lambda: categories.refresh(data.user), args.repeat
+            ),
+            f"load_terms/{terms}": page_loads(app, dictionary.terms_model, dictionary.load_terms, args.repeat),
+        }
+        starts, submits = quiz(app, quiz_screen, data.groups[0].id, data.user, args.answers)
+        results[f"quiz_start/{terms}"] = starts
+        results[f"on_submit/{terms}"] = submits
+    finally:
+        close_store()
+    return results
+
+
+def git_commit() -> str | None:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], cwd=HELIX, capture_output=True, text=True, check=False
+    )
+    return result.stdout.strip() or None
+
+
+def compare(results: dict, previous_path: str) -> None:
+    previous = json.loads(Path(previous_path).read_text())
+    print(f"\nChange against {previous_path} ({previous.get('commit')}), median ms")
+    for name, stats in results["results"].items():
+        before = previous["results"].get(name)
+        if before is None:
+            continue
+        change = stats["median"] / before["median"] - 1 if before["median"] else 0
+        print(f"{name:<28} {before['median']:>10.3f} {stats['median']:>10.3f} {change:>+8.1%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="terms of the synthetic databases")
+    parser.add_argument("--repeat", type=int, default=10, help="runs of every measurement")
+    parser.add_argument("--answers", type=int, default=50, help="quiz answers submitted per size")
+    parser.add_argument("--output", default="benchmark-screens.json", help="JSON file of the results")
+    parser.add_argument("--compare", help="JSON file of earlier results to compare with")
+    args = parser.parse_args()
+
+    timings = {"first_window": first_window(min(args.repeat, 5))}
+
+    app = QApplication(sys.argv)
+    navigator = Navigator(QMainWindow())
+    navigator.MainWindow.show()
+    for screen_type in SCREENS:
+        timings[f"setup_ui/{screen_type.__name__}"] = setup_ui(navigator, screen_type, args.repeat)
+    with tempfile.TemporaryDirectory() as directory:
+        for terms in args.sizes:
+            timings.update(run_size(app, navigator, terms, args, directory))
+
+    results = {
+        "commit": git_commit(),
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pyside": PySide6.__version__,
+        "results": {name: summarize(values) for name, values in timings.items()},
+    }
+    Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+
+    print(f"{'benchmark':<28} {'median ms':>10} {'min ms':>10} {'max ms':>10}")
+    for name, stats in results["results"].items():
+        print(f"{name:<28} {stats['median']:>10.3f} {stats['min']:>10.3f} {stats['max']:>10.3f}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
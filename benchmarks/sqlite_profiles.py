@@ -0,0 +1,82 @@
+"""Benchmark of the SQLite connection profiles.
+
+For the library defaults and every profile in `store.PROFILES` this measures how many
+quiz answers per second `Quiz.update_mastery` can persist (one commit per answer) and
+the median latency of `TermsStore.get_by_group_id`.
+
+Usage:
+    PYTHONPATH=helix python benchmarks/sqlite_profiles.py --terms 10000 --answers 500
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from models import Term, TermGroup, User
+from quiz import Quiz
+from store import PROFILES, ConnectionProfile, Store
+
+GROUPS = 4
+
+
+def populate(store: Store, terms_per_group: int) -> tuple[int, list[int]]:
+    user = store.users.create(User(username="benchmark"))
+    groups = [TermGroup(name=f"group {i}", user_id=user.id) for i in range(GROUPS)]
+    store.term_groups.create_many(groups)
+    for group in groups:
+        store.terms.create_many(
+            [Term(term=f"term {i}", definition=f"definition {i}", group_id=group.id) for i in range(terms_per_group)]
+        )
+    return user.id, [group.id for group in groups]
+
+
+def answers_per_second(store: Store, user_id: int, group_id: int, answers: int) -> float:
+    quiz = Quiz(store, user_id)
+    terms = store.terms.get_by_group_id(group_id)
+    rng = random.Random(0)
+
+    start = time.perf_counter()
+    for _ in range(answers):
+        quiz.update_mastery(rng.choice(terms), correct=rng.random() < 0.7)
+    return answers / (time.perf_counter() - start)
+
+
+def group_lookup_ms(store: Store, group_ids: list[int], repeat: int) -> float:
+    timings = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        store.terms.get_by_group_id(group_ids[i % len(group_ids)])
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run(name: str, profile: ConnectionProfile, args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        store = Store(str(Path(directory) / "benchmark.db"), profile=profile)
+        user_id, group_ids = populate(store, args.terms)
+        writes = answers_per_second(store, user_id, group_ids[0], args.answers)
+        lookup = group_lookup_ms(store, group_ids, args.repeat)
+        store.close()
+
+    print(f"{name:<10} {writes:>14.0f} {lookup:>18.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--terms", type=int, default=10_000, help="terms per group")
+    parser.add_argument("--answers", type=int, default=500, help="answers written per profile")
+    parser.add_argument("--repeat", type=int, default=50, help="get_by_group_id calls per profile")
+    args = parser.parse_args()
+
+    print(f"{GROUPS} groups x {args.terms} terms, {args.answers} answers, {args.repeat} lookups")
+    print(f"{'profile':<10} {'answers/s':>14} {'get_by_group_id ms':>18}")
+    run("defaults", ConnectionProfile(), args)
+    for name, profile in PROFILES.items():
+        run(name, profile, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Micro-benchmarks of the store, run with pytest-benchmark.
+
+The database is made by `synthetic.py` once per run, its size is set with the
+BENCH_USERS, BENCH_CATEGORIES and BENCH_TERMS environment variables. It uses the
+connection profile of the application.
+
+The file is not named like a test module, so the test suite skips it; pass its path:
+    PYTHONPATH=helix python -m pytest benchmarks/store_benchmarks.py --benchmark-json store.json
+    BENCH_TERMS=100000 PYTHONPATH=helix python -m pytest benchmarks/store_benchmarks.py
+
+`test_term_memory` records the bytes taken by 100k terms loaded from the store in the
+`extra_info` of its result.
+"""
+
+import os
+import random
+import tracemalloc
+from collections.abc import Callable
+from itertools import count
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import settings
+from models import Term, TermGroup, User
+from quiz import ANSWER_BATCH, Quiz
+from store import Store
+from synthetic import generate
+
+USERS = int(os.environ.get("BENCH_USERS", "1000"))
+CATEGORIES = int(os.environ.get("BENCH_CATEGORIES", "100"))
+TERMS = int(os.environ.get("BENCH_TERMS", "10000"))
+PAGE_SIZE = 100
+MEMORY_TERMS = 100_000
+KINDS = ["users", "term_groups", "terms"]
+
+
+class Data:
+    def __init__(self, store: Store) -> None:
+        self.store = store
+        self.synthetic = generate(store, TERMS, CATEGORIES, users=USERS)
+        self.group_id = self.synthetic.groups[0].id
+        self.rng = random.Random(0)
+        self.names = count()
+
+    def new(self, kind: str) -> User | TermGroup | Term:
+        """Return a row of the kind that is not in the database yet."""
+        number = next(self.names)
+        if kind == "users":
+            return User(username=f"new user {number}")
+        if kind == "term_groups":
+            return TermGroup(name=f"new category {number}", user_id=self.synthetic.user.id)
+        return Term(term=f"new term {number}", definition=f"new definition {number}", group_id=self.group_id)
+
+    def ids(self, kind: str) -> list[int]:
+        return [row.id for row in getattr(self.store, kind).list()]
+
+
+@pytest.fixture(scope="module")
+def data(tmp_path_factory):
+    store = Store(str(tmp_path_factory.mktemp("store") / "benchmark.db"), profile=settings.DATABASE_PROFILE)
+    yield Data(store)
+    store.close()
+
+
+def random_picker(data: Data, values: list) -> Callable[[], object]:
+    return lambda: data.rng.choice(values)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_create(benchmark, data, kind):
+    benchmark.group = kind
+    stored = getattr(data.store, kind)
+
+    benchmark(lambda: stored.create(data.new(kind)))
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_get(benchmark, data, kind):
+    benchmark.group = kind
+    stored = getattr(data.store, kind)
+    pick = random_picker(data, data.ids(kind))
+
+    assert benchmark(lambda: stored.get(pick())) is not None
+
+
+@pytest.mark.parametrize("limit", [PAGE_SIZE, None], ids=["page", "all"])
+@pytest.mark.parametrize("kind", KINDS)
+def test_list(benchmark, data, kind, limit):
+    benchmark.group = kind
+    stored = getattr(data.store, kind)
+
+    assert benchmark(stored.list, limit=limit)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_update(benchmark, data, kind):
+    benchmark.group = kind
+    stored = getattr(data.store, kind)
+    pick = random_picker(data, stored.list(limit=1000))
+
+    benchmark(lambda: stored.update(pick()))
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_delete(benchmark, data, kind):
+    benchmark.group = kind
+    stored = getattr(data.store, kind)
+
+    # Every round deletes a row created for it, the creation is not timed
+    benchmark.pedantic(stored.delete, setup=lambda: ((stored.create(data.new(kind)).id,), {}), rounds=200)
+
+
+@pytest.mark.parametrize("limit", [PAGE_SIZE, None], ids=["page", "all"])
+def test_get_by_group_id(benchmark, data, limit):
+    benchmark.group = "terms"
+
+    assert benchmark(data.store.terms.get_by_group_id, data.group_id, limit=limit)
+
+
+def test_update_mastery(benchmark, data):
+    benchmark.group = "quiz"
+    quiz = Quiz(data.store, data.synthetic.user.id)
+    pick = random_picker(data, data.store.terms.get_by_group_id(data.group_id, limit=1000))
+
+    benchmark(lambda: quiz.update_mastery(pick(), correct=data.rng.random() < 0.7))
+
+
+def test_update_mastery_many(benchmark, data):
+    benchmark.group = "quiz"
+    quiz = Quiz(data.store, data.synthetic.user.id)
+    terms = data.store.terms.get_by_group_id(data.group_id, limit=1000)
+
+    benchmark(
+        lambda: quiz.update_mastery_many(
+            [(term, data.rng.random() < 0.7) for term in data.rng.sample(terms, ANSWER_BATCH)]
+        )
+    )
+
+
+def test_term_memory(benchmark, data):
+    benchmark.group = "memory"
+
+    def load() -> list[Term]:
+        return data.store.terms.get_by_group_id(data.group_id)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    terms = load()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    assert terms
+    benchmark.extra_info["terms"] = len(terms)
+    benchmark.extra_info["bytes_per_100k_terms"] = round(size * MEMORY_TERMS / len(terms))
+    benchmark.pedantic(load, rounds=5)
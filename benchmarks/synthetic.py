@@ -0,0 +1,86 @@
+"""Synthetic databases for the benchmarks.
+
+The same arguments always give the same database: `users` users, `categories` term
+groups of the first user and `terms` terms with random words and definitions. The
+first category holds every term, the others are empty, so both the category list and
+the largest dictionary are as long as the arguments allow.
+
+Usage:
+    PYTHONPATH=helix python benchmarks/synthetic.py benchmark.db --terms 100000
+"""
+
+import argparse
+import random
+import string
+from dataclasses import dataclass
+from itertools import batched
+
+from models import Term, TermGroup, User
+from store import Store
+
+USERNAME = "benchmark"
+BATCH_SIZE = 5000
+
+
+@dataclass
+class SyntheticData:
+    users: list[User]
+    groups: list[TermGroup]
+
+    @property
+    def user(self) -> User:
+        """The user owning the categories."""
+        return self.users[0]
+
+
+def word(rng: random.Random, length: int) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=length))
+
+
+def make_terms(group_id: int, count: int, seed: int = 0) -> list[Term]:
+    """Return `count` distinct terms of the group, the same ones for the same seed."""
+    rng = random.Random(seed)
+    return [
+        Term(
+            term=f"{word(rng, rng.randint(3, 10))} {i}",
+            definition=" ".join(word(rng, rng.randint(2, 9)) for _ in range(rng.randint(3, 12))),
+            group_id=group_id,
+        )
+        for i in range(count)
+    ]
+
+
+def default_categories(terms: int) -> int:
+    return max(1, terms // 100)
+
+
+def generate(store: Store, terms: int, categories: int | None = None, seed: int = 0, users: int = 1) -> SyntheticData:
+    """Fill an empty store with the synthetic users, the categories of the first one and their terms."""
+    categories = categories or default_categories(terms)
+    with store.transaction():
+        all_users = [User(username=USERNAME if i == 0 else f"{USERNAME} {i}") for i in range(users)]
+        store.users.create_many(all_users)
+        groups = [TermGroup(name=f"category {i}", user_id=all_users[0].id) for i in range(categories)]
+        store.term_groups.create_many(groups)
+        for batch in batched(make_terms(groups[0].id, terms, seed), BATCH_SIZE):
+            store.terms.create_many(batch)
+    return SyntheticData(all_users, groups)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="database file to create")
+    parser.add_argument("--terms", type=int, default=1000)
+    parser.add_argument("--categories", type=int, help="defaults to one per 100 terms")
+    parser.add_argument("--users", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    store = Store(args.path)
+    data = generate(store, args.terms, args.categories, args.seed, args.users)
+    store.close()
+    print(f"{args.path}: {len(data.users)} users, {len(data.groups)} categories, {args.terms} terms")
+
+
+if __name__ == "__main__":
+    main()
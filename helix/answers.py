@@ -0,0 +1,137 @@
+"""Module for checking typed answers with typo tolerance.
+
+Classes:
+    Matcher: Interface of the answer checking engines.
+    ExactMatcher: Accepts answers equal to the correct one, ignoring case and surrounding whitespace.
+    FuzzyMatcher: Accepts answers within a few typos of the correct one or of one of its synonyms.
+
+Functions:
+    normalize: Fold case, accents, punctuation and whitespace of a text.
+    bounded_distance: Damerau-Levenshtein distance of two texts, giving up past a bound.
+
+Examples:
+    matcher = FuzzyMatcher(synonyms={"car": ["automobile"]})
+    matcher.matches("Automobil", "car")  # True
+
+"""
+
+import re
+import unicodedata
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import Protocol
+
+ALTERNATIVES_SEPARATOR = ";"
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize(text: str) -> str:
+    """Fold case, accents, punctuation and whitespace, so "  Café-au-lait!" becomes "cafe au lait"."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    folded = "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+    return " ".join(_PUNCTUATION.sub(" ", folded).split())
+
+
+def bounded_distance(source: str, target: str, bound: int) -> int:  # noqa: C901
+    """Return the Damerau-Levenshtein (optimal string alignment) distance of two texts.
+
+    Only distances up to `bound` are computed exactly, anything further returns `bound + 1`.
+    A path through the table further than `bound` cells off its diagonal costs more than
+    `bound`, so only that band is filled, in O(len(source) * bound), and a wrong answer is
+    rejected as soon as a whole row of the band exceeds the bound.
+    """
+    if abs(len(source) - len(target)) > bound:
+        return bound + 1
+    if source == target:
+        return 0
+
+    over = bound + 1
+    width = len(target)
+    # Three rows are reused, cells outside the band read as `over`
+    before_previous = [over] * (width + 1)
+    previous = [j if j <= bound else over for j in range(width + 1)]
+    row = [over] * (width + 1)
+    for i, source_char in enumerate(source, 1):
+        low, high = max(1, i - bound), min(width, i + bound)
+        row[0] = i if i <= bound else over
+        row[low - 1] = row[0] if low == 1 else over
+        best = row[low - 1]
+        for j in range(low, high + 1):
+            target_char = target[j - 1]
+            cost = previous[j - 1] if source_char == target_char else previous[j - 1] + 1
+            # Plain comparisons, min() would double the time of this innermost loop
+            if previous[j] < cost:
+                cost = previous[j] + 1
+            if row[j - 1] < cost:
+                cost = row[j - 1] + 1
+            if (
+                i > 1
+                and j > 1
+                and before_previous[j - 2] < cost
+                and source_char == target[j - 2]
+                and source[i - 2] == target_char
+            ):
+                cost = before_previous[j - 2] + 1
+            row[j] = cost
+            if cost < best:  # noqa: PLR1730
+                best = cost
+        if high < width:
+            row[high + 1] = over
+        if best > bound:
+            return over
+        before_previous, previous, row = previous, row, before_previous
+
+    return min(previous[width], over)
+
+
+class Matcher(Protocol):
+    def matches(self, user_answer: str, correct_answer: str) -> bool: ...
+
+
+class ExactMatcher:
+    """Accepts answers equal to the correct one, ignoring case and surrounding whitespace."""
+
+    def matches(self, user_answer: str, correct_answer: str) -> bool:
+        return user_answer.strip().lower() == correct_answer.strip().lower()
+
+
+class FuzzyMatcher:
+    """Accepts answers within a few typos of the correct one or of one of its synonyms.
+
+    A correct answer may list alternatives separated by `ALTERNATIVES_SEPARATOR`, and
+    `synonyms` maps an answer to further accepted ones. Every answer allows one typo per
+    `1 / typo_ratio` characters, at most `max_typos`.
+
+    The normalized forms accepted for a correct answer are computed once and cached,
+    so checking an answer only normalizes the user's input and compares it.
+    """
+
+    def __init__(
+        self,
+        synonyms: Mapping[str, Iterable[str]] | None = None,
+        typo_ratio: float = 0.2,
+        max_typos: int = 2,
+        cache_size: int = 4096,
+    ) -> None:
+        self.synonyms = {
+            normalize(answer): [normalize(synonym) for synonym in alternatives]
+            for answer, alternatives in (synonyms or {}).items()
+        }
+        self.typo_ratio = typo_ratio
+        self.max_typos = max_typos
+        self.accepted = lru_cache(maxsize=cache_size)(self._accepted)
+
+    def _accepted(self, correct_answer: str) -> tuple[tuple[str, int], ...]:
+        """Return the normalized accepted answers with the number of typos each allows."""
+        forms: dict[str, int] = {}
+        for alternative in correct_answer.split(ALTERNATIVES_SEPARATOR):
+            answer = normalize(alternative)
+            for form in (answer, *self.synonyms.get(answer, ())):
+                if form:
+                    forms[form] = min(self.max_typos, int(len(form) * self.typo_ratio))
+        return tuple(forms.items())
+
+    def matches(self, user_answer: str, correct_answer: str) -> bool:
+        answer = normalize(user_answer)
+        return any(bounded_distance(answer, form, typos) <= typos for form, typos in self.accepted(correct_answer))
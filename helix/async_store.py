@@ -0,0 +1,128 @@
+"""Module for running store calls off the GUI thread.
+
+Every job runs on one dedicated database thread which owns the SQLite connection,
+so writes are serialized and reads see the writes queued before them. Writes the
+store holds back are committed once no job is left in the queue. Results are
+delivered through a Qt signal, so callbacks run on the thread that created the
+`AsyncStore`, normally the GUI thread, and may touch widgets.
+
+Classes:
+    AsyncStore: Facade queuing store jobs on the database thread.
+
+Examples:
+    db = AsyncStore(lambda: Store("database.db"))
+
+    # Callbacks run on the GUI thread once the result is there
+    db.submit(lambda store: store.users.list(), fill_drop_down)
+
+    # Fire and forget writes, or wait on the returned future
+    db.submit(lambda store: store.terms.update(term))
+    user = db.submit(lambda store: store.users.get(user_id)).result()
+
+    # Runs the queued jobs and closes the store
+    db.close()
+
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from PySide6.QtCore import QObject, Signal, Slot
+from store import Store
+
+logger = logging.getLogger(__name__)
+
+
+class _Dispatcher(QObject):
+    """Calls callbacks on its own thread, signals emitted by other threads are queued to it."""
+
+    delivered = Signal(object, object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.delivered.connect(self._call)
+
+    @Slot(object, object)
+    def _call(self, callback: Callable[[Any], None], value: object) -> None:
+        callback(value)
+
+
+class AsyncStore:
+    """Facade queuing store jobs on the database thread.
+
+    A job is a callable taking the `Store`. The store is opened by `open_store` on
+    the database thread when the first job runs, as SQLite connections may only be
+    used by the thread that opened them. A single worker thread is used instead of
+    a pool, which could retire the thread holding the connection.
+    """
+
+    def __init__(self, open_store: Callable[[], Store]) -> None:
+        self._open_store = open_store
+        self._store: Store | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="database")
+        self._dispatcher = _Dispatcher()
+        self._lock = threading.Lock()
+        self._queued = 0
+
+    def _run[T](self, job: Callable[[Store], T]) -> T:
+        try:
+            if self._store is None:
+                self._store = self._open_store()
+            return job(self._store)
+        finally:
+            with self._lock:
+                self._queued -= 1
+                idle = self._queued == 0
+            # Write-behind commits are not left waiting for a next write that may never come
+            if idle and self._store is not None:
+                self._store.unit_of_work.flush_pending()
+
+    def submit[T](
+        self,
+        job: Callable[[Store], T],
+        callback: Callable[[T], None] | None = None,
+        error: Callable[[BaseException], None] | None = None,
+    ) -> Future[T]:
+        """Queue a job and call `callback` with its result, or `error` with its exception, on the GUI thread."""
+        with self._lock:
+            self._queued += 1
+        future = self._executor.submit(self._run, job)
+        future.add_done_callback(partial(self._done, callback, error))
+        return future
+
+    def _done(
+        self,
+        callback: Callable[[Any], None] | None,
+        error: Callable[[BaseException], None] | None,
+        future: Future,
+    ) -> None:
+        exception = future.exception()
+        if exception is None:
+            if callback is not None:
+                self.post(callback, future.result())
+        elif error is not None:
+            self.post(error, exception)
+        else:
+            logger.error("Database job failed", exc_info=exception)
+
+    def post(self, callback: Callable[[Any], None], value: object = None) -> None:
+        """Call `callback` with `value` on the GUI thread, e.g. to report progress from a job."""
+        self._dispatcher.delivered.emit(callback, value)
+
+    def wait(self) -> None:
+        """Block until the jobs queued so far have run."""
+        self._executor.submit(lambda: None).result()
+
+    def _close(self) -> None:
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def close(self) -> None:
+        """Run the queued jobs, close the store on the database thread and stop the thread."""
+        self._executor.submit(self._close).result()
+        self._executor.shutdown()
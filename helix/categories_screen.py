@@ -1,10 +1,18 @@
-from functools import partial
-
-from dictionary_screen import DictionaryScreen
-from PySide6.QtCore import *  # type: ignore
-from PySide6.QtGui import *  # type: ignore
-from PySide6.QtWidgets import *  # type: ignore
-from store import Store, TermGroup, User
+from PySide6.QtCore import QCoreApplication, QMetaObject, QRect, QSize, Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QFrame,
+    QLabel,
+    QLineEdit,
+    QListView,
+    QMessageBox,
+    QPushButton,
+    QWidget,
+)
+from resources import get_font, get_icon, get_pixmap
+from database import get_async_store
+from list_view import ButtonRowDelegate, LazyListModel
+from store import TermGroup, User
 import logging
 
 
@@ -12,69 +20,55 @@ class CategoriesScreen:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-    def setup_ui(self, screen, store: Store, user: User, welcome_screen):
+    def setup_ui(self, navigator):
         self.logger.debug("Setting up the categories screen UI")
 
-        self.store = store
-        self.user = user
-        self.welcome_screen = welcome_screen
-        self.MainWindow = screen.MainWindow
-
-        # Setting up the Main Window
-        self.MainWindow.setEnabled(True)
-        sizePolicy = QSizePolicy()
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.MainWindow.sizePolicy().hasHeightForWidth())
-        self.MainWindow.setSizePolicy(sizePolicy)
-        self.MainWindow.setMinimumSize(QSize(800, 600))
-        self.MainWindow.setMaximumSize(QSize(600, 400))
-        self.MainWindow.setFont(QFont("Helvetica", 30))
-        self.MainWindow.setIconSize(QSize(48, 48))
+        self.navigator = navigator
+        self.MainWindow = navigator.MainWindow
 
         # Configuring the central widget
-        self.centralwidget = QWidget(self.MainWindow)
+        self.centralwidget = QWidget()
         self.centralwidget.setAutoFillBackground(False)
         self.centralwidget.setStyleSheet("background-color: #CADBDD")
+        self.centralwidget.setFont(get_font("Helvetica", 30))
 
         # Header
         self.header = QLabel(self.centralwidget)
         self.header.setGeometry(QRect(1, -3, 813, 136))
-        self.header.setFont(QFont("Helvetica", 25))
-        self.header.setPixmap(QPixmap("./assets/header.png"))
+        self.header.setFont(get_font("Helvetica", 25))
+        self.header.setPixmap(get_pixmap("header.png"))
 
         # Logo on the header
         self.logo = QLabel(self.centralwidget)
         self.logo.setObjectName("label_2")
         self.logo.setGeometry(QRect(15, 15, 91, 91))
         self.logo.setStyleSheet("background-color: transparent;")
-        self.logo.setPixmap(QPixmap("./assets/helix-log-small.png"))
+        self.logo.setPixmap(get_pixmap("helix-log-small.png"))
         self.logo.setScaledContents(True)
 
-        # Category scroll area with category buttons
-        self.scroll_area = QScrollArea(self.centralwidget)
-        self.scroll_area.setGeometry(QRect(30, 200, 750, 300))
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area_widget_contents = QWidget()
-        self.scroll_area.setWidget(self.scroll_area_widget_contents)
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)  # type: ignore
-        self.scroll_area.setStyleSheet("border-radius: 0px")
-
-        # Get categories and add a default one
-        self.categories_buttons_list = {}
-        self.trashcan_buttons_list = {}
-        if self.user.id is not None:
-            categories = self.store.term_groups.get_by_user_id(self.user.id)
-            self.logger.debug(f"Categories: {categories}")
-            if not categories:
-                self.add_new_category("Default")
-                categories = self.store.term_groups.get_by_user_id(self.user.id)
-                self.logger.debug(f"Categories: {categories}")
-            self.update_category_field(categories)
+        # List of categories, rows are fetched and painted only when scrolled into view
+        self.categories_model = LazyListModel(self.fetch_categories, lambda category: category.name.upper())
+        self.categories_delegate = ButtonRowDelegate(get_font("Helvetica", 30))
+        self.categories_delegate.clicked.connect(self.go_to_dictionary_screen)
+        self.categories_delegate.delete_clicked.connect(self.delete_category)
+
+        self.categories_view = QListView(self.centralwidget)
+        self.categories_view.setGeometry(QRect(30, 200, 750, 300))
+        self.categories_view.setStyleSheet("border-radius: 0px; background-color: transparent")
+        self.categories_view.setFrameShape(QFrame.Shape.NoFrame)
+        self.categories_view.setUniformItemSizes(True)
+        self.categories_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.categories_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)  # type: ignore
+        self.categories_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.categories_view.setItemDelegate(self.categories_delegate)
+        self.categories_view.setModel(self.categories_model)
+
+        # Add a default category to users without one
+        self.categories_model.page_loaded.connect(self.add_default_category)
+        self.categories_model.load_failed.connect(self.on_load_failed)
 
         # Add category plus button
-        image = QPixmap("./assets/plus.png")
-        self.add_category_plus_button = QPushButton(QIcon(image), "", self.centralwidget)
+        self.add_category_plus_button = QPushButton(get_icon("plus.png"), "", self.centralwidget)
         self.add_category_plus_button.setGeometry(QRect(705, 150, 46, 46))
         self.add_category_plus_button.setStyleSheet("border-radius: 0px")
         self.add_category_plus_button.setIconSize(QSize(48, 48))
@@ -83,114 +77,94 @@ class CategoriesScreen:
         # Add header label
         self.header_label = QLabel(self.centralwidget)
         self.header_label.setGeometry(QRect(135, 45, 271, 46))
-        self.header_label.setFont(QFont("Helvetica", 40, QFont.Bold))  # type: ignore
+        self.header_label.setFont(get_font("Helvetica", 40, bold=True))
         self.header_label.setStyleSheet("background-color: transparent; color: #666666; font-size: 40px;")
 
-        self.MainWindow.setCentralWidget(self.centralwidget)
-        self.retranslate_ui()
-        QMetaObject.connectSlotsByName(self.MainWindow)
-
-    def retranslate_ui(self):
-        self.logger.debug("Retranslating the categories screen UI")
-        self.MainWindow.setWindowTitle(QCoreApplication.translate("self.MainWindow", "self.MainWindow", None))
-        self.header_label.setText(QCoreApplication.translate("self.MainWindow", "CATEGORIES", None))
-
-    def update_category_field(self, categories):
-        self.logger.debug(f"Updating the category field with {categories}")
+        # New category form, shown instead of the list
+        self.input_category_text_label = QLabel(self.centralwidget)
+        self.input_category_text_label.setGeometry(QRect(115, 300, 256, 31))
+        self.input_category_text_label.setStyleSheet("color: #666666; font-size: 30px")
+        self.input_category_text_label.setFont(get_font("Helvetica", 30))
 
-        if self.scroll_area_widget_contents.layout() is not None:
-            self.clear_layout(self.scroll_area_widget_contents.layout())
-            QWidget().setLayout(self.scroll_area_widget_contents.layout())
+        self.category_text = QLineEdit(self.centralwidget)
+        self.category_text.setGeometry(QRect(375, 300, 241, 31))
+        self.category_text.setStyleSheet("color: #666666; font-size: 20px")
 
-        layout = QVBoxLayout(self.scroll_area_widget_contents)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(10)
+        self.add_category_button = QPushButton(self.centralwidget)
+        self.add_category_button.setGeometry(QRect(570, 450, 196, 61))
+        self.add_category_button.clicked.connect(self.redirect_back)
+        self.add_category_button.setFont(get_font("Helvetica", 25))
+        self.add_category_button.setStyleSheet("color: #cadbdd; background-color: #666666; border-radius: 5px")
 
-        self.categories_buttons_list = {}
-        self.trashcan_buttons_list = {}
+        self.new_category_widgets = [self.input_category_text_label, self.category_text, self.add_category_button]
+        for widget in self.new_category_widgets:
+            widget.hide()
 
-        for index, category in enumerate(categories):
-            self.logger.debug(f"Adding category {category.name}")
-            category_button = QPushButton(self.scroll_area_widget_contents)
-            category_button.setFont(QFont("Helvetica", 30))
-            category_button.setStyleSheet("background-color: #666666; border-radius: 5px; color: #cadbdd")
-            category_button.setFixedHeight(50)
-            category_button.clicked.connect(partial(self.go_to_dictionary_screen, category))
-            category_button.setText(QCoreApplication.translate("self.MainWindow", category.name.upper(), None))
-            self.categories_buttons_list[category.name] = category_button
+        self.retranslate_ui_for_new_category_screen()
+        QMetaObject.connectSlotsByName(self.MainWindow)
 
-            trashcan_button = QPushButton(self.scroll_area_widget_contents)
-            trashcan_button.setStyleSheet("border-radius: 0px")
-            icon = QIcon()
-            icon.addFile("./assets/trashcan.png", QSize())
-            trashcan_button.setIcon(icon)
-            trashcan_button.setIconSize(QSize(48, 48))
-            trashcan_button.clicked.connect(partial(self.delete_category, category))
-            self.trashcan_buttons_list[category.name] = trashcan_button, index
+    def refresh(self, user: User):
+        """Show the categories of the user."""
+        self.user = user
+        self.show_categories()
+        self.categories_model.reload()
+        self.retranslate_ui()
 
-            h_layout = QHBoxLayout()
-            h_layout.addWidget(category_button)
-            h_layout.addWidget(trashcan_button)
+    def retranslate_ui(self):
+        self.logger.debug("Retranslating the categories screen UI")
+        self.MainWindow.setWindowTitle(QCoreApplication.translate("self.MainWindow", "self.MainWindow", None))
+        self.header_label.setText(QCoreApplication.translate("self.MainWindow", "CATEGORIES", None))
 
-            h_layout.setStretch(0, 10)
-            h_layout.setStretch(1, 1)
+    def fetch_categories(self, after_id: int, limit: int, deliver):
+        user_id = self.user.id
+        if user_id is None:
+            deliver([])
+            return
+        # A failed query is delivered as its exception, the model reports it
+        get_async_store().submit(
+            lambda store: store.term_groups.get_by_user_id(user_id, after_id=after_id, limit=limit),
+            deliver,
+            deliver,
+        )
 
-            layout.addLayout(h_layout)
+    def on_load_failed(self, error: BaseException) -> None:
+        """Shows why the categories could not be loaded."""
+        QMessageBox.warning(self.MainWindow, "Loading failed", f"The categories could not be loaded: {error}")
 
-        self.scroll_area_widget_contents.setLayout(layout)
+    def add_default_category(self):
+        if self.categories_model.exhausted and self.categories_model.rowCount() == 0:
+            self.add_new_category("Default")
 
-    def add_new_category(self, category_name: str):
+    def add_new_category(self, category_name: str) -> bool:
+        """Create a category, returning False without creating it when the name is blank."""
+        category_name = category_name.strip()
+        if not category_name:
+            self.logger.debug("Not adding a category without a name")
+            return False
         self.logger.debug(f"Adding new category {category_name} for user {self.user.username}")
 
         category = TermGroup(name=category_name, user_id=self.user.id)
-        self.store.term_groups.create(category)
-        if self.user.id is not None:
-            self.update_category_field(self.store.term_groups.get_by_user_id(self.user.id))
+        get_async_store().submit(lambda store: store.term_groups.create(category), self.categories_model.append_item)
+        return True
 
-    def delete_category(self, category: TermGroup):
+    def delete_category(self, row: int):
+        category = self.categories_model.item(row)
         self.logger.debug(f"Deleting category {category.name} for user {self.user.username}")
 
         if category.id is not None:
             self.logger.debug(f"Deleting category {category.name} with id {category.id}")
-            self.store.term_groups.delete(category.id)
-        if self.user.id is not None:
-            self.logger.debug(f"Updating categories for user {self.user.username}")
-            self.update_category_field(self.store.term_groups.get_by_user_id(self.user.id))
-
-    def clear_layout(self, layout):
-        self.logger.debug("Clearing the layout")
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-            elif child.layout():
-                self.clear_layout(child.layout())
+            get_async_store().submit(lambda store: store.term_groups.delete(category.id))
+        self.categories_model.remove_row(row)
 
     def add_new_category_screen(self):
         self.logger.debug("Adding new category screen")
 
-        self.add_category_plus_button.close()
-        self.scroll_area.close()
-
-        self.input_category_text_label = QLabel(self.centralwidget)
-        self.input_category_text_label.setGeometry(QRect(115, 300, 256, 31))
-        self.input_category_text_label.setStyleSheet("color: #666666; font-size: 30px")
-        self.input_category_text_label.show()
-        self.input_category_text_label.setFont(QFont("Helvetica", 30))
-
-        self.category_text = QLineEdit(self.centralwidget)
-        self.category_text.setGeometry(QRect(375, 300, 241, 31))
-        self.category_text.setStyleSheet("color: #666666; font-size: 20px")
-        self.category_text.show()
-
-        self.add_category_button = QPushButton(self.centralwidget)
-        self.add_category_button.setGeometry(QRect(570, 450, 196, 61))
-        self.add_category_button.clicked.connect(self.redirect_back)
-        self.add_category_button.setFont(QFont("Helvetica", 25))
-        self.add_category_button.setStyleSheet("color: #cadbdd; background-color: #666666; border-radius: 5px")
+        self.add_category_plus_button.hide()
+        self.categories_view.hide()
 
-        self.retranslate_ui_for_new_category_screen()
-        QMetaObject.connectSlotsByName(self.MainWindow)
+        self.category_text.clear()
+        for widget in self.new_category_widgets:
+            widget.show()
 
     def retranslate_ui_for_new_category_screen(self):
         self.logger.debug("Retranslating the new category screen UI")
@@ -200,25 +174,28 @@ class CategoriesScreen:
             QCoreApplication.translate("self.MainWindow", "Enter category name", None)
         )
         self.add_category_button.setText(QCoreApplication.translate("self.MainWindow", "ADD", None))
-        self.add_category_button.show()
 
     def redirect_back(self):
         self.logger.debug("Redirecting back to the categories screen")
 
-        self.add_new_category(self.category_text.text())
-        self.add_category_button.close()
-        self.input_category_text_label.close()
-        self.category_text.close()
+        # The form stays open until a name is entered
+        if not self.add_new_category(self.category_text.text()):
+            self.category_text.clear()
+            return
+        self.show_categories()
+        self.retranslate_ui()
+
+    def show_categories(self):
+        """Hide the new category form and show the list."""
+        for widget in self.new_category_widgets:
+            widget.hide()
 
         self.add_category_plus_button.show()
-        self.scroll_area.show()
-        if self.user.id is not None:
-            self.update_category_field(self.store.term_groups.get_by_user_id(self.user.id))
-
-        self.retranslate_ui()
+        self.categories_view.show()
 
-    def go_to_dictionary_screen(self, category: TermGroup):
+    def go_to_dictionary_screen(self, row: int):
+        category = self.categories_model.item(row)
         self.logger.debug(f"Going to the dictionary screen with category {category.name}")
+        from dictionary_screen import DictionaryScreen
 
-        dictionary_screen = DictionaryScreen()
-        dictionary_screen.setup_ui(self.MainWindow, self.store, category, self.user, self.welcome_screen)
+        self.navigator.open(DictionaryScreen, category, self.user)
@@ -0,0 +1,50 @@
+"""Module owning the store shared by all screens.
+
+The store runs on a database thread, so the GUI does not wait for the disk. It is
+opened by the first job submitted to `get_async_store`, so starting the application
+does no database I/O, and closed by `close_store` when the application quits. It is
+the only connection to the database file.
+
+Examples:
+    # From the GUI, with the result delivered to a callback on the GUI thread
+    get_async_store().submit(lambda store: store.users.list(), fill_drop_down)
+
+    # Blocking, e.g. from a script
+    users = get_async_store().submit(lambda store: store.users.list()).result()
+
+    # On exit, commits pending writes and releases the file
+    close_store()
+
+"""
+
+import logging
+
+import settings
+from async_store import AsyncStore
+from store import Store
+
+logger = logging.getLogger(__name__)
+
+_async_store: AsyncStore | None = None
+
+
+def _open_store() -> Store:
+    logger.debug("Opening the database %s", settings.DATABASE)
+    return Store(settings.DATABASE, profile=settings.DATABASE_PROFILE)
+
+
+def get_async_store() -> AsyncStore:
+    global _async_store  # noqa: PLW0603
+
+    if _async_store is None:
+        _async_store = AsyncStore(_open_store)
+    return _async_store
+
+
+def close_store() -> None:
+    global _async_store  # noqa: PLW0603
+
+    if _async_store is not None:
+        logger.debug("Closing the database thread")
+        _async_store.close()
+        _async_store = None
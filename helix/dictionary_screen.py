@@ -1,259 +1,397 @@
 import logging
 from functools import partial
 
-from PySide6.QtCore import *  # type: ignore
-from PySide6.QtGui import *  # type: ignore
-from PySide6.QtWidgets import *  # type: ignore
-from quiz_screen import QuizScreen
-from store import Store, Term, TermGroup, User
+from PySide6.QtCore import QRect, QSize, QTimer, Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QFileDialog,
+    QFrame,
+    QLabel,
+    QLineEdit,
+    QListView,
+    QMessageBox,
+    QProgressDialog,
+    QPushButton,
+    QWidget,
+)
+from resources import get_font, get_icon, get_pixmap
+from quiz import MODE_MATCH, MODES
+from database import get_async_store
+from list_view import ButtonRowDelegate, LazyListModel
+from store import Term, TermGroup, User
+from transfer import export_terms, import_terms
+
+SEARCH_DELAY_MS = 250
+SEARCH_LIMIT = 100
+FILE_FILTER = "Decks (*.csv *.tsv *.jsonl *.txt);;CSV (*.csv);;TSV (*.tsv);;JSON Lines (*.jsonl);;Anki notes (*.txt)"
 
 
 class DictionaryScreen(object):
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-    def setup_ui(self, MainWindow, store: Store, category: TermGroup, user: User, welcome_screen):
-        self.category = category
-        self.store = store
-        self.user = user
-        self.welcome_screen = welcome_screen
-        self.MainWindow = MainWindow
-
-        MainWindow.setEnabled(True)
-        MainWindow.setMinimumSize(QSize(800, 600))
-        MainWindow.setMaximumSize(QSize(800, 600))
-        MainWindow.setFont(QFont("Helvetica", 12))
-        self.centralwidget = QWidget(MainWindow)
+    def setup_ui(self, navigator):
+        self.navigator = navigator
+        self.MainWindow = navigator.MainWindow
+
+        self.centralwidget = QWidget()
         self.centralwidget.setStyleSheet("background-color: #CADBDD")
+        self.centralwidget.setFont(get_font("Helvetica", 12))
 
         # Header setup
         self.header = QLabel(self.centralwidget)
         self.header.setGeometry(QRect(1, -3, 813, 136))
-        self.header.setPixmap(QPixmap("./assets/header.png"))
+        self.header.setPixmap(get_pixmap("header.png"))
         self.logo = QLabel(self.centralwidget)
         self.logo.setGeometry(QRect(15, 15, 91, 91))
-        self.logo.setPixmap(QPixmap("./assets/helix-log-small.png"))
+        self.logo.setPixmap(get_pixmap("helix-log-small.png"))
         self.logo.setScaledContents(True)
         self.logo.setStyleSheet("background-color: transparent;")
 
         # Header Label
         self.header_label = QLabel(self.centralwidget)
         self.header_label.setGeometry(QRect(135, 45, 271, 46))
-        self.header_label.setFont(QFont("Helvetica", 40, QFont.Bold))  # type: ignore
+        self.header_label.setFont(get_font("Helvetica", 40, bold=True))
         self.header_label.setStyleSheet("background-color: transparent; color: #666666;")
         self.header_label.setText("DICTIONARY")
 
-        # Scroll Area for Terms
-        self.scroll_menu = QScrollArea(self.centralwidget)
-        self.scroll_menu.setGeometry(QRect(30, 200, 736, 300))
-        self.scroll_menu.setWidgetResizable(True)
-        self.scroll_area_widget_contents = QWidget()
-        self.scroll_menu.setWidget(self.scroll_area_widget_contents)
-        self.scroll_menu.setStyleSheet("border-color: transparent")
-
-        self.terms_buttons_list = {}
-        self.trashcan_buttons_list = {}
-        self.load_terms()
+        # List of terms, rows are fetched and painted only when scrolled into view
+        self.terms_model = LazyListModel(self.fetch_terms, lambda term: term.term)
+        self.terms_delegate = ButtonRowDelegate()
+        self.terms_delegate.clicked.connect(self.edit_term_screen)
+        self.terms_delegate.delete_clicked.connect(self.delete_term)
+
+        self.terms_view = QListView(self.centralwidget)
+        self.terms_view.setGeometry(QRect(30, 200, 736, 300))
+        self.terms_view.setStyleSheet("border-color: transparent; background-color: transparent")
+        self.terms_view.setFrameShape(QFrame.Shape.NoFrame)
+        self.terms_view.setUniformItemSizes(True)
+        self.terms_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.terms_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.terms_view.setItemDelegate(self.terms_delegate)
+        self.terms_view.setModel(self.terms_model)
+
+        self.placeholder = QLabel("No terms found, press '+' to add a new one", self.centralwidget)
+        self.placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.placeholder.setStyleSheet("color: #666666;")
+        self.placeholder.setFont(get_font("Helvetica", 20))
+        self.placeholder.setGeometry(QRect(30, 200, 736, 300))
+        self.placeholder.hide()
+
+        self.terms_model.page_loaded.connect(self.update_placeholder)
+        self.terms_model.load_failed.connect(self.on_load_failed)
+
+        # Search box, queried once typing pauses instead of on every key
+        self.search_input = QLineEdit(self.centralwidget)
+        self.search_input.setGeometry(QRect(30, 150, 514, 46))
+        self.search_input.setFont(get_font("Helvetica", 20))
+        self.search_input.setStyleSheet("color: #666666;")
+        self.search_input.setPlaceholderText("Search terms and definitions")
+        self.search_timer = QTimer(self.centralwidget)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.search_terms)
+        self.search_input.textChanged.connect(lambda: self.search_timer.start())
+
+        # Import and export buttons
+        self.import_button = QPushButton("IMPORT", self.centralwidget)
+        self.import_button.setGeometry(QRect(554, 150, 75, 46))
+        self.export_button = QPushButton("EXPORT", self.centralwidget)
+        self.export_button.setGeometry(QRect(639, 150, 75, 46))
+        for button in (self.import_button, self.export_button):
+            button.setFont(get_font("Helvetica", 12, bold=True))
+            button.setStyleSheet(
+                "background-color: transparent; color: #666666; border-radius: 5px; border-style: solid; border-width: 1px;"
+            )
+        self.import_button.clicked.connect(lambda: self.import_file())
+        self.export_button.clicked.connect(lambda: self.export_file())
 
         # Add New Term Button
-        image = QPixmap("./assets/plus.png")
-        self.add_new_term_button = QPushButton(QIcon(image), "", self.centralwidget)
+        self.add_new_term_button = QPushButton(get_icon("plus.png"), "", self.centralwidget)
         self.add_new_term_button.setGeometry(QRect(720, 150, 46, 46))
         self.add_new_term_button.setStyleSheet("border-radius: 0px")
         self.add_new_term_button.setIconSize(QSize(48, 48))
         self.add_new_term_button.clicked.connect(lambda: self.add_new_term_screen())
 
+        self.quiz_mode = QComboBox(self.centralwidget)
+        self.quiz_mode.setGeometry(QRect(30, 520, 200, 61))
+        self.quiz_mode.setFont(get_font("Helvetica", 20))
+        self.quiz_mode.setStyleSheet("color: #666666;")
+        for mode, name in MODES.items():
+            self.quiz_mode.addItem(name, mode)
+
         self.start_quiz_button = QPushButton("START QUIZ", self.centralwidget)
-        self.start_quiz_button.setGeometry(QRect(30, 520, 736, 61))
-        self.start_quiz_button.setFont(QFont("Helvetica", 25, QFont.Bold))  # type: ignore
+        self.start_quiz_button.setGeometry(QRect(246, 520, 520, 61))
+        self.start_quiz_button.setFont(get_font("Helvetica", 25, bold=True))
         self.start_quiz_button.setStyleSheet(
             "background-color: transparent; color: #666666; border-radius: 5px; border-style: solid; border-width: 1px;"
         )
         self.start_quiz_button.clicked.connect(lambda: self.go_to_quiz_screen())
 
-        MainWindow.setCentralWidget(self.centralwidget)
-
-    def load_terms(self):
-        """Loads terms for the current category and updates the scroll area."""
-        self.logger.debug("Loading terms")
-        # Clear existing layout
-        if self.scroll_area_widget_contents.layout() is not None:
-            self.clear_layout(self.scroll_area_widget_contents.layout())
-            QWidget().setLayout(self.scroll_area_widget_contents.layout())
-
-        # Create new layout
-        layout = QVBoxLayout(self.scroll_area_widget_contents)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(10)
-
-        if self.category.id:
-            terms = self.store.terms.get_by_group_id(self.category.id)
-            if terms:
-                for term in terms:
-                    term_button = QPushButton(term.term, self.scroll_area_widget_contents)
-                    term_button.setFont(QFont("Helvetica", 20))
-                    term_button.setStyleSheet("background-color: #666666; color: #CADBDD; border-radius: 5px;")
-                    term_button.setFixedHeight(50)
-                    term_button.clicked.connect(partial(self.edit_term_screen, term))
-
-                    trashcan_button = QPushButton(self.scroll_area_widget_contents)
-                    trashcan_button.setStyleSheet("border-radius: 0px")
-                    icon = QIcon("./assets/trashcan.png")
-                    trashcan_button.setIcon(icon)
-                    trashcan_button.setIconSize(QSize(48, 48))
-                    trashcan_button.clicked.connect(partial(self.delete_term, term))
-
-                    h_layout = QHBoxLayout()
-                    h_layout.addWidget(term_button)
-                    h_layout.addWidget(trashcan_button)
-                    h_layout.setStretch(0, 10)
-                    h_layout.setStretch(1, 1)
-                    layout.addLayout(h_layout)
-            else:
-                self.placeholder = QLabel("No terms found, press '+' to add a new one", self.scroll_area_widget_contents)
-                self.placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.placeholder.setStyleSheet("color: #666666;")
-                self.placeholder.setFont(QFont("Helvetica", 20))
-                self.placeholder.setGeometry(QRect(0, 0, 736, 300))
-
-        self.scroll_area_widget_contents.setLayout(layout)
-
-    def add_new_term_screen(self):
-        """Shows input fields for adding a new term."""
-        self.logger.debug("Adding new term screen")
-
-        self.placeholder.close()
-        self.add_new_term_button.close()
-        self.scroll_menu.close()
-
+        # Form for adding and editing terms, shown instead of the list
         self.word_label = QLabel("Word:", self.centralwidget)
         self.word_label.setGeometry(QRect(115, 250, 100, 30))
-        self.word_label.setFont(QFont("Helvetica", 20))
+        self.word_label.setFont(get_font("Helvetica", 20))
         self.word_label.setStyleSheet("color: #666666;")
 
         self.definition_label = QLabel("Definition:", self.centralwidget)
         self.definition_label.setGeometry(QRect(115, 300, 150, 30))
-        self.definition_label.setFont(QFont("Helvetica", 20))
+        self.definition_label.setFont(get_font("Helvetica", 20))
         self.definition_label.setStyleSheet("color: #666666;")
 
         self.word_input = QLineEdit(self.centralwidget)
         self.word_input.setGeometry(QRect(300, 250, 400, 30))
         self.word_input.setStyleSheet("font-size: 18px; color: #666666")
-        self.word_input.setPlaceholderText("Enter the word")
 
         self.definition_input = QLineEdit(self.centralwidget)
         self.definition_input.setGeometry(QRect(300, 300, 400, 30))
         self.definition_input.setStyleSheet("font-size: 18px; color: #666666")
-        self.definition_input.setPlaceholderText("Enter the definition")
 
-        self.save_button = QPushButton("ADD", self.centralwidget)
+        self.save_button = QPushButton(self.centralwidget)
         self.save_button.setGeometry(QRect(600, 400, 100, 40))
         self.save_button.setStyleSheet("background-color: #666666; color: #CADBDD; border-radius: 5px;")
-        self.save_button.clicked.connect(self.add_term)
+        self.save_button.clicked.connect(self.save_term)
+
+        self.term_form_widgets = [
+            self.word_label,
+            self.definition_label,
+            self.word_input,
+            self.definition_input,
+            self.save_button,
+        ]
+        self.editing_row = None
+        self.hide_term_form()
+
+    def refresh(self, category: TermGroup, user: User):
+        """Show the terms of the category, with an empty search box."""
+        self.category = category
+        self.user = user
 
-        self.word_label.show()
-        self.definition_label.show()
-        self.word_input.show()
-        self.definition_input.show()
-        self.save_button.show()
+        self.search_input.clear()
+        self.search_timer.stop()
+        self.hide_term_form()
+        self.load_terms()
 
-    def add_term(self):
-        """Adds a new term to the database and updates the UI."""
-        word = self.word_input.text()
-        definition = self.definition_input.text()
-        if word and definition:
-            new_term = Term(word, definition, self.category.id)
-            self.store.terms.create(new_term)
+    def fetch_terms(self, after_id: int, limit: int, deliver):
+        """Fetches one page of terms of the current category in the background, a failure is delivered too."""
+        group_id = self.category.id
+        if not group_id:
+            deliver([])
+            return
+        get_async_store().submit(
+            lambda store: store.terms.get_by_group_id(group_id, after_id=after_id, limit=limit),
+            deliver,
+            deliver,
+        )
 
-        self.word_label.close()
-        self.definition_label.close()
-        self.word_input.close()
-        self.definition_input.close()
-        self.save_button.close()
+    def fetch_search_results(self, after_id: int, limit: int, deliver):
+        """Fetches the best matches of the search box, ranked results come in a single page."""
+        group_id = self.category.id
+        query = self.search_input.text()
+        if not group_id or after_id:
+            deliver([])
+            return
+        get_async_store().submit(
+            lambda store: store.terms.search(query, group_id, limit=SEARCH_LIMIT), deliver, deliver
+        )
 
-        self.add_new_term_button.show()
-        self.scroll_menu.show()
+    def search_terms(self):
+        """Shows the terms matching the search box, or all terms when it is empty."""
+        self.logger.debug(f"Searching terms: {self.search_input.text()}")
+
+        query = self.search_input.text().strip()
+        self.terms_model.reload(self.fetch_search_results if query else self.fetch_terms)
+
+    def on_load_failed(self, error: BaseException) -> None:
+        """Shows why the terms could not be loaded."""
+        QMessageBox.warning(self.MainWindow, "Loading failed", f"The terms could not be loaded: {error}")
+
+    def import_file(self):
+        """Imports the terms of a file chosen by the user into the current category."""
+        path, _ = QFileDialog.getOpenFileName(self.MainWindow, "Import terms", "", FILE_FILTER)
+        group_id = self.category.id
+        if not path or not group_id:
+            return
+        self.logger.debug(f"Importing terms from {path}")
+
+        self.progress = QProgressDialog("Importing terms...", None, 0, 100, self.MainWindow)
+        self.progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.progress.show()
+
+        db = get_async_store()
+        db.submit(
+            lambda store: import_terms(
+                store,
+                group_id,
+                path,
+                progress=lambda done, total: db.post(self.progress.setValue, done * 100 // max(total, 1)),
+            ),
+            self.on_imported,
+            partial(self.on_transfer_failed, "Import failed"),
+        )
+
+    def on_imported(self, report):
+        """Reports the outcome of an import and shows the new terms."""
+        self.progress.close()
+        QMessageBox.information(
+            self.MainWindow,
+            "Import finished",
+            f"Imported {report.imported} terms, skipped {report.duplicates} duplicates and {report.invalid} invalid rows.",
+        )
         self.load_terms()
 
-    def delete_term(self, term: Term):
-        """Deletes a term from the database."""
-        self.logger.debug(f"Deleting term: {term.term}")
+    def on_transfer_failed(self, title: str, error: BaseException):
+        """Shows why an import or export failed."""
+        self.progress.close()
+        QMessageBox.warning(self.MainWindow, title, str(error))
+
+    def export_file(self):
+        """Exports the terms of the current category into a file chosen by the user."""
+        path, _ = QFileDialog.getSaveFileName(self.MainWindow, "Export terms", f"{self.category.name}.csv", FILE_FILTER)
+        group_id = self.category.id
+        if not path or not group_id:
+            return
+        self.logger.debug(f"Exporting terms to {path}")
+
+        self.progress = QProgressDialog("Exporting terms...", None, 0, 0, self.MainWindow)
+        self.progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.progress.show()
+        get_async_store().submit(
+            lambda store: export_terms(store, group_id, path),
+            self.on_exported,
+            partial(self.on_transfer_failed, "Export failed"),
+        )
 
-        if term.id is not None:
-            self.store.terms.delete(term.id)
-        self.load_terms()
+    def on_exported(self, count: int):
+        """Reports how many terms were exported."""
+        self.progress.close()
+        QMessageBox.information(self.MainWindow, "Export finished", f"Exported {count} terms.")
 
-    def clear_layout(self, layout):
-        """Clears all widgets from a layout."""
-        self.logger.debug("Clearing the layout")
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-            elif child.layout():
-                self.clear_layout(child.layout())
-
-    def edit_term_screen(self, term: Term):
-        """Loads the term in the input fields for editing."""
-        self.logger.debug(f"Editing term: {term.term}")
+    def load_terms(self):
+        """Reloads the first page of terms for the current category."""
+        self.logger.debug("Loading terms")
 
-        self.add_new_term_button.close()
-        self.scroll_menu.close()
+        self.terms_model.reload()
 
-        self.word_label = QLabel("Word:", self.centralwidget)
-        self.word_label.setGeometry(QRect(115, 250, 100, 30))
-        self.word_label.setFont(QFont("Helvetica", 20))
-        self.word_label.setStyleSheet("color: #666666;")
+    def update_placeholder(self):
+        """Shows the placeholder instead of the list when the category has no terms."""
+        empty = self.terms_model.exhausted and self.terms_model.rowCount() == 0
+        self.placeholder.setVisible(empty)
+        self.terms_view.setVisible(not empty)
 
-        self.definition_label = QLabel("Definition:", self.centralwidget)
-        self.definition_label.setGeometry(QRect(115, 300, 150, 30))
-        self.definition_label.setFont(QFont("Helvetica", 20))
-        self.definition_label.setStyleSheet("color: #666666;")
+    def add_new_term_screen(self):
+        """Shows input fields for adding a new term."""
+        self.logger.debug("Adding new term screen")
 
-        self.word_input = QLineEdit(self.centralwidget)
-        self.word_input.setGeometry(QRect(300, 250, 400, 30))
-        self.word_input.setStyleSheet("font-size: 18px; color: #666666;")
-        self.word_input.setText(term.term)
+        self.show_term_form(None, "ADD", "", "")
 
-        self.definition_input = QLineEdit(self.centralwidget)
-        self.definition_input.setGeometry(QRect(300, 300, 400, 30))
-        self.definition_input.setStyleSheet("font-size: 18px; color: #666666;")
-        self.definition_input.setText(term.definition)
+    def show_term_form(self, row: int | None, action: str, word: str, definition: str):
+        """Shows the term form instead of the list, for a new term or the term in the given row."""
+        self.editing_row = row
 
-        self.save_button = QPushButton("SAVE", self.centralwidget)
-        self.save_button.setGeometry(QRect(600, 400, 100, 40))
-        self.save_button.setStyleSheet("background-color: #666666; color: #CADBDD; border-radius: 5px;")
-        self.save_button.clicked.connect(partial(self.update_term, term))
+        self.placeholder.hide()
+        self.add_new_term_button.hide()
+        self.search_input.hide()
+        self.import_button.hide()
+        self.export_button.hide()
+        self.terms_view.hide()
+
+        self.word_input.setText(word)
+        self.word_input.setPlaceholderText("Enter the word")
+        self.definition_input.setText(definition)
+        self.definition_input.setPlaceholderText("Enter the definition")
+        self.save_button.setText(action)
+        for widget in self.term_form_widgets:
+            widget.show()
+
+    def hide_term_form(self):
+        """Hides the term form and shows the list again."""
+        for widget in self.term_form_widgets:
+            widget.hide()
 
-        self.word_label.show()
-        self.definition_label.show()
-        self.word_input.show()
-        self.definition_input.show()
-        self.save_button.show()
+        self.add_new_term_button.show()
+        self.search_input.show()
+        self.import_button.show()
+        self.export_button.show()
+        self.update_placeholder()
+
+    def save_term(self):
+        """Saves the term of the form, a new one or the edited one."""
+        if self.editing_row is None:
+            self.add_term()
+        else:
+            self.update_term(self.editing_row)
 
-    def update_term(self, term: Term):
-        """Updates the term in the database and reloads the UI."""
+    def add_term(self):
+        """Adds a new term to the database and updates the UI."""
+        word = self.word_input.text()
+        definition = self.definition_input.text()
+        if word and definition:
+            new_term = Term(word, definition, self.category.id)
+            get_async_store().submit(
+                lambda store: store.terms.create(new_term),
+                self.on_term_added,
+                partial(self.on_term_not_added, word, definition),
+            )
+
+        self.hide_term_form()
+
+    def on_term_added(self, term: Term):
+        """Shows a term once it is saved."""
+        self.terms_model.append_item(term)
+        self.update_placeholder()
+
+    def on_term_not_added(self, word: str, definition: str, error: BaseException) -> None:
+        """Tells the user the term was not saved and shows it in the form again."""
+        self.logger.error(f"Adding term {word} failed: {error}")
+        QMessageBox.warning(self.MainWindow, "Saving failed", f"The term could not be saved: {error}")
+        self.show_term_form(None, "ADD", word, definition)
+
+    def delete_term(self, row: int):
+        """Deletes the term in the given row from the database and the list."""
+        term = self.terms_model.item(row)
+        self.logger.debug(f"Deleting term: {term.term}")
+
+        if term.id is not None:
+            get_async_store().submit(lambda store: store.terms.delete(term.id))
+        self.terms_model.remove_row(row)
+        self.update_placeholder()
+
+    def edit_term_screen(self, row: int):
+        """Loads the term in the given row in the input fields for editing."""
+        term = self.terms_model.item(row)
+        self.logger.debug(f"Editing term: {term.term}")
+
+        self.show_term_form(row, "SAVE", term.term, term.definition)
+
+    def update_term(self, row: int):
+        """Updates the term in the given row in the database and in the list."""
+        term = self.terms_model.item(row)
         word = self.word_input.text()
         definition = self.definition_input.text()
         if word and definition:
             term.term = word
             term.definition = definition
-            self.store.terms.update(term)
+            self.terms_model.update_row(row, term)
+            # Only the text, the answers and schedule of the loaded row may be stale by now
+            term_id = term.id
+            get_async_store().submit(lambda store: store.terms.update_text(term_id, word, definition))
 
-        self.word_label.close()
-        self.definition_label.close()
-        self.word_input.close()
-        self.definition_input.close()
-        self.save_button.close()
-
-        self.add_new_term_button.show()
-        self.scroll_menu.show()
-        self.load_terms()
+        self.hide_term_form()
 
     def go_to_quiz_screen(self):
         """Navigates to the quiz screen."""
         self.logger.debug("Going to the quiz screen")
 
-        self.QuizScreen = QuizScreen()
-        if self.category.id:
-            self.QuizScreen.start_quiz(self.MainWindow, self.store, self.category.id, self.user, self.welcome_screen)
+        if not self.category.id:
+            return
+        mode = self.quiz_mode.currentData()
+        if mode == MODE_MATCH:
+            from matching_screen import MatchingScreen
+
+            self.navigator.open(MatchingScreen, self.category.id, self.user)
+        else:
+            from quiz_screen import QuizScreen
+
+            self.navigator.open(QuizScreen, self.category.id, self.user, mode)
@@ -0,0 +1,50 @@
+"""Module for estimating how hard each term is from the answers given to it.
+
+Classes:
+    DifficultyModel: Exponentially weighted averages of the misses and answer times of a term.
+
+Examples:
+    model = DifficultyModel()
+    model.update(term, correct=True, latency_ms=4200)
+    term.difficulty  # 0 for quick correct answers, up to 1 for misses
+
+"""
+
+from models import Term
+
+SLOW_MS = 10_000
+
+
+class DifficultyModel:
+    """Exponentially weighted averages of the misses and answer times of a term.
+
+    Every answer costs between 0 and 1: a miss costs 1, a correct answer costs up to
+    `slow_weight` the longer it took, reaching it at `slow_ms`. The difficulty of the
+    term moves towards the cost of each answer by `alpha`, so recent answers weigh
+    most and a term which is learned becomes easy again after a few answers.
+    """
+
+    def __init__(self, alpha: float = 0.3, slow_ms: int = SLOW_MS, slow_weight: float = 0.5) -> None:
+        self.alpha = alpha
+        self.slow_ms = slow_ms
+        self.slow_weight = slow_weight
+
+    def cost(self, *, correct: bool, latency_ms: int | None) -> float:
+        """Return how much an answer says the term is hard, from 0 to 1."""
+        if not correct:
+            return 1.0
+        if latency_ms is None:
+            return 0.0
+        return self.slow_weight * min(latency_ms / self.slow_ms, 1.0)
+
+    def update(self, term: Term, *, correct: bool, latency_ms: int | None = None) -> None:
+        """Move the difficulty and the average answer time of the term towards an answer, counted already."""
+        cost = self.cost(correct=correct, latency_ms=latency_ms)
+        # The first answer has no average to move, it starts one
+        term.difficulty = cost if term.total_ans <= 1 else term.difficulty + self.alpha * (cost - term.difficulty)
+        if latency_ms is not None:
+            term.latency_ms = (
+                float(latency_ms)
+                if term.latency_ms is None
+                else term.latency_ms + self.alpha * (latency_ms - term.latency_ms)
+            )
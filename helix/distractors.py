@@ -0,0 +1,80 @@
+"""Module for picking plausible wrong answers for multiple-choice questions.
+
+Classes:
+    DistractorIndex: Index of a group's answers bucketed by length.
+
+Examples:
+    index = DistractorIndex(store.terms.get_words_by_group_id(group.id))
+    wrong_answers = index.pick(term.term, count=3)
+
+"""
+
+import random
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+
+
+class DistractorIndex:
+    """Index of a group's answers bucketed by length.
+
+    Answers of a similar length make plausible distractors, so the index keeps one
+    bucket per `bucket_width` characters. It is built once per group in O(n); a pick
+    samples random entries from the bucket of the correct answer and the nearest
+    non-empty ones, which takes O(count) probes however large the group is and however
+    far apart the lengths of its answers are.
+    """
+
+    def __init__(self, answers: Iterable[str], bucket_width: int = 3, rng: random.Random | None = None) -> None:
+        self.bucket_width = bucket_width
+        self._rng = rng or random.Random()  # noqa: S311
+        self._buckets: defaultdict[int, list[str]] = defaultdict(list)
+        for answer in answers:
+            self._buckets[self._bucket(answer)].append(answer)
+        # Only the buckets holding answers are visited, empty lengths in between are skipped
+        self._keys = sorted(self._buckets)
+
+    def _bucket(self, answer: str) -> int:
+        return len(answer) // self.bucket_width
+
+    def pick(self, correct: str, count: int) -> list[str]:
+        """Return up to `count` distinct answers different from `correct`, closest lengths first."""
+        excluded = {correct.strip().casefold()}
+        picked: list[str] = []
+        origin = self._bucket(correct)
+
+        for key in self._nearest_keys(origin):
+            for candidate in self._candidates(key, 4 * count):
+                if candidate.strip().casefold() not in excluded:
+                    excluded.add(candidate.strip().casefold())
+                    picked.append(candidate)
+                    if len(picked) == count:
+                        return picked
+        return picked
+
+    def _nearest_keys(self, origin: int) -> Iterator[int]:
+        """Yield the keys of the non-empty buckets, closest to `origin` first."""
+        keys = self._keys
+        above = bisect_left(keys, origin)
+        below = above - 1
+        while below >= 0 or above < len(keys):
+            if above < len(keys) and (below < 0 or keys[above] - origin <= origin - keys[below]):
+                yield keys[above]
+                above += 1
+            else:
+                yield keys[below]
+                below -= 1
+
+    def _candidates(self, key: int, probes: int) -> Iterator[str]:
+        """Yield at most `probes` random entries of a bucket."""
+        bucket = self._buckets.get(key, [])
+        if len(bucket) <= probes:
+            # Small buckets are walked whole, from a random offset
+            offset = self._rng.randrange(len(bucket)) if bucket else 0
+            yield from bucket[offset:]
+            yield from bucket[:offset]
+            return
+
+        # Random probes instead of a shuffle keep the cost independent of the bucket size
+        for _ in range(probes):
+            yield bucket[self._rng.randrange(len(bucket))]
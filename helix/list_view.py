@@ -0,0 +1,223 @@
+"""Module with the model and delegate behind the scrollable button lists.
+
+Classes:
+    LazyListModel: List model that loads rows in keyset pages while the view scrolls.
+    ButtonRowDelegate: Delegate painting each row as a button with a trashcan next to it.
+
+Examples:
+    model = LazyListModel(
+        lambda after_id, limit, deliver: deliver(store.terms.get_by_group_id(group.id, after_id=after_id, limit=limit)),
+        lambda term: term.term,
+    )
+    model.page_loaded.connect(update_placeholder)
+    model.load_failed.connect(show_error)
+    delegate = ButtonRowDelegate()
+    delegate.clicked.connect(open_row)
+    delegate.delete_clicked.connect(delete_row)
+
+    view = QListView()
+    view.setModel(model)
+    view.setItemDelegate(delegate)
+
+"""
+
+import logging
+from collections.abc import Callable, Sequence
+from functools import partial
+from typing import Any
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QPersistentModelIndex,
+    QRect,
+    QSize,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QColor, QFont, QMouseEvent, QPainter
+from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+from resources import get_font, get_icon
+
+logger = logging.getLogger(__name__)
+
+ItemRole = Qt.ItemDataRole.UserRole + 1
+
+type Index = QModelIndex | QPersistentModelIndex
+type FetchPage = Callable[[int, int, Callable[[Sequence[Any] | BaseException], None]], None]
+
+
+class LazyListModel(QAbstractListModel):
+    """List model that loads rows in keyset pages while the view scrolls.
+
+    `fetch_page(after_id, limit, deliver)` passes the next rows ordered by id to
+    `deliver`, right away or later from the GUI thread once a background query is
+    done, and `label` turns a row into the text shown in the list. Only pages the
+    view scrolled to are loaded, edits touch a single row. A failed query passes its
+    exception to `deliver` instead, `load_failed` is emitted and no page is fetched
+    until the next reload, so the view does not retry it in a loop.
+    """
+
+    page_loaded = Signal()
+    load_failed = Signal(object)
+
+    def __init__(
+        self,
+        fetch_page: FetchPage,
+        label: Callable[[Any], str],
+        page_size: int = 100,
+    ) -> None:
+        super().__init__()
+        self.fetch_page = fetch_page
+        self.label = label
+        self.page_size = page_size
+        self._items: list[Any] = []
+        self._exhausted = False
+        self._loading = False
+        self._failed = False
+        # Bumped by reload, so pages requested before it are dropped
+        self._generation = 0
+
+    @property
+    def exhausted(self) -> bool:
+        return self._exhausted
+
+    def rowCount(self, parent: Index = QModelIndex()) -> int:  # noqa: N802, B008
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: Index, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.label(item)
+        if role == ItemRole:
+            return item
+        return None
+
+    def canFetchMore(self, parent: Index = QModelIndex()) -> bool:  # noqa: N802, B008
+        return not parent.isValid() and not self._exhausted and not self._failed
+
+    def fetchMore(self, parent: Index = QModelIndex()) -> None:  # noqa: N802, B008
+        if parent.isValid() or self._exhausted or self._loading or self._failed:
+            return
+
+        self._loading = True
+        after_id = self._items[-1].id if self._items else 0
+        self.fetch_page(after_id, self.page_size, partial(self._add_page, self._generation))
+
+    def _add_page(self, generation: int, page: Sequence[Any] | BaseException) -> None:
+        if generation != self._generation:
+            return
+
+        self._loading = False
+        if isinstance(page, BaseException):
+            logger.warning("Loading a page failed", exc_info=page)
+            self._failed = True
+            self.load_failed.emit(page)
+            return
+        self._exhausted = len(page) < self.page_size
+        if page:
+            self.beginInsertRows(QModelIndex(), len(self._items), len(self._items) + len(page) - 1)
+            self._items.extend(page)
+            self.endInsertRows()
+        self.page_loaded.emit()
+
+    def reload(self, fetch_page: FetchPage | None = None) -> None:
+        """Drop the loaded rows and fetch the first page again."""
+        self.beginResetModel()
+        if fetch_page is not None:
+            self.fetch_page = fetch_page
+        self._items = []
+        self._exhausted = False
+        self._loading = False
+        self._failed = False
+        self._generation += 1
+        self.endResetModel()
+        self.fetchMore()
+
+    def item(self, row: int) -> Any:
+        return self._items[row]
+
+    def append_item(self, item: Any) -> None:
+        """Show a newly created row, which sorts last by id.
+
+        Until the last page is loaded the row will arrive with it instead.
+        """
+        if not self._exhausted:
+            return
+        self.beginInsertRows(QModelIndex(), len(self._items), len(self._items))
+        self._items.append(item)
+        self.endInsertRows()
+
+    def update_row(self, row: int, item: Any) -> None:
+        self._items[row] = item
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def remove_row(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._items[row]
+        self.endRemoveRows()
+
+
+class ButtonRowDelegate(QStyledItemDelegate):
+    """Delegate painting each row as a button with a trashcan next to it.
+
+    Only the rows on screen are painted, no widget is created per row.
+    """
+
+    clicked = Signal(int)
+    delete_clicked = Signal(int)
+
+    ROW_HEIGHT = 50
+    SPACING = 10
+    ICON_SIZE = 48
+
+    def __init__(self, font: QFont | None = None) -> None:
+        super().__init__()
+        self.font = font or get_font("Helvetica", 20)
+        self.icon = get_icon("trashcan.png")
+        self.background = QColor("#666666")
+        self.foreground = QColor("#CADBDD")
+
+    def _rects(self, rect: QRect) -> tuple[QRect, QRect]:
+        """Split a row into the button and the trashcan areas, 10:1 like the old layout."""
+        row = QRect(rect.left(), rect.top(), rect.width(), self.ROW_HEIGHT)
+        icon_left = row.right() - self.ICON_SIZE
+        button = QRect(row.left(), row.top(), icon_left - row.left() - self.SPACING, self.ROW_HEIGHT)
+        icon = QRect(icon_left, row.top() + (self.ROW_HEIGHT - self.ICON_SIZE) // 2, self.ICON_SIZE, self.ICON_SIZE)
+        return button, icon
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: Index) -> QSize:  # noqa: ARG002, N802
+        return QSize(0, self.ROW_HEIGHT + self.SPACING)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: Index) -> None:
+        button, icon = self._rects(option.rect)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.background)
+        painter.drawRoundedRect(button, 5, 5)
+        painter.setPen(self.foreground)
+        painter.setFont(self.font)
+        painter.drawText(button, Qt.AlignmentFlag.AlignCenter, index.data())
+        self.icon.paint(painter, icon)
+        painter.restore()
+
+    def editorEvent(self, event: QEvent, model: Any, option: QStyleOptionViewItem, index: Index) -> bool:  # noqa: N802
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and isinstance(event, QMouseEvent)
+            and event.button() == Qt.MouseButton.LeftButton
+        ):
+            button, icon = self._rects(option.rect)
+            position = event.position().toPoint()
+            if icon.contains(position):
+                self.delete_clicked.emit(index.row())
+            elif button.contains(position):
+                self.clicked.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
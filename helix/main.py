@@ -1,15 +1,25 @@
 import sys
 import logging
 
+from database import close_store
+from navigator import Navigator
 from start_screen import StartScreen
 from PySide6.QtWidgets import QApplication, QMainWindow
 
+
+def show_main_window() -> Navigator:
+    """Show the main window with the start screen, the application has to exist."""
+    MainWindow = QMainWindow()
+    navigator = Navigator(MainWindow)
+    navigator.open(StartScreen)
+    MainWindow.show()
+    return navigator
+
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(close_store)
     logging.basicConfig(level=logging.DEBUG, format="%(asctime)s: %(name)s - %(levelname)s - %(message)s")
 
-    MainWindow = QMainWindow()
-    ui = StartScreen()
-    ui.setup_ui(MainWindow)
-    MainWindow.show()
+    navigator = show_main_window()
     sys.exit(app.exec())
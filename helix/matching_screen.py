@@ -0,0 +1,165 @@
+import logging
+from functools import partial
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtWidgets import QMessageBox, QPushButton
+from resources import get_font
+from quiz import PAIRS, Quiz
+from quiz_screen import QuizScreen
+from database import get_async_store
+from store import Term, User
+
+ROUNDS = 3
+
+BUTTON_STYLE = "color: #cadbdd; background-color: #666666; border-radius: 5px"
+SELECTED_STYLE = "color: #cadbdd; background-color: #333333; border-radius: 5px"
+MATCHED_STYLE = "color: #666666; background-color: #a8c6a0; border-radius: 5px"
+
+
+class MatchingScreen(QuizScreen):
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def refresh(self, category_id: int, user: User):
+        """Start a matching quiz of the category with the first round."""
+        self.logger.debug("Starting the matching quiz")
+
+        self.category_id = category_id
+        self.user = user
+
+        self.rounds_left = ROUNDS
+        self.answered = 0
+        self.hide_quiz_widgets()
+        self.hide_final_message()
+        self.message_label.clear()
+        if self.user.id is not None:
+            get_async_store().submit(partial(self.load_quiz, self.user.id, category_id), self.on_quiz_loaded)
+
+    def load_quiz(self, user_id: int, category_id: int, store):
+        """Prepare the quiz and its first round on the database thread."""
+        quiz = Quiz(store, user_id)
+        return quiz, quiz.get_matching_round(category_id)
+
+    def on_quiz_loaded(self, loaded):
+        """Show the first round once it is loaded."""
+        self.quiz, self.round = loaded
+        if not self.round:
+            self.show_final_message(0, 0)
+            return
+
+        self.message_label.show()
+        self.show_round(self.round)
+
+    def setup_answer_sections(self):
+        """Set up the pairs instead of the definition display and the answers."""
+        self.setup_pairs_section()
+
+    def setup_header(self):
+        super().setup_header()
+        self.header_label.setText(QCoreApplication.translate("MainWindow", "MATCH", None))
+
+    def setup_pairs_section(self):
+        """Set up a column of term buttons and a column of definition buttons."""
+        self.term_buttons = []
+        self.definition_buttons = []
+        for row in range(PAIRS):
+            term_button = QPushButton(self.centralwidget)
+            term_button.setGeometry(120, 160 + row * 65, 240, 55)
+            term_button.setFont(get_font("Helvetica", 18))
+            term_button.clicked.connect(partial(self.on_term_clicked, row))
+            self.term_buttons.append(term_button)
+
+            definition_button = QPushButton(self.centralwidget)
+            definition_button.setGeometry(380, 160 + row * 65, 341, 55)
+            definition_button.setFont(get_font("Helvetica", 14))
+            definition_button.clicked.connect(partial(self.on_definition_clicked, row))
+            self.definition_buttons.append(definition_button)
+
+    def show_round(self, terms: list[Term]):
+        """Show the terms of a round next to their definitions in random order."""
+        self.round = terms
+        self.definitions = self.quiz.rng.sample(terms, len(terms))
+        self.selected = None
+        self.missed = set()
+        self.matched = 0
+
+        for row, (term_button, definition_button) in enumerate(zip(self.term_buttons, self.definition_buttons)):
+            visible = row < len(terms)
+            term_button.setVisible(visible)
+            definition_button.setVisible(visible)
+            if visible:
+                term_button.setText(terms[row].term)
+                definition_button.setText(self.definitions[row].definition)
+            for button in (term_button, definition_button):
+                button.setEnabled(True)
+                button.setStyleSheet(BUTTON_STYLE)
+
+    def on_term_clicked(self, row: int):
+        """Select the term to be matched."""
+        if self.selected is not None:
+            self.term_buttons[self.selected].setStyleSheet(BUTTON_STYLE)
+        self.selected = row
+        self.term_buttons[row].setStyleSheet(SELECTED_STYLE)
+
+    def on_definition_clicked(self, row: int):
+        """Match the selected term with a definition."""
+        if self.selected is None:
+            return
+
+        term = self.round[self.selected]
+        # Terms sharing a definition match either of its buttons, the text is what the user sees
+        if self.definitions[row].definition != term.definition:
+            # Only the first try of a term counts towards its mastery
+            self.missed.add(term.id)
+            self.message_label.setStyleSheet("color: red;")
+            self.message_label.setText(f"Incorrect. {term.term} does not mean that")
+            return
+
+        self.message_label.setStyleSheet("color: green;")
+        self.message_label.setText("Correct!")
+        for button in (self.term_buttons[self.selected], self.definition_buttons[row]):
+            button.setEnabled(False)
+            button.setStyleSheet(MATCHED_STYLE)
+        self.selected = None
+        self.matched += 1
+        if self.matched == len(self.round):
+            self.finish_round()
+
+    def finish_round(self):
+        """Save the outcomes of the round at once and move to the next round or the final message."""
+        self.logger.debug("Round finished")
+
+        answers = [(term, term.id not in self.missed) for term in self.round]
+        self.answered += len(answers)
+        self.rounds_left -= 1
+        rounds_left = self.rounds_left
+        get_async_store().submit(
+            lambda store: self.save_round(answers, rounds_left), self.on_round_saved, self.on_round_not_saved
+        )
+
+    def save_round(self, answers, rounds_left: int):
+        """Save the round and load the next one on the database thread, or end the session after the last."""
+        self.quiz.update_mastery_many(answers)
+        terms = self.quiz.get_matching_round(self.category_id) if rounds_left else []
+        if not terms:
+            self.quiz.update_user_points()
+        return terms
+
+    def on_round_not_saved(self, error: BaseException) -> None:
+        """Tell the user the round was not saved and end the session instead of leaving it disabled."""
+        self.logger.error(f"Saving the round failed: {error}")
+        QMessageBox.warning(self.MainWindow, "Saving failed", f"Your answers could not be saved: {error}")
+        self.show_final_message(self.quiz.points, self.answered)
+
+    def on_round_saved(self, terms: list[Term]):
+        """Show the next round or the final message."""
+        if terms:
+            self.show_round(terms)
+        else:
+            self.logger.debug("Quiz finished")
+            self.show_final_message(self.quiz.points, self.answered)
+
+    def hide_quiz_widgets(self):
+        """Hide the widgets used while matching."""
+        for widget in [*self.term_buttons, *self.definition_buttons, self.message_label]:
+            widget.hide()
@@ -0,0 +1,203 @@
+"""Module for versioning the database schema.
+
+The schema version is kept in `PRAGMA user_version`. Every entry of `MIGRATIONS`
+moves the schema one version up, so a database is upgraded in place by running
+only the steps it has not seen yet. New schema changes are appended as a new step,
+existing steps are never edited.
+
+Examples:
+    connection = sqlite3.connect("database.db")
+    version = migrate(connection)
+
+"""
+
+import sqlite3
+
+from models import content_hash
+
+MIGRATIONS: list[tuple[str, ...]] = [
+    # 1: initial schema, kept idempotent for databases created before versioning
+    (
+        """CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username VARCHAR(64) UNIQUE
+        )""",
+        """CREATE TABLE IF NOT EXISTS term_groups (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER,
+            name VARCHAR(64),
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )""",
+        """CREATE TABLE IF NOT EXISTS terms (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            group_id INTEGER,
+            term TEXT,
+            definition TEXT,
+            mastery_coef INTEGER,
+            total_ans INTEGER,
+            correct_ans INTEGER,
+            FOREIGN KEY (group_id) REFERENCES term_groups(id)
+        )""",
+        """CREATE TABLE IF NOT EXISTS points (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER,
+            points INTEGER,
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )""",
+    ),
+    # 2: indexes for the lookups done by screens
+    (
+        "CREATE INDEX IF NOT EXISTS terms_group_id ON terms (group_id)",
+        "CREATE INDEX IF NOT EXISTS term_groups_user_id ON term_groups (user_id)",
+        "CREATE INDEX IF NOT EXISTS points_user_id ON points (user_id)",
+    ),
+    # 3: spaced repetition schedule, new and existing terms are due at once
+    (
+        "ALTER TABLE terms ADD COLUMN due_at INTEGER NOT NULL DEFAULT 0",
+        "ALTER TABLE terms ADD COLUMN interval_days REAL NOT NULL DEFAULT 0",
+        "ALTER TABLE terms ADD COLUMN ease REAL NOT NULL DEFAULT 2.5",
+        "ALTER TABLE terms ADD COLUMN repetitions INTEGER NOT NULL DEFAULT 0",
+        "CREATE INDEX terms_group_id_due_at ON terms (group_id, due_at)",
+    ),
+    # 4: full-text index of terms and definitions, kept in sync by triggers
+    (
+        """CREATE VIRTUAL TABLE terms_fts USING fts5(
+            term,
+            definition,
+            content = 'terms',
+            content_rowid = 'id',
+            tokenize = 'unicode61 remove_diacritics 2'
+        )""",
+        """CREATE TRIGGER terms_fts_insert AFTER INSERT ON terms BEGIN
+            INSERT INTO terms_fts (rowid, term, definition) VALUES (new.id, new.term, new.definition);
+        END""",
+        """CREATE TRIGGER terms_fts_delete AFTER DELETE ON terms BEGIN
+            INSERT INTO terms_fts (terms_fts, rowid, term, definition)
+            VALUES ('delete', old.id, old.term, old.definition);
+        END""",
+        # Answers rewrite the whole row, only a changed text has to be indexed again
+        """CREATE TRIGGER terms_fts_update AFTER UPDATE OF term, definition ON terms
+        WHEN old.term IS NOT new.term OR old.definition IS NOT new.definition BEGIN
+            INSERT INTO terms_fts (terms_fts, rowid, term, definition)
+            VALUES ('delete', old.id, old.term, old.definition);
+            INSERT INTO terms_fts (rowid, term, definition) VALUES (new.id, new.term, new.definition);
+        END""",
+        "INSERT INTO terms_fts (terms_fts) VALUES ('rebuild')",
+    ),
+    # 5: hash of the text of each term, to find duplicates when importing
+    (
+        "ALTER TABLE terms ADD COLUMN content_hash TEXT",
+        "UPDATE terms SET content_hash = content_hash(term, definition)",
+        "CREATE INDEX terms_group_id_content_hash ON terms (group_id, content_hash)",
+    ),
+    # 6: running totals per user and per day, replacing the sums over points rows
+    (
+        """CREATE TABLE user_stats (
+            user_id INTEGER PRIMARY KEY REFERENCES users(id),
+            points INTEGER NOT NULL DEFAULT 0,
+            answers INTEGER NOT NULL DEFAULT 0,
+            correct INTEGER NOT NULL DEFAULT 0,
+            streak INTEGER NOT NULL DEFAULT 0,
+            best_streak INTEGER NOT NULL DEFAULT 0,
+            last_day INTEGER NOT NULL DEFAULT 0
+        )""",
+        "CREATE INDEX user_stats_points ON user_stats (points DESC, user_id)",
+        """CREATE TABLE daily_stats (
+            user_id INTEGER NOT NULL REFERENCES users(id),
+            day INTEGER NOT NULL,
+            points INTEGER NOT NULL DEFAULT 0,
+            answers INTEGER NOT NULL DEFAULT 0,
+            correct INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, day)
+        ) WITHOUT ROWID""",
+        """INSERT INTO user_stats (user_id, points)
+        SELECT user_id, SUM(points) FROM points WHERE user_id IS NOT NULL GROUP BY user_id""",
+    ),
+    # 7: append-only log of answers, rolled up into the terms and per group and hour totals by a trigger
+    (
+        """CREATE TABLE answers (
+            id INTEGER PRIMARY KEY,
+            term_id INTEGER NOT NULL REFERENCES terms(id),
+            user_id INTEGER NOT NULL REFERENCES users(id),
+            answered_at INTEGER NOT NULL,
+            correct INTEGER NOT NULL,
+            latency_ms INTEGER
+        )""",
+        "CREATE INDEX answers_term_id ON answers (term_id, answered_at)",
+        "CREATE INDEX answers_user_id ON answers (user_id, answered_at)",
+        """CREATE TABLE group_stats (
+            user_id INTEGER NOT NULL REFERENCES users(id),
+            group_id INTEGER NOT NULL REFERENCES term_groups(id),
+            answers INTEGER NOT NULL DEFAULT 0,
+            correct INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, group_id)
+        ) WITHOUT ROWID""",
+        """CREATE TABLE hour_stats (
+            user_id INTEGER NOT NULL REFERENCES users(id),
+            hour INTEGER NOT NULL,
+            answers INTEGER NOT NULL DEFAULT 0,
+            correct INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, hour)
+        ) WITHOUT ROWID""",
+        # Each answer touches one row of each rollup, so none of them is ever computed from the whole log
+        """CREATE TRIGGER answers_rollup AFTER INSERT ON answers BEGIN
+            UPDATE terms SET
+                total_ans = IFNULL(total_ans, 0) + 1,
+                correct_ans = IFNULL(correct_ans, 0) + new.correct,
+                mastery_coef = CAST(IFNULL(correct_ans, 0) + new.correct AS REAL) / (IFNULL(total_ans, 0) + 1)
+            WHERE id = new.term_id;
+            INSERT INTO group_stats (user_id, group_id, answers, correct)
+            SELECT new.user_id, group_id, 1, new.correct FROM terms WHERE id = new.term_id AND group_id IS NOT NULL
+            ON CONFLICT (user_id, group_id) DO UPDATE SET
+                answers = answers + 1, correct = correct + excluded.correct;
+            INSERT INTO hour_stats (user_id, hour, answers, correct)
+            VALUES (
+                new.user_id,
+                CAST(strftime('%H', new.answered_at, 'unixepoch', 'localtime') AS INTEGER),
+                1,
+                new.correct
+            )
+            ON CONFLICT (user_id, hour) DO UPDATE SET
+                answers = answers + 1, correct = correct + excluded.correct;
+        END""",
+        # Answers given before the log existed only survive as the totals of their terms
+        """INSERT INTO group_stats (user_id, group_id, answers, correct)
+        SELECT term_groups.user_id, terms.group_id, SUM(terms.total_ans), SUM(terms.correct_ans)
+        FROM terms JOIN term_groups ON term_groups.id = terms.group_id
+        WHERE term_groups.user_id IS NOT NULL
+        GROUP BY term_groups.user_id, terms.group_id HAVING SUM(terms.total_ans) > 0""",
+    ),
+    # 8: difficulty of each term, answered terms start from their share of misses
+    (
+        "ALTER TABLE terms ADD COLUMN difficulty REAL NOT NULL DEFAULT 0",
+        "ALTER TABLE terms ADD COLUMN latency_ms REAL",
+        "UPDATE terms SET difficulty = 1 - IFNULL(mastery_coef, 0) WHERE total_ans > 0",
+    ),
+]
+
+
+def schema_version(db: sqlite3.Connection) -> int:
+    return db.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(db: sqlite3.Connection) -> int:
+    """Apply every pending migration in one transaction and return the new schema version."""
+    version = schema_version(db)
+    if version >= len(MIGRATIONS):
+        return version
+
+    # Available to the statements of the migrations
+    db.create_function("content_hash", 2, content_hash, deterministic=True)
+
+    db.execute("BEGIN")
+    try:
+        for statements in MIGRATIONS[version:]:
+            for statement in statements:
+                db.execute(statement)
+        db.execute(f"PRAGMA user_version = {len(MIGRATIONS)}")
+    except BaseException:
+        db.rollback()
+        raise
+    db.commit()
+
+    return len(MIGRATIONS)
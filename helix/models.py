@@ -1,6 +1,13 @@
+import hashlib
 from dataclasses import dataclass
 
 
+def content_hash(term: str, definition: str) -> str:
+    """Return the hash identifying a term by its text, ignoring case and surrounding whitespace."""
+    text = f"{term.strip().casefold()}\x1f{definition.strip().casefold()}"
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
 @dataclass
 class User:
     username: str
@@ -22,6 +29,12 @@ class Term:
     mastery_coef: float = 0.0
     total_ans: int = 0
     correct_ans: int = 0
+    due_at: int = 0
+    interval_days: float = 0.0
+    ease: float = 2.5
+    repetitions: int = 0
+    difficulty: float = 0.0  # Weighted average of recent misses and slow answers, from 0 to 1
+    latency_ms: float | None = None  # Weighted average of recent answer times
     id: int | None = None
 
     def __str__(self) -> str:
@@ -31,6 +44,56 @@ class Term:
         yield self
 
 
+@dataclass
+class UserStats:
+    user_id: int
+    points: int = 0
+    answers: int = 0
+    correct: int = 0
+    streak: int = 0  # Consecutive days with answers, up to `last_day`
+    best_streak: int = 0
+    last_day: int = 0  # Proleptic Gregorian ordinal of the last day with answers
+
+    def current_streak(self, today: int) -> int:
+        """Return the streak still running on `today`, which it is until a whole day is missed."""
+        return self.streak if self.last_day >= today - 1 else 0
+
+
+@dataclass
+class DailyStats:
+    user_id: int
+    day: int
+    points: int = 0
+    answers: int = 0
+    correct: int = 0
+
+
+@dataclass
+class Answer:
+    term_id: int
+    user_id: int
+    answered_at: int  # Unix time
+    correct: bool
+    latency_ms: int | None = None  # Time from showing the question to the answer
+    id: int | None = None
+
+
+@dataclass
+class GroupStats:
+    user_id: int
+    group_id: int
+    answers: int = 0
+    correct: int = 0
+
+
+@dataclass
+class HourStats:
+    user_id: int
+    hour: int  # Local hour of the day, 0 to 23
+    answers: int = 0
+    correct: int = 0
+
+
 @dataclass
 class Point:
     points: int
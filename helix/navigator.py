@@ -0,0 +1,84 @@
+"""Module for switching between the screens of the main window.
+
+Every screen builds its widgets once, into a page of a `QStackedWidget`, and is
+refreshed with new data each time it is opened again, so going back and forth
+between screens only flips the visible page. The least recently used screens are
+dropped, with their widgets, once more than `capacity` of them were built.
+
+Screens import the screens they lead to when navigating to them, so starting the
+application only loads the modules of the first screen.
+
+Classes:
+    Screen: Interface of the screens shown by the navigator.
+    Navigator: Keeps the built screens of a window and shows one at a time.
+
+Examples:
+    navigator = Navigator(window)
+    navigator.open(StartScreen)
+
+    # From a screen, building it only the first time
+    self.navigator.open(DictionaryScreen, category, user)
+
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Protocol
+
+from PySide6.QtWidgets import QMainWindow, QStackedWidget, QWidget
+from settings import SCREEN_SIZE
+
+SCREEN_CACHE_SIZE = 5
+
+logger = logging.getLogger(__name__)
+
+
+class Screen(Protocol):
+    centralwidget: QWidget
+
+    def __init__(self) -> None: ...
+
+    def setup_ui(self, navigator: "Navigator") -> None:
+        """Build the widgets of the screen into `centralwidget`, once."""
+
+    def refresh(self, *args: Any) -> None:
+        """Show new data in the built widgets, every time the screen is opened."""
+
+
+class Navigator:
+    """Keeps the built screens of a window and shows one at a time."""
+
+    def __init__(self, window: QMainWindow, capacity: int = SCREEN_CACHE_SIZE) -> None:
+        self.MainWindow = window  # The name screens use for their window
+        self.capacity = capacity
+        self.stack = QStackedWidget(window)
+        self._screens: OrderedDict[type, Screen] = OrderedDict()
+
+        window.setFixedSize(*SCREEN_SIZE)
+        window.setCentralWidget(self.stack)
+
+    def __contains__(self, screen_type: type) -> bool:
+        return screen_type in self._screens
+
+    def open[S: Screen](self, screen_type: type[S], *args: Any) -> S:
+        """Show the screen of the given type refreshed with `args`, building it if it is not kept."""
+        screen = self._screens.pop(screen_type, None)
+        if screen is None:
+            logger.debug("Building the %s", screen_type.__name__)
+            screen = screen_type()
+            screen.setup_ui(self)
+            self.stack.addWidget(screen.centralwidget)
+        self._screens[screen_type] = screen
+
+        self.stack.setCurrentWidget(screen.centralwidget)
+        screen.refresh(*args)
+        self._evict()
+        return screen  # type: ignore[return-value]
+
+    def _evict(self) -> None:
+        # The screen just opened is the most recently used, it is never dropped
+        while len(self._screens) > max(self.capacity, 1):
+            screen_type, screen = self._screens.popitem(last=False)
+            logger.debug("Dropping the %s", screen_type.__name__)
+            self.stack.removeWidget(screen.centralwidget)
+            screen.centralwidget.deleteLater()
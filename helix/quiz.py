@@ -1,41 +1,173 @@
-from models import Point, Term
+import random
+import sys
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from answers import FuzzyMatcher, Matcher
+from difficulty import DifficultyModel
+from distractors import DistractorIndex
+from models import Answer, Term
+from sampling import WeakTermsQueue
+from scheduler import QUALITY_CORRECT, QUALITY_INCORRECT, ReviewQueue, Scheduler
 from store import Store
 
+REVIEW_LIMIT = 50
+CHOICES = 4
+PAIRS = 4
+PREFETCH = 3
+ANSWER_BATCH = 10
+
+# Quiz modes and their names shown to the user
+MODE_WRITE = "write"
+MODE_CHOICE = "choice"
+MODE_MATCH = "match"
+MODE_WEAK = "weak"
+MODES = {MODE_WRITE: "Write", MODE_CHOICE: "Choose", MODE_MATCH: "Match", MODE_WEAK: "Weak terms"}
+
+
+@dataclass
+class Question:
+    term: Term
+    choices: list[str] = field(default_factory=list)
+
 
 class Quiz:
-    def __init__(self, store: Store, user_id: int) -> None:
+    def __init__(
+        self,
+        store: Store,
+        user_id: int,
+        scheduler: Scheduler | None = None,
+        *,
+        rng: random.Random | None = None,
+        matcher: Matcher | None = None,
+        difficulty: DifficultyModel | None = None,
+        mode: str = MODE_WRITE,
+    ) -> None:
         self.store = store
         self.user_id = user_id
+        self.scheduler = scheduler or Scheduler()
+        self.matcher = matcher or FuzzyMatcher()
+        self.difficulty = difficulty or DifficultyModel()
+        self.mode = mode
+        self.rng = rng or random.Random()  # noqa: S311
+        self.distractors: DistractorIndex | None = None
+        # Terms of the group not matched yet this session, in a random order
+        self._unmatched: list[int] | None = None
+        self._prepared: dict[int | None, Question] = {}
         self.points = 0  # Track total points for this session
+        self.answers = 0
 
     def get_terms(self) -> list[Term]:
         """Retrieve all terms for the quiz."""
         return self.store.terms.list()
 
+    def get_review_terms(self, group_id: int, now: int | None = None, limit: int = REVIEW_LIMIT) -> list[Term]:
+        """Retrieve the terms of the group due for review, or the next to become due if none is."""
+        now = int(time.time()) if now is None else now
+        terms = self.store.terms.get_due(group_id, now, limit)
+        return terms or self.store.terms.get_due(group_id, sys.maxsize, limit)
+
+    def get_quiz_terms(self, group_id: int) -> list[Term]:
+        """Retrieve the terms to ask, the whole group when weak terms are drawn from it and the due ones otherwise."""
+        if self.mode == MODE_WEAK:
+            return self.store.terms.get_by_group_id(group_id)
+        return self.get_review_terms(group_id)
+
+    def review_queue(self, terms: Iterable[Term]) -> ReviewQueue | WeakTermsQueue:
+        """Return the queue asking the terms in the order of the mode, weak terms first or by due time."""
+        if self.mode == MODE_WEAK:
+            return WeakTermsQueue(terms, length=REVIEW_LIMIT, rng=self.rng)
+        return ReviewQueue(terms)
+
+    def prepare_choices(self, group_id: int) -> None:
+        """Index the answers of the group once, so every multiple-choice question is built in constant time."""
+        self.distractors = DistractorIndex(self.store.terms.get_words_by_group_id(group_id), rng=self.rng)
+
+    def get_choices(self, term: Term, count: int = CHOICES) -> list[str]:
+        """Return the term with up to `count - 1` wrong answers from its group, shuffled."""
+        if self.distractors is None and term.group_id is not None:
+            self.prepare_choices(term.group_id)
+
+        choices = [term.term, *(self.distractors.pick(term.term, count - 1) if self.distractors else [])]
+        self.rng.shuffle(choices)
+        return choices
+
+    def get_matching_round(self, group_id: int, size: int = PAIRS) -> list[Term]:
+        """Retrieve the terms of the next round of matching, none of them matched before in the session.
+
+        The ids of the group are shuffled once per session and every round takes the next
+        ones, so a round reads only its own terms instead of ordering the group at random.
+        """
+        if self._unmatched is None:
+            self._unmatched = self.store.terms.get_ids_by_group_id(group_id)
+            self.rng.shuffle(self._unmatched)
+        term_ids, self._unmatched = self._unmatched[:size], self._unmatched[size:]
+        return self.store.terms.get_many(term_ids) if term_ids else []
+
+    def prepare_question(self, term: Term) -> Question:
+        """Build the question asking for the term in the mode of the quiz."""
+        return Question(term, self.get_choices(term) if self.mode == MODE_CHOICE else [])
+
+    def prefetch(self, terms: Iterable[Term]) -> None:
+        """Prepare the questions of the next terms ahead, so showing them costs nothing."""
+        for term in terms:
+            if term.id not in self._prepared:
+                self._prepared[term.id] = self.prepare_question(term)
+
+    def question(self, term: Term) -> Question:
+        """Return the question for the term, prepared by `prefetch` if it was."""
+        question = self._prepared.pop(term.id, None)
+        if question is None or question.term is not term:
+            question = self.prepare_question(term)
+        return question
+
     def check_answer(self, user_answer: str, correct_answer: str) -> bool:
-        """Check if the user's answer matches the correct answer."""
-        return user_answer.strip().lower() == correct_answer.strip().lower()
+        """Check if the user's answer matches the correct answer, tolerating typos."""
+        return self.matcher.matches(user_answer, correct_answer)
+
+    def check_choice(self, choice: str, correct_answer: str) -> bool:
+        """Check a picked choice, which has to be the correct answer exactly as close misses are offered too."""
+        return choice == correct_answer
+
+    def update_mastery(self, term: Term, *, correct: bool, now: int | None = None) -> None:
+        """Update mastery coefficient, answer counts and review schedule for the term."""
+        answer = self.score_answer(term, correct=correct, now=now)
+        self.save_answers([(term, answer)])
 
-    def update_mastery(self, term: Term, *, correct: bool) -> None:
-        """Update mastery coefficient and answer counts for the term."""
+    def update_mastery_many(self, answers: Iterable[tuple[Term, bool]], now: int | None = None) -> None:
+        """Score every answer of a round and save them with one batched write."""
+        now = int(time.time()) if now is None else now
+        self.save_answers([(term, self.score_answer(term, correct=correct, now=now)) for term, correct in answers])
+
+    def score_answer(
+        self, term: Term, *, correct: bool, now: int | None = None, latency_ms: int | None = None
+    ) -> Answer:
+        """Apply an answer to the term's statistics and schedule without saving it, and return its log entry."""
+        now = int(time.time()) if now is None else now
         term.total_ans += 1
+        self.answers += 1
         if correct:
             term.correct_ans += 1
             self.points += 1  # Increment points for correct answers
 
-        # Calculate new mastery coefficient
+        # Calculate new mastery coefficient, the database derives the same one from the log
         term.mastery_coef = term.correct_ans / term.total_ans
-        self.store.terms.update(term)  # Save changes to the database
+        self.difficulty.update(term, correct=correct, latency_ms=latency_ms)
+        self.scheduler.review(term, QUALITY_CORRECT if correct else QUALITY_INCORRECT, now)
+        return Answer(term.id, self.user_id, now, correct, latency_ms)
+
+    def save_answers(self, scored: Sequence[tuple[Term, Answer]]) -> None:
+        """Append the answers to the log and write the new schedules of their terms, in one transaction."""
+        with self.store.transaction():
+            self.store.answers.record_many([answer for _, answer in scored])
+            self.store.terms.update_schedule_many([term for term, _ in scored])
 
     def update_user_points(self) -> None:
-        """Update the user's total points in the database."""
-        user_points = self.store.points.get(self.user_id)
-        if user_points:
-            user_points.points += self.points
-            self.store.points.update(user_points)
-        else:
-            # Create initial points record if it doesn't exist
-            self.store.points.create(Point(points=self.points, user_id=self.user_id))
+        """Add the points and answers of this session to the user's statistics, once per session."""
+        if self.answers:
+            # Every correct answer is a point, so points and correct answers are the same count
+            self.store.user_stats.record(self.user_id, points=self.points, answers=self.answers, correct=self.points)
 
     def start_quiz(self) -> None:
         """Run the quiz session."""
@@ -1,55 +1,37 @@
 import logging
+import time
+from dataclasses import replace
+from functools import partial
 
-from PySide6.QtCore import *  # type: ignore
-from PySide6.QtGui import *  # type: ignore
-from PySide6.QtWidgets import *  # type: ignore
-from quiz import Quiz
-from store import Store, Term, User
+from PySide6.QtCore import QCoreApplication, QMetaObject, QTimer, Qt
+from PySide6.QtWidgets import QLabel, QLineEdit, QMessageBox, QPushButton, QScrollArea, QWidget
+from resources import get_font, get_pixmap
+from quiz import CHOICES, MODE_CHOICE, MODE_WRITE, PREFETCH, Quiz
+from database import get_async_store
+from store import Answer, Term, User
 
 
 class QuizScreen:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-    def start_quiz(self, MainWindow, store: Store, category_id: int, user: User, welcome_screen):
-        """Initialize the quiz screen and start the quiz."""
-        self.logger.debug("Starting the quiz")
-
-        self.store = store
-        self.user = user
-        self.welcome_screen = welcome_screen
-        self.MainWindow = MainWindow
-
-        if self.user.id is not None:
-            self.quiz = Quiz(self.store, self.user.id)
-
-        self.terms = self.store.terms.get_by_group_id(category_id)
-        self.current_term_index = 0
-        if self.terms:
-            self.setup_ui(self.terms[self.current_term_index])
-
-    def setup_ui(self, term: Term):
-        """Set up the quiz user interface."""
+    def setup_ui(self, navigator):
+        """Set up the quiz user interface, its parts are shown once a quiz is loaded."""
         self.logger.debug("Setting up the quiz screen UI")
 
-        # Configure the main window
-        self.MainWindow.setEnabled(True)
-        self.MainWindow.setSizePolicy(QSizePolicy())
-        self.MainWindow.setMinimumSize(800, 600)
-        self.MainWindow.setMaximumSize(600, 400)
-        self.MainWindow.setFont(QFont("", 30))
-        self.MainWindow.setIconSize(QSize(48, 48))
+        self.navigator = navigator
+        self.MainWindow = navigator.MainWindow
 
         # Set up the central widget and styles
-        self.centralwidget = QWidget(self.MainWindow)
+        self.centralwidget = QWidget()
         self.centralwidget.setStyleSheet("background-color: #CADBDD")
+        self.centralwidget.setFont(get_font("", 30))
 
         # Header and logo
         self.setup_header()
 
-        # Term input and definition display
-        self.setup_definition_display()
-        self.setup_input_section()
+        # Term input, choices and definition display
+        self.setup_answer_sections()
 
         # Message label for feedback
         self.message_label = self.create_label(
@@ -57,24 +39,68 @@ class QuizScreen:
         )
         self.message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        self.MainWindow.setCentralWidget(self.centralwidget)
-        self.retranslate_ui(term)
-
-        # Connect events
-        self.submit_button.clicked.connect(lambda: self.on_submit())
+        self.setup_final_message()
         QMetaObject.connectSlotsByName(self.MainWindow)
 
+    def refresh(self, category_id: int, user: User, mode: str = MODE_WRITE):
+        """Start a quiz of the category, nothing of the previous one is shown until it is loaded."""
+        self.logger.debug(f"Starting the quiz in {mode} mode")
+
+        self.category_id = category_id
+        self.mode = mode
+        self.user = user
+
+        self.hide_quiz_widgets()
+        self.hide_final_message()
+        self.message_label.clear()
+        if self.user.id is not None:
+            get_async_store().submit(partial(self.load_quiz, self.user.id, category_id), self.on_quiz_loaded)
+
+    def load_quiz(self, user_id: int, category_id: int, store):
+        """Prepare the quiz and its first questions on the database thread and return it with the queue of terms."""
+        quiz = Quiz(store, user_id, mode=self.mode)
+        queue = quiz.review_queue(quiz.get_quiz_terms(category_id))
+        if queue:
+            if self.mode == MODE_CHOICE:
+                quiz.prepare_choices(category_id)
+            quiz.prefetch(queue.upcoming(PREFETCH + 1))
+        return quiz, queue
+
+    def on_quiz_loaded(self, loaded):
+        """Show the first question once the quiz is loaded."""
+        # Terms are asked in order of their due time or weak ones first, missed ones come back once
+        self.quiz, self.queue = loaded
+        self.relearned = set()
+        self.answered = 0
+        self.unsaved = []
+        if not self.queue:
+            self.show_final_message(0, 0)
+            return
+
+        self.term = self.queue.pop()
+        self.show_quiz_widgets()
+        self.retranslate_ui(self.term)
+        if self.mode != MODE_CHOICE:
+            self.term_input.clear()
+        self.shown_at = time.monotonic()
+
+    def setup_answer_sections(self):
+        """Set up the definition display with both the term input and the choices, the mode picks which are shown."""
+        self.setup_definition_display()
+        self.setup_input_section()
+        self.setup_choices_section()
+
     def setup_header(self):
         """Set up the header section."""
         self.header = QLabel(self.centralwidget)
         self.header.setGeometry(1, -3, 813, 136)
-        self.header.setFont(QFont("Helvetica", 25))
-        self.header.setPixmap(QPixmap("./assets/header.png"))
+        self.header.setFont(get_font("Helvetica", 25))
+        self.header.setPixmap(get_pixmap("header.png"))
 
         self.logo = QLabel(self.centralwidget)
         self.logo.setGeometry(15, 15, 91, 91)
         self.logo.setStyleSheet("background-color: transparent;")
-        self.logo.setPixmap(QPixmap("./assets/helix-log-small.png"))
+        self.logo.setPixmap(get_pixmap("helix-log-small.png"))
         self.logo.setScaledContents(True)
 
         self.header_label = self.create_label(
@@ -104,13 +130,43 @@ class QuizScreen:
         """Set up the term input and submit button."""
         self.term_input = QLineEdit(self.centralwidget)
         self.term_input.setGeometry(120, 210, 601, 61)
-        self.term_input.setFont(QFont("Helvetica", 25, italic=True))
+        self.term_input.setFont(get_font("Helvetica", 25, italic=True))
         self.term_input.setStyleSheet("color: #666666;")
 
         self.submit_button = QPushButton(self.centralwidget)
         self.submit_button.setGeometry(120, 375, 601, 46)
-        self.submit_button.setFont(QFont("Helvetica", 20))
+        self.submit_button.setFont(get_font("Helvetica", 20))
         self.submit_button.setStyleSheet("color: #cadbdd; background-color: #666666; border-radius: 5px")
+        self.submit_button.clicked.connect(lambda: self.on_submit())
+
+    def setup_choices_section(self):
+        """Set up a two by two grid of buttons with the possible answers."""
+        self.choice_buttons = []
+        for position in range(CHOICES):
+            button = QPushButton(self.centralwidget)
+            button.setGeometry(120 + (position % 2) * 306, 150 + (position // 2) * 70, 295, 55)
+            button.setFont(get_font("Helvetica", 20))
+            button.setStyleSheet("color: #cadbdd; background-color: #666666; border-radius: 5px")
+            button.clicked.connect(partial(self.on_choice, button))
+            self.choice_buttons.append(button)
+
+    def setup_final_message(self):
+        """Set up the final score and the navigation back to the main page, hidden until the quiz ends."""
+        self.final_label = self.create_label(
+            100, 200, 600, 50, "Helvetica", 18, "color: #666666", alignment=Qt.AlignmentFlag.AlignCenter
+        )
+        self.score_label = self.create_label(
+            100, 270, 600, 50, "Helvetica", 18, "color: #666666", bold=True, alignment=Qt.AlignmentFlag.AlignCenter
+        )
+
+        self.to_main_page_button = QPushButton(self.centralwidget)
+        self.to_main_page_button.setGeometry(300, 350, 200, 50)
+        self.to_main_page_button.setFont(get_font("Helvetica", 16))
+        self.to_main_page_button.setStyleSheet("background-color: #666666; color: #cadbdd; border-radius: 5px")
+        self.to_main_page_button.setText("To Main Page")
+        self.to_main_page_button.clicked.connect(self.go_to_main_page)
+
+        self.final_widgets = [self.final_label, self.score_label, self.to_main_page_button]
 
     def create_label(
         self, x, y, width, height, font_family, font_size, style, bold=False, alignment=Qt.AlignmentFlag.AlignLeft
@@ -118,9 +174,7 @@ class QuizScreen:
         """Helper function to create a QLabel."""
         label = QLabel(self.centralwidget)
         label.setGeometry(x, y, width, height)
-        font = QFont(font_family, font_size)
-        font.setBold(bold)
-        label.setFont(font)
+        label.setFont(get_font(font_family, font_size, bold=bold))
         label.setStyleSheet(style)
         label.setAlignment(alignment)
         label.show()
@@ -132,6 +186,14 @@ class QuizScreen:
 
         self.definition_label.setText(QCoreApplication.translate("MainWindow", term.definition, None))
         self.header_label.setText(QCoreApplication.translate("MainWindow", "QUIZ", None))
+        if self.mode == MODE_CHOICE:
+            choices = self.quiz.question(term).choices
+            for button, choice in zip(self.choice_buttons, choices):
+                button.setText(choice)
+            for position, button in enumerate(self.choice_buttons):
+                button.setVisible(position < len(choices))
+            return
+
         self.term_input.setPlaceholderText(
             QCoreApplication.translate("MainWindow", "Input the correct term of the definition", None)
         )
@@ -139,64 +201,121 @@ class QuizScreen:
 
     def on_submit(self):
         """Handle the submit action."""
-        self.logger.debug("Submitting the answer")
+        self.submit_answer(self.term_input.text())
+
+    def on_choice(self, button):
+        """Handle a click on one of the choices."""
+        self.submit_answer(button.text())
+
+    def submit_answer(self, user_answer: str):
+        """Check the answer, record it and move on."""
+        latency_ms = round((time.monotonic() - self.shown_at) * 1000)
+        self.logger.debug(f"Submitting the answer after {latency_ms} ms")
 
-        user_answer = self.term_input.text()
-        correct = self.quiz.check_answer(user_answer, self.terms[self.current_term_index].term)
-        self.logger.debug(f"User answer: {user_answer}, Correct answer: {self.terms[self.current_term_index].term}")
+        if self.mode == MODE_CHOICE:
+            correct = self.quiz.check_choice(user_answer, self.term.term)
+        else:
+            correct = self.quiz.check_answer(user_answer, self.term.term)
+        self.logger.debug(f"User answer: {user_answer}, Correct answer: {self.term.term}")
 
         if correct:
             self.message_label.setStyleSheet("color: green;")
             self.message_label.setText("Correct!")
         else:
             self.message_label.setStyleSheet("color: red;")
-            self.message_label.setText(f"Incorrect. Correct answer: {self.terms[self.current_term_index].term}")
+            self.message_label.setText(f"Incorrect. Correct answer: {self.term.term}")
 
         self.logger.debug(self.message_label.text())
-        self.quiz.update_mastery(self.terms[self.current_term_index], correct=correct)
+        # Scored here so a missed term is queued again with its new due time, saved on the database thread
+        # right away, so closing the window mid-quiz keeps every answer given
+        answer = self.quiz.score_answer(self.term, correct=correct, latency_ms=latency_ms)
+        self.unsaved.append((replace(self.term), answer))
+        self.save_answers()
+        self.answered += 1
+        if not correct and self.term.id not in self.relearned:
+            self.relearned.add(self.term.id)
+            self.queue.push(self.term)
         self.next_term()
 
     def next_term(self):
         """Move to the next term or show the final message."""
         self.logger.debug("Moving to the next term")
 
-        if self.current_term_index < len(self.terms) - 1:
-            self.current_term_index += 1
-            self.retranslate_ui(self.terms[self.current_term_index])
-            self.term_input.clear()
+        if self.queue:
+            self.term = self.queue.pop()
+            self.retranslate_ui(self.term)
+            if self.mode != MODE_CHOICE:
+                self.term_input.clear()
+            # The answer time runs from here, once the question is on screen
+            self.shown_at = time.monotonic()
+            # Prepared once the question is drawn, while the user reads it
+            QTimer.singleShot(0, self.prefetch)
         else:
             self.logger.debug("Quiz finished")
-            self.show_final_message(self.quiz.points, len(self.terms))
-
-    def show_final_message(self, score, total):
-        """Display the final score and provide navigation back to the main page."""
-        # Hide quiz elements
+            self.save_answers()
+            get_async_store().submit(
+                self.save_session,
+                lambda _: self.show_final_message(self.quiz.points, self.answered),
+            )
+
+    def show_quiz_widgets(self):
+        """Show the widgets used while answering in the mode of the quiz."""
+        self.answer_widgets = self.choice_buttons if self.mode == MODE_CHOICE else [self.term_input, self.submit_button]
+        for widget in [*self.answer_widgets, self.definition_label, self.message_label, self.scroll_area]:
+            widget.show()
+
+    def hide_quiz_widgets(self):
+        """Hide the widgets used while answering."""
         for widget in [
             self.term_input,
-            self.definition_label,
             self.submit_button,
+            *self.choice_buttons,
+            self.definition_label,
             self.message_label,
             self.scroll_area,
         ]:
-            widget.close()
+            widget.hide()
+
+    def save_answers(self):
+        """Write the answers not saved yet on the database thread."""
+        if self.unsaved:
+            batch, self.unsaved = self.unsaved, []
+            get_async_store().submit(
+                lambda store: self.quiz.save_answers(batch), error=partial(self.on_answers_not_saved, batch)
+            )
+
+    def on_answers_not_saved(self, batch: list[tuple[Term, Answer]], error: BaseException) -> None:
+        """Tell the user the answers were not saved, they are tried again with the next answer."""
+        self.logger.error(f"Saving {len(batch)} answers failed: {error}")
+        self.unsaved[:0] = batch
+        QMessageBox.warning(self.MainWindow, "Saving failed", f"Your answers could not be saved: {error}")
+
+    def save_session(self, store):
+        """Add the session to the user's statistics, on the database thread."""
+        self.quiz.update_user_points()
+
+    def prefetch(self):
+        """Prepare the questions after the current one."""
+        self.quiz.prefetch(self.queue.upcoming(PREFETCH))
+
+    def show_final_message(self, score, total):
+        """Display the final score and provide navigation back to the main page."""
+        # Hide quiz elements
+        self.hide_quiz_widgets()
 
         # Show final score and message
-        self.create_label(
-            100, 200, 600, 50, "Helvetica", 18, "color: #666666", alignment=Qt.AlignmentFlag.AlignCenter
-        ).setText("You answered all the questions!")
-        self.create_label(
-            100, 270, 600, 50, "Helvetica", 18, "color: #666666", bold=True, alignment=Qt.AlignmentFlag.AlignCenter
-        ).setText(f"Score: {score}/{total}")
+        self.final_label.setText("You answered all the questions!" if total else "There are no terms to practice.")
+        self.score_label.setText(f"Score: {score}/{total}")
+        for widget in self.final_widgets:
+            widget.show()
 
-        self.to_main_page_button = QPushButton(self.centralwidget)
-        self.to_main_page_button.setGeometry(300, 350, 200, 50)
-        self.to_main_page_button.setFont(QFont("Helvetica", 16))
-        self.to_main_page_button.setStyleSheet("background-color: #666666; color: #cadbdd; border-radius: 5px")
-        self.to_main_page_button.setText("To Main Page")
-        self.to_main_page_button.clicked.connect(self.go_to_main_page)
-        self.to_main_page_button.show()
+    def hide_final_message(self):
+        for widget in self.final_widgets:
+            widget.hide()
 
     def go_to_main_page(self):
         """Handle navigation back to the main page."""
         self.logger.debug("Going back to the main page")
-        self.welcome_screen.setup_ui(self, self.store, self.user)
+        from welcome_screen import WelcomeScreen
+
+        self.navigator.open(WelcomeScreen, self.user)
@@ -0,0 +1,62 @@
+"""Module for loading images and fonts once per process.
+
+Each asset is read and decoded the first time it is asked for and the same object
+is handed to every screen afterwards, so switching screens never touches the disk.
+Assets come from the compiled Qt resource bundle `assets_rc` when it was built
+with `task resources`, and from the assets directory next to the package otherwise.
+
+Qt images and fonts are implicitly shared, widgets keep their own copy when given
+one, so the cached objects must not be modified; copy them first, e.g. `QFont(font)`.
+
+Functions:
+    asset_path: Path of an asset in the bundle or the assets directory.
+    get_pixmap: Decoded image of an asset.
+    get_icon: Icon made from an asset.
+    get_font: Font of the given family, size and style.
+
+Examples:
+    label.setPixmap(get_pixmap("header.png"))
+    button = QPushButton(get_icon("plus.png"), "")
+    button.setFont(get_font("Helvetica", 25, bold=True))
+
+"""
+
+import logging
+from functools import cache
+from pathlib import Path
+
+from PySide6.QtGui import QFont, QIcon, QPixmap
+
+try:
+    import assets_rc  # noqa: F401  # Registers the bundled assets under ":/assets"
+except ImportError:
+    ASSETS = str(Path(__file__).resolve().parent.parent / "assets")
+else:
+    ASSETS = ":/assets"
+
+logger = logging.getLogger(__name__)
+
+
+def asset_path(name: str) -> str:
+    return f"{ASSETS}/{name}"
+
+
+@cache
+def get_pixmap(name: str) -> QPixmap:
+    pixmap = QPixmap(asset_path(name))
+    if pixmap.isNull():
+        logger.warning("Could not load the asset %s from %s", name, ASSETS)
+    return pixmap
+
+
+@cache
+def get_icon(name: str) -> QIcon:
+    return QIcon(get_pixmap(name))
+
+
+@cache
+def get_font(family: str, size: int, *, bold: bool = False, italic: bool = False) -> QFont:
+    font = QFont(family, size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
@@ -0,0 +1,144 @@
+"""Module for drawing terms at random, weighted by how weak they are.
+
+Classes:
+    FenwickTree: Binary indexed tree of integer weights, supporting weighted draws.
+    WeakTermsQueue: Queue of terms drawn at random, the least mastered most often.
+
+Functions:
+    weakness: Integer weight of a term, higher the less it is mastered.
+
+Examples:
+    queue = WeakTermsQueue(store.terms.get_by_group_id(group.id), length=50)
+    while queue:
+        term = queue.pop()
+
+"""
+
+import random
+from collections import deque
+from collections.abc import Iterable, Sequence
+
+from models import Term
+
+WEIGHT_SCALE = 1000
+# Mastered terms still come up now and then, a twentieth as often as new ones
+MIN_WEIGHT = 50
+
+
+def weakness(term: Term) -> int:
+    """Return the weight of a term, from `MIN_WEIGHT` when mastered to `WEIGHT_SCALE + MIN_WEIGHT` when not."""
+    return round((1 - term.mastery_coef) * WEIGHT_SCALE) + MIN_WEIGHT
+
+
+class FenwickTree:
+    """Binary indexed tree of integer weights, supporting weighted draws.
+
+    Changing a weight and finding the item a cumulative weight falls on both take
+    O(log n), so drawing from a large deck never sorts or scans it. Weights are
+    integers, which keeps the sums exact however many updates are made.
+    """
+
+    def __init__(self, weights: Sequence[int]) -> None:
+        self._weights = list(weights)
+        self._tree = [0, *self._weights]
+        # Building in place, each node passes its sum on to its parent, is O(n)
+        for index in range(1, len(self._tree)):
+            parent = index + (index & -index)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[index]
+        self._total = sum(self._weights)
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def weight(self, index: int) -> int:
+        return self._weights[index]
+
+    def update(self, index: int, weight: int) -> None:
+        """Set the weight of the item at `index`."""
+        delta = weight - self._weights[index]
+        self._weights[index] = weight
+        self._total += delta
+        position = index + 1
+        while position < len(self._tree):
+            self._tree[position] += delta
+            position += position & -position
+
+    def find(self, target: int) -> int:
+        """Return the index of the item whose cumulative weight range contains `target`, 0 <= target < total."""
+        position = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            following = position + step
+            if following < len(self._tree) and self._tree[following] <= target:
+                position = following
+                target -= self._tree[following]
+            step >>= 1
+        return position
+
+    def sample(self, rng: random.Random) -> int:
+        """Return the index of an item drawn with probability proportional to its weight."""
+        return self.find(rng.randrange(self._total))
+
+
+class WeakTermsQueue:
+    """Queue of terms drawn at random, the least mastered most often.
+
+    Each term is drawn with probability proportional to its `weakness` among the
+    terms not drawn yet, so a session of `length` questions favours weak terms
+    without asking any term twice. A term pushed back after an answer is weighted
+    by its new mastery and adds a question to the session. It has the interface of
+    `ReviewQueue`, so the quiz can use either.
+    """
+
+    def __init__(
+        self, terms: Iterable[Term] = (), *, length: int | None = None, rng: random.Random | None = None
+    ) -> None:
+        self._terms = list(terms)
+        self._index = {id(term): index for index, term in enumerate(self._terms)}
+        self._tree = FenwickTree([weakness(term) for term in self._terms])
+        self._ahead: deque[Term] = deque()
+        self._left = len(self._terms) if length is None else min(length, len(self._terms))
+        self.rng = rng or random.Random()  # noqa: S311
+
+    def __len__(self) -> int:
+        return self._left
+
+    def _draw(self) -> Term:
+        index = self._tree.sample(self.rng)
+        self._tree.update(index, 0)
+        return self._terms[index]
+
+    def push(self, term: Term) -> None:
+        if any(ahead is term for ahead in self._ahead):
+            return
+        index = self._index.get(id(term))
+        if index is None:
+            # Terms which were not in the deck grow the tree, in O(n)
+            index = self._index[id(term)] = len(self._terms)
+            self._terms.append(term)
+            self._tree = FenwickTree([*(self._tree.weight(i) for i in range(len(self._tree))), 0])
+        if self._tree.weight(index) == 0:
+            self._left += 1
+        self._tree.update(index, weakness(term))
+
+    def peek(self) -> Term | None:
+        upcoming = self.upcoming(1)
+        return upcoming[0] if upcoming else None
+
+    def upcoming(self, count: int) -> list[Term]:
+        """Return the next `count` terms without removing them, drawing them ahead if they were not yet."""
+        while len(self._ahead) < min(count, self._left):
+            self._ahead.append(self._draw())
+        return list(self._ahead)[:count]
+
+    def pop(self) -> Term:
+        if not self._left:
+            msg = "pop from an empty queue"
+            raise IndexError(msg)
+        self._left -= 1
+        return self._ahead.popleft() if self._ahead else self._draw()
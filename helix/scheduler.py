@@ -0,0 +1,87 @@
+"""Module for scheduling term reviews with the SM-2 spaced repetition algorithm.
+
+Classes:
+    Scheduler: Class computing when a term is due again from the quality of an answer and its difficulty.
+    ReviewQueue: Priority queue of terms ordered by the time they are due.
+
+Examples:
+    scheduler = Scheduler()
+    scheduler.review(term, quality=4, now=int(time.time()))
+
+    queue = ReviewQueue(store.terms.get_due(group.id, int(time.time())))
+    while queue:
+        term = queue.pop()
+
+"""
+
+import heapq
+from collections.abc import Iterable
+
+from models import Term
+
+DAY = 24 * 60 * 60
+
+# Answer qualities on the SM-2 0-5 scale, 3 and above is a successful recall
+QUALITY_CORRECT = 4
+QUALITY_INCORRECT = 1
+
+
+class Scheduler:
+    """Class computing when a term is due again from the quality of an answer.
+
+    Successful reviews of a term with difficulty `d` are due after `1 - difficulty_weight * d`
+    of the SM-2 interval, so slow and often missed terms are practiced more.
+    """
+
+    def __init__(self, relearn_delay: int = 10 * 60, minimum_ease: float = 1.3, difficulty_weight: float = 0.5) -> None:
+        self.relearn_delay = relearn_delay
+        self.minimum_ease = minimum_ease
+        self.difficulty_weight = difficulty_weight
+
+    def review(self, term: Term, quality: int, now: int) -> None:
+        """Update the interval, ease and due time of the term after an answer of the given quality."""
+        if quality < 3:  # noqa: PLR2004
+            # A lapse restarts the repetitions and shows the term again shortly, the ease is kept
+            term.repetitions = 0
+            term.interval_days = 0.0
+            term.due_at = now + self.relearn_delay
+            return
+
+        term.repetitions += 1
+        if term.repetitions == 1:
+            term.interval_days = 1.0
+        elif term.repetitions == 2:  # noqa: PLR2004
+            term.interval_days = 6.0
+        else:
+            term.interval_days *= term.ease
+
+        term.ease = max(self.minimum_ease, term.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        # Hard terms come back sooner, the interval itself keeps growing as SM-2 has it
+        term.due_at = now + round(term.interval_days * DAY * (1 - self.difficulty_weight * term.difficulty))
+
+
+class ReviewQueue:
+    """Priority queue of terms ordered by the time they are due.
+
+    Terms due at the same time keep the order of their ids.
+    """
+
+    def __init__(self, terms: Iterable[Term] = ()) -> None:
+        self._heap = [(term.due_at, term.id or 0, term) for term in terms]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, term: Term) -> None:
+        heapq.heappush(self._heap, (term.due_at, term.id or 0, term))
+
+    def peek(self) -> Term | None:
+        return self._heap[0][2] if self._heap else None
+
+    def upcoming(self, count: int) -> list[Term]:
+        """Return the next `count` terms without removing them, in O(count log n)."""
+        return [entry[2] for entry in heapq.nsmallest(count, self._heap)]
+
+    def pop(self) -> Term:
+        return heapq.heappop(self._heap)[2]
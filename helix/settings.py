@@ -1,7 +1,8 @@
-from PyQt5.QtGui import QFont
-import sqlite3
-
-CONNECTION = sqlite3.connect("database.db")
+# Database
+DATABASE = "database.db"
+# "durable" syncs every commit to disk. "fast" syncs only at checkpoints, so the last
+# answers may be lost on power loss (not on a crash), for quicker writes and reads.
+DATABASE_PROFILE = "durable"
 
 # Text
 FONT_FAMILY = "Helvetica"
@@ -13,9 +14,3 @@ TEXT_SIZE = 15
 # Windows sizes
 SCREEN_SIZE = (800, 600)
 SETTINGS_SCREEN_SIZE = (800, 400)
-
-font = QFont(FONT_FAMILY, 30)
-font.setBold(True)
-
-subfont = QFont(FONT_FAMILY, 25)
-subfont.setBold(True)
@@ -0,0 +1,125 @@
+from datetime import date
+
+from PySide6.QtCore import QCoreApplication, QMetaObject, QRect, Qt
+from PySide6.QtWidgets import QLabel, QPushButton, QWidget
+from resources import get_font, get_pixmap
+from database import get_async_store
+from store import User
+import logging
+
+PERCENTILES = (50, 90)
+HARDEST_TERMS = 5
+
+TEXT_STYLE = "background-color: transparent; color: #666666;"
+
+
+class StatsScreen:
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def setup_ui(self, navigator):
+        self.logger.debug("Setting up the stats screen UI")
+
+        self.navigator = navigator
+        self.MainWindow = navigator.MainWindow
+
+        # Configuring the central widget
+        self.centralwidget = QWidget()
+        self.centralwidget.setStyleSheet("background-color: #CADBDD")
+
+        # Header
+        self.header = QLabel(self.centralwidget)
+        self.header.setGeometry(QRect(1, -3, 813, 136))
+        self.header.setPixmap(get_pixmap("header.png"))
+
+        # Logo on the header
+        self.logo = QLabel(self.centralwidget)
+        self.logo.setGeometry(QRect(15, 15, 91, 91))
+        self.logo.setStyleSheet("background-color: transparent;")
+        self.logo.setPixmap(get_pixmap("helix-log-small.png"))
+        self.logo.setScaledContents(True)
+
+        self.header_label = QLabel(self.centralwidget)
+        self.header_label.setGeometry(QRect(135, 45, 271, 46))
+        self.header_label.setFont(get_font("Helvetica", 40, bold=True))
+        self.header_label.setStyleSheet("background-color: transparent; color: #666666; font-size: 40px;")
+
+        # Totals, streak and answer times of the user
+        self.summary_label = self.create_label(30, 150, 740, 100, 18)
+
+        # Accuracy per category and the hardest terms side by side
+        self.categories_label = self.create_label(30, 270, 360, 230, 14)
+        self.hardest_label = self.create_label(410, 270, 360, 230, 14)
+
+        self.back_button = QPushButton(self.centralwidget)
+        self.back_button.setGeometry(QRect(574, 520, 196, 61))
+        self.back_button.setFont(get_font("Helvetica", 25))
+        self.back_button.setStyleSheet("color: #666666; border-radius: 5px; border-style: solid; border-width: 1px")
+        self.back_button.clicked.connect(self.go_to_welcome_screen)
+
+        QMetaObject.connectSlotsByName(self.MainWindow)
+
+    def refresh(self, user: User):
+        """Show the statistics of the user once they are loaded."""
+        self.user = user
+        self.retranslate_ui()
+        for label in (self.categories_label, self.hardest_label):
+            label.clear()
+
+        if self.user.id is not None:
+            user_id = self.user.id
+            get_async_store().submit(lambda store: self.load_stats(user_id, store), self.show_stats)
+
+    def create_label(self, x, y, width, height, font_size):
+        label = QLabel(self.centralwidget)
+        label.setGeometry(QRect(x, y, width, height))
+        label.setFont(get_font("Helvetica", font_size))
+        label.setStyleSheet(TEXT_STYLE)
+        label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        label.setWordWrap(True)
+        return label
+
+    def retranslate_ui(self):
+        self.MainWindow.setWindowTitle("Stats")
+        self.header_label.setText(QCoreApplication.translate("MainWindow", "STATS", None))
+        self.back_button.setText(QCoreApplication.translate("MainWindow", "Back", None))
+        self.summary_label.setText("Loading...")
+
+    def load_stats(self, user_id: int, store):
+        """Read the statistics of the user on the database thread, each is a lookup of its rollup."""
+        names = {group.id: group.name for batch in store.term_groups.stream_by_user_id(user_id) for group in batch}
+        return {
+            "user": store.user_stats.get(user_id),
+            "times": store.answers.latency_percentiles(user_id, PERCENTILES),
+            "groups": [(names.get(stats.group_id, "?"), stats) for stats in store.answers.accuracy_by_group(user_id)],
+            "hardest": store.terms.get_hardest(user_id, HARDEST_TERMS),
+        }
+
+    def show_stats(self, stats):
+        """Fill the labels with the loaded statistics."""
+        user = stats["user"]
+        if user is None or not user.answers:
+            self.summary_label.setText("No answers yet, take a quiz to see your statistics here.")
+            return
+
+        median, slow = (stats["times"][percentile] for percentile in PERCENTILES)
+        times = (
+            f"Answer time: {median / 1000:.1f} s median, {slow / 1000:.1f} s for 9 in 10" if median is not None else ""
+        )
+        self.summary_label.setText(
+            f"Points: {user.points}    Accuracy: {user.correct / user.answers:.0%} of {user.answers} answers\n"
+            f"Streak: {user.current_streak(date.today().toordinal())} days (best {user.best_streak})\n{times}"
+        )
+        self.categories_label.setText(
+            "Accuracy by category\n"
+            + "\n".join(f"{name.upper()}: {group.correct / group.answers:.0%}" for name, group in stats["groups"])
+        )
+        self.hardest_label.setText(
+            "Hardest terms\n" + "\n".join(f"{term.term} ({term.mastery_coef:.0%})" for term in stats["hardest"])
+        )
+
+    def go_to_welcome_screen(self):
+        self.logger.debug("Going back to the welcome screen")
+        from welcome_screen import WelcomeScreen
+
+        self.navigator.open(WelcomeScreen, self.user)
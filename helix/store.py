@@ -2,14 +2,21 @@
 
 Classes:
     Store: Main class for managing data in the database.
+    ConnectionProfile: Class describing the SQLite settings applied when a store opens.
+    UnitOfWork: Class for grouping writes into a single commit.
     UsersStore: Class for managing users in the database.
     TermGroupsStore: Class for managing term groups in the database.
     TermsStore: Class for managing terms in the database.
+    UserStatsStore: Class for managing the running statistics of users in the database.
+    AnswersStore: Class for logging answers and reading their rollups in the database.
 
 Examples:
     # Create a store and manage users
     store = Store("database.db")
 
+    # Trade durability of the last commits on power loss for faster writes
+    store = Store("database.db", profile="fast")
+
     # Operations on users
     user = User(username="user")
     user = store.users.create(user)
@@ -18,6 +25,12 @@ Examples:
     store.users.update(user)
     store.users.delete(user.id)
 
+    # Keyset pagination and streaming in batches
+    page = store.users.list(after_id=0, limit=100)
+    next_page = store.users.list(after_id=page[-1].id, limit=100)
+    for batch in store.terms.stream_by_group_id(group.id, batch_size=500):
+        process(batch)
+
     # Operations on term groups
     group = TermGroup(name="group", user_id=user.id)
     group = store.term_groups.create(group)
@@ -34,6 +47,22 @@ Examples:
     store.terms.update(term)
     store.terms.delete(term.id)
 
+    # Ranked full-text search, every word matches as a prefix
+    terms = store.terms.search("photo synth", group_id=group.id, limit=20)
+
+    # Bulk operations run in a single transaction
+    ids = store.terms.create_many(terms)
+    store.terms.update_many(terms)
+    store.terms.delete_many(ids)
+
+    # Answers are appended to a log, a trigger adds them to the term and to the rollups
+    store.answers.record_many([Answer(term.id, user.id, answered_at=now, correct=True)])
+    store.terms.update_schedule_many(terms)  # writes the review schedule only
+    by_group = store.answers.accuracy_by_group(user.id)
+    by_hour = store.answers.accuracy_by_hour(user.id)
+    times = store.answers.latency_percentiles(user.id, (50, 90))  # {50: 2300, 90: 7100}
+    hardest = store.terms.get_hardest(user.id, limit=5)
+
     # Operations on points
     point = Point(points=0, user_id=user.id)
     point = store.points.create(point)
@@ -42,52 +71,286 @@ Examples:
     store.points.update(point)
     store.points.delete(point.id)
 
+    # Statistics of a user, updated in place by a single upsert
+    store.user_stats.record(user.id, points=8, answers=10, correct=8)
+    stats = store.user_stats.get(user.id)
+    streak = stats.current_streak(date.today().toordinal())
+    top = store.user_stats.leaderboard(limit=10)
+    days = store.user_stats.history(user.id, since_day=date.today().toordinal() - 30)
+
+    # Commit a batch of writes at once
+    with store.transaction():
+        store.terms.update(term)
+        store.points.update(point)
+
+    # Write-behind: commit every 50 writes, or at a write 2 seconds after the first pending one
+    # flush_pending commits what is left once the caller is idle
+    store = Store("database.db", max_pending_writes=50, max_write_delay=2.0)
+    store.close()  # flushes pending writes
+
 """
 
-import sqlite3
+from __future__ import annotations
 
-from models import Point, Term, TermGroup, User
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Protocol, Self
+
+from migrations import migrate
+from models import Answer, DailyStats, GroupStats, HourStats, Point, Term, TermGroup, User, UserStats, content_hash
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+    from types import TracebackType
+
+
+@dataclass(frozen=True)
+class ConnectionProfile:
+    """Class describing the SQLite settings applied when a store opens.
+
+    Negative `cache_size` values are in KiB, positive ones in pages.
+    """
+
+    journal_mode: str = "DELETE"
+    synchronous: str = "FULL"
+    cache_size: int = -2000
+    mmap_size: int = 0
+    temp_store: str = "DEFAULT"
+    foreign_keys: bool = False
+
+    def apply(self, db: sqlite3.Connection) -> None:
+        db.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        db.execute(f"PRAGMA synchronous = {self.synchronous}")
+        db.execute(f"PRAGMA cache_size = {int(self.cache_size)}")
+        db.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        db.execute(f"PRAGMA temp_store = {self.temp_store}")
+        db.execute(f"PRAGMA foreign_keys = {'ON' if self.foreign_keys else 'OFF'}")
+
+
+# Foreign keys stay off: the schema has no ON DELETE actions, so enforcing them
+# would reject deleting a category that still has terms.
+PROFILES = {
+    # Every commit is synced to disk before it returns.
+    "durable": ConnectionProfile(journal_mode="WAL", synchronous="FULL", cache_size=-8000),
+    # Commits are synced at checkpoints only, so the last ones may be lost on power loss
+    # (never on an application crash); reads are served from a larger cache and mmap.
+    "fast": ConnectionProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-64000,
+        mmap_size=256 * 1024 * 1024,
+        temp_store="MEMORY",
+    ),
+}
 
 
 class Store:
     """Store class implements the main interface for managing data in the database."""
 
-    def __init__(self, database: str) -> None:
+    def __init__(
+        self,
+        database: str,
+        *,
+        profile: str | ConnectionProfile = "durable",
+        max_pending_writes: int = 1,
+        max_write_delay: float | None = None,
+    ) -> None:
+        if isinstance(profile, str):
+            if profile not in PROFILES:
+                msg = f"Unknown connection profile {profile!r}, expected one of {sorted(PROFILES)}"
+                raise ValueError(msg)
+            profile = PROFILES[profile]
+
         self._db = sqlite3.connect(database)
+        profile.apply(self._db)
+        migrate(self._db)
+        self.unit_of_work = UnitOfWork(self._db, max_pending=max_pending_writes, max_delay=max_write_delay)
+
+        self.users = UsersStore(self._db, self.unit_of_work)
+        self.term_groups = TermGroupsStore(self._db, self.unit_of_work)
+        self.terms = TermsStore(self._db, self.unit_of_work)
+        self.points = PointsStore(self._db, self.unit_of_work)
+        self.user_stats = UserStatsStore(self._db, self.unit_of_work)
+        self.answers = AnswersStore(self._db, self.unit_of_work)
+
+    def transaction(self) -> UnitOfWork:
+        """Return the unit of work shared by all stores, usable as a context manager."""
+        return self.unit_of_work
+
+    def flush(self) -> None:
+        """Commit every pending write."""
+        self.unit_of_work.flush()
+
+    def close(self) -> None:
+        """Commit pending writes and close the connection."""
+        self.unit_of_work.flush()
+        self._db.close()
+
+
+class UnitOfWork:
+    """Class for grouping writes of all stores into a single commit.
+
+    Stores call `commit` after each write. Inside a `with` block (or between
+    `begin` and `end`) the commit is postponed until the outermost block exits,
+    and writes queued before the block are committed when it begins, so rolling
+    it back only drops its own writes. Nested blocks are savepoints of the
+    outermost one, a nested block that raises rolls back its writes only.
+
+    Outside of a block writes are committed once `max_pending` of them are queued
+    or, when the next write arrives, the oldest one is `max_delay` seconds old, so
+    the defaults commit at once. Nothing commits a lone pending write by time, the
+    owner calls `flush_pending` when idle, as `AsyncStore` does, or `flush`.
+    """
+
+    def __init__(self, db: sqlite3.Connection, max_pending: int = 1, max_delay: float | None = None) -> None:
+        self._db = db
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self._depth = 0
+        self._pending = 0
+        self._first_pending_at = 0.0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def begin(self) -> None:
+        if self._depth == 0:
+            self.flush()
+            # Opened here, so a savepoint of a nested block never starts the transaction itself
+            self._db.execute("BEGIN")
+        else:
+            self._db.execute(f"SAVEPOINT unit_of_work_{self._depth}")
+        self._depth += 1
+
+    def end(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self.flush()
+        else:
+            self._db.execute(f"RELEASE unit_of_work_{self._depth}")
+
+    def rollback(self) -> None:
+        """Drop the writes of the innermost block and close it."""
+        self._depth -= 1
+        if self._depth == 0:
+            self._pending = 0
+            self._db.rollback()
+        else:
+            self._db.execute(f"ROLLBACK TO unit_of_work_{self._depth}")
+            self._db.execute(f"RELEASE unit_of_work_{self._depth}")
+
+    def commit(self) -> None:
+        if self._pending == 0:
+            self._first_pending_at = time.monotonic()
+        self._pending += 1
+
+        if self._depth:
+            return
+        if self._pending >= self.max_pending or (
+            self.max_delay is not None and time.monotonic() - self._first_pending_at >= self.max_delay
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        self._db.commit()
+        self._pending = 0
+
+    def flush_pending(self) -> None:
+        """Commit the writes queued outside of a block, if no block is open."""
+        if self._pending and self._depth == 0:
+            self.flush()
+
+    def __enter__(self) -> Self:
+        self.begin()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self.rollback()
+        else:
+            self.end()
+
+
+def _insert_many(db: sqlite3.Connection, query: str, rows: list[tuple]) -> list[int]:
+    """Run an INSERT for every row and return the assigned ids in order.
+
+    AUTOINCREMENT ids of rows inserted by one statement are consecutive, as the
+    write lock is held for the whole `executemany` call.
+    """
+    if not rows:
+        return []
+
+    cur = db.cursor()
+    cur.executemany(query, rows)
+    cur.close()
+    last_id = db.execute("SELECT last_insert_rowid()").fetchone()[0]
 
-        self.users = UsersStore(self._db)
-        self.term_groups = TermGroupsStore(self._db)
-        self.terms = TermsStore(self._db)
-        self.points = PointsStore(self._db)
+    return list(range(last_id - len(rows) + 1, last_id + 1))
+
+
+class _Row(Protocol):
+    id: int | None
+
+
+def _stream[T: _Row](fetch_page: Callable[[int, int], Sequence[T]], batch_size: int) -> Iterator[Sequence[T]]:
+    """Yield consecutive keyset pages of `batch_size` rows until the table is exhausted."""
+    after_id = 0
+    while True:
+        page = fetch_page(after_id, batch_size)
+        if page:
+            yield page
+        if len(page) < batch_size:
+            return
+        after_id = page[-1].id or 0
 
 
 class UsersStore:
     """Class for managing users in the database."""
 
-    def __init__(self, db: sqlite3.Connection) -> None:
+    def __init__(self, db: sqlite3.Connection, unit_of_work: UnitOfWork | None = None) -> None:
         self._db = db
-        self._create_table()
-
-    def _create_table(self) -> None:
-        self._db.execute("""CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username VARCHAR(64) UNIQUE
-        )""")
+        self._uow = unit_of_work or UnitOfWork(db)
 
     def create(self, user: User) -> User:
         cur = self._db.cursor()
         cur.execute("INSERT INTO users (username) VALUES (?)", (user.username,))
         user.id = cur.lastrowid
         cur.close()
-        self._db.commit()
+        self._uow.commit()
 
         return user
 
-    def list(self) -> list[User]:
-        res = self._db.execute("SELECT id, username FROM users")
+    def create_many(self, users: Sequence[User]) -> list[int]:
+        with self._uow:
+            ids = _insert_many(
+                self._db, "INSERT INTO users (username) VALUES (?)", [(user.username,) for user in users]
+            )
+            self._uow.commit()
+
+        for user, user_id in zip(users, ids, strict=True):
+            user.id = user_id
+        return ids
+
+    def list(self, *, after_id: int = 0, limit: int | None = None) -> list[User]:
+        res = self._db.execute(
+            "SELECT id, username FROM users WHERE id > ? ORDER BY id LIMIT ?",
+            (after_id, -1 if limit is None else limit),
+        )
 
         return [User(id=row[0], username=row[1]) for row in res.fetchall()]
 
+    def stream(self, batch_size: int = 500) -> Iterator[Sequence[User]]:
+        return _stream(lambda after_id, limit: self.list(after_id=after_id, limit=limit), batch_size)
+
     def get(self, user_id: int) -> User | None:
         res = self._db.execute("SELECT id, username FROM users WHERE id = ?", (user_id,))
         row = res.fetchone()
@@ -106,42 +369,65 @@ class UsersStore:
 
     def update(self, user: User) -> None:
         self._db.execute("UPDATE users SET username = ? WHERE id = ?", (user.username, user.id))
-        self._db.commit()
+        self._uow.commit()
+
+    def update_many(self, users: Sequence[User]) -> None:
+        with self._uow:
+            self._db.executemany(
+                "UPDATE users SET username = ? WHERE id = ?", [(user.username, user.id) for user in users]
+            )
+            self._uow.commit()
 
     def delete(self, user_id: int) -> None:
         self._db.execute("DELETE FROM users WHERE id = ?", (user_id,))
-        self._db.commit()
+        self._uow.commit()
+
+    def delete_many(self, user_ids: Sequence[int]) -> None:
+        with self._uow:
+            self._db.executemany("DELETE FROM users WHERE id = ?", [(user_id,) for user_id in user_ids])
+            self._uow.commit()
 
 
 class TermGroupsStore:
     """Class for managing term groups in the database."""
 
-    def __init__(self, db: sqlite3.Connection) -> None:
+    def __init__(self, db: sqlite3.Connection, unit_of_work: UnitOfWork | None = None) -> None:
         self._db = db
-        self._create_table()
-
-    def _create_table(self) -> None:
-        self._db.execute("""CREATE TABLE IF NOT EXISTS term_groups (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER,
-            name VARCHAR(64),
-            FOREIGN KEY (user_id) REFERENCES users(id)
-        )""")
+        self._uow = unit_of_work or UnitOfWork(db)
 
     def create(self, group: TermGroup) -> TermGroup:
         cur = self._db.cursor()
         cur.execute("INSERT INTO term_groups (name, user_id) VALUES (?, ?)", (group.name, group.user_id))
         group.id = cur.lastrowid
         cur.close()
-        self._db.commit()
+        self._uow.commit()
 
         return group
 
-    def list(self) -> list[TermGroup]:
-        res = self._db.execute("SELECT id, user_id, name FROM term_groups")
+    def create_many(self, groups: Sequence[TermGroup]) -> list[int]:
+        with self._uow:
+            ids = _insert_many(
+                self._db,
+                "INSERT INTO term_groups (name, user_id) VALUES (?, ?)",
+                [(group.name, group.user_id) for group in groups],
+            )
+            self._uow.commit()
+
+        for group, group_id in zip(groups, ids, strict=True):
+            group.id = group_id
+        return ids
+
+    def list(self, *, after_id: int = 0, limit: int | None = None) -> list[TermGroup]:
+        res = self._db.execute(
+            "SELECT id, user_id, name FROM term_groups WHERE id > ? ORDER BY id LIMIT ?",
+            (after_id, -1 if limit is None else limit),
+        )
 
         return [TermGroup(id=row[0], user_id=row[1], name=row[2]) for row in res.fetchall()]
 
+    def stream(self, batch_size: int = 500) -> Iterator[Sequence[TermGroup]]:
+        return _stream(lambda after_id, limit: self.list(after_id=after_id, limit=limit), batch_size)
+
     def get(self, group_id: int) -> TermGroup | None:
         res = self._db.execute("SELECT id, user_id, name FROM term_groups WHERE id = ?", (group_id,))
         row = res.fetchone()
@@ -150,149 +436,279 @@ class TermGroupsStore:
             return TermGroup(id=row[0], user_id=row[1], name=row[2])
         return None
 
-    def get_by_user_id(self, user_id: int):
-        res = self._db.execute("SELECT id, user_id, name FROM term_groups WHERE user_id = ?", (user_id,))
+    def get_by_user_id(self, user_id: int, *, after_id: int = 0, limit: int | None = None) -> list[TermGroup]:
+        res = self._db.execute(
+            "SELECT id, user_id, name FROM term_groups WHERE user_id = ? AND id > ? ORDER BY id LIMIT ?",
+            (user_id, after_id, -1 if limit is None else limit),
+        )
 
         return [TermGroup(id=row[0], user_id=row[1], name=row[2]) for row in res.fetchall()]
 
+    def stream_by_user_id(self, user_id: int, batch_size: int = 500) -> Iterator[Sequence[TermGroup]]:
+        return _stream(lambda after_id, limit: self.get_by_user_id(user_id, after_id=after_id, limit=limit), batch_size)
+
     def update(self, group: TermGroup) -> None:
         self._db.execute(
             "UPDATE term_groups SET user_id = ?, name = ? WHERE id = ?",
             (group.user_id, group.name, group.id),
         )
-        self._db.commit()
+        self._uow.commit()
+
+    def update_many(self, groups: Sequence[TermGroup]) -> None:
+        with self._uow:
+            self._db.executemany(
+                "UPDATE term_groups SET user_id = ?, name = ? WHERE id = ?",
+                [(group.user_id, group.name, group.id) for group in groups],
+            )
+            self._uow.commit()
 
     def delete(self, group_id: int) -> None:
         self._db.execute("DELETE FROM term_groups WHERE id = ?", (group_id,))
-        self._db.commit()
+        self._uow.commit()
+
+    def delete_many(self, group_ids: Sequence[int]) -> None:
+        with self._uow:
+            self._db.executemany("DELETE FROM term_groups WHERE id = ?", [(group_id,) for group_id in group_ids])
+            self._uow.commit()
+
+
+_TERM_FIELDS = (
+    "group_id",
+    "term",
+    "definition",
+    "mastery_coef",
+    "total_ans",
+    "correct_ans",
+    "due_at",
+    "interval_days",
+    "ease",
+    "repetitions",
+    "difficulty",
+    "latency_ms",
+)
+_TERM_COLUMNS = ", ".join(("id", *_TERM_FIELDS))
+# The content hash is derived from the text on every write and never read back
+_TERM_WRITE_FIELDS = (*_TERM_FIELDS, "content_hash")
+_TERM_INSERT = (
+    f"INSERT INTO terms ({', '.join(_TERM_WRITE_FIELDS)}) VALUES ({', '.join('?' * len(_TERM_WRITE_FIELDS))})"  # noqa: S608
+)
+_TERM_UPDATE = f"UPDATE terms SET {', '.join(f'{field} = ?' for field in _TERM_WRITE_FIELDS)} WHERE id = ?"  # noqa: S608
+# Answers change the counts and mastery through the log, so reviewing a term only writes its schedule
+_SCHEDULE_FIELDS = ("due_at", "interval_days", "ease", "repetitions", "difficulty", "latency_ms")
+_SCHEDULE_UPDATE = f"UPDATE terms SET {', '.join(f'{field} = ?' for field in _SCHEDULE_FIELDS)} WHERE id = ?"  # noqa: S608
+
+
+# Matches of a term weigh more than matches of its definition
+_SEARCH = f"""SELECT {", ".join(f"terms.{column}" for column in ("id", *_TERM_FIELDS))}
+    FROM terms_fts JOIN terms ON terms.id = terms_fts.rowid
+    WHERE terms_fts MATCH ? AND (? IS NULL OR terms.group_id = ?)
+    ORDER BY bm25(terms_fts, 10.0, 1.0) LIMIT ?"""  # noqa: S608
+
+
+def _search_query(query: str) -> str:
+    """Turn user input into an FTS5 query matching every word as a prefix, operators are taken literally."""
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", query))
+
+
+def _term_values(term: Term) -> tuple:
+    return (*(getattr(term, field) for field in _TERM_FIELDS), content_hash(term.term, term.definition))
+
+
+def _term_from_row(row: tuple) -> Term:
+    return Term(id=row[0], **dict(zip(_TERM_FIELDS, row[1:], strict=True)))
 
 
 class TermsStore:
     """Class for managing terms in the database."""
 
-    def __init__(self, db: sqlite3.Connection) -> None:
+    def __init__(self, db: sqlite3.Connection, unit_of_work: UnitOfWork | None = None) -> None:
         self._db = db
-        self._create_table()
-
-    def _create_table(self) -> None:
-        self._db.execute("""CREATE TABLE IF NOT EXISTS terms (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            group_id INTEGER,
-            term TEXT,
-            definition TEXT,
-            mastery_coef INTEGER,
-            total_ans INTEGER,
-            correct_ans INTEGER,
-            FOREIGN KEY (group_id) REFERENCES term_groups(id)
-        )""")
+        self._uow = unit_of_work or UnitOfWork(db)
 
     def create(self, term: Term) -> Term:
         cur = self._db.cursor()
-        cur.execute(
-            "INSERT INTO terms (group_id, term, definition, mastery_coef, total_ans, correct_ans) VALUES (?, ?, ?, ?, ?, ?)",  # noqa: E501
-            (term.group_id, term.term, term.definition, term.mastery_coef, term.total_ans, term.correct_ans),
-        )
+        cur.execute(_TERM_INSERT, _term_values(term))
         term.id = cur.lastrowid
         cur.close()
-        self._db.commit()
+        self._uow.commit()
 
         return term
 
-    def list(self) -> list[Term]:
-        res = self._db.execute("SELECT id, group_id, term, definition, mastery_coef, total_ans, correct_ans FROM terms")
-
-        return [
-            Term(
-                id=row[0],
-                group_id=row[1],
-                term=row[2],
-                definition=row[3],
-                mastery_coef=row[4],
-                total_ans=row[5],
-                correct_ans=row[6],
-            )
-            for row in res.fetchall()
-        ]
+    def create_many(self, terms: Sequence[Term]) -> list[int]:
+        with self._uow:
+            ids = _insert_many(self._db, _TERM_INSERT, [_term_values(term) for term in terms])
+            self._uow.commit()
 
-    def get(self, term_id: int) -> Term | None:
+        for term, term_id in zip(terms, ids, strict=True):
+            term.id = term_id
+        return ids
+
+    def list(self, *, after_id: int = 0, limit: int | None = None) -> list[Term]:
         res = self._db.execute(
-            "SELECT id, group_id, term, definition, mastery_coef, total_ans, correct_ans FROM terms WHERE id = ?",
-            (term_id,),
+            f"SELECT {_TERM_COLUMNS} FROM terms WHERE id > ? ORDER BY id LIMIT ?",  # noqa: S608
+            (after_id, -1 if limit is None else limit),
         )
+
+        return [_term_from_row(row) for row in res.fetchall()]
+
+    def stream(self, batch_size: int = 500) -> Iterator[Sequence[Term]]:
+        return _stream(lambda after_id, limit: self.list(after_id=after_id, limit=limit), batch_size)
+
+    def get(self, term_id: int) -> Term | None:
+        res = self._db.execute(f"SELECT {_TERM_COLUMNS} FROM terms WHERE id = ?", (term_id,))  # noqa: S608
         row = res.fetchone()
 
         if row:
-            return Term(
-                id=row[0],
-                group_id=row[1],
-                term=row[2],
-                definition=row[3],
-                mastery_coef=row[4],
-                total_ans=row[5],
-                correct_ans=row[6],
-            )
+            return _term_from_row(row)
         return None
 
-    def get_by_group_id(self, group_id: int):
+    def get_by_group_id(self, group_id: int, *, after_id: int = 0, limit: int | None = None) -> list[Term]:
         res = self._db.execute(
-            "SELECT id, group_id, term, definition, mastery_coef, total_ans, correct_ans FROM terms WHERE group_id = ?",  # noqa: E501
-            (group_id,),
+            f"SELECT {_TERM_COLUMNS} FROM terms WHERE group_id = ? AND id > ? ORDER BY id LIMIT ?",  # noqa: S608
+            (group_id, after_id, -1 if limit is None else limit),
         )
 
-        return [
-            Term(
-                id=row[0],
-                group_id=row[1],
-                term=row[2],
-                definition=row[3],
-                mastery_coef=row[4],
-                total_ans=row[5],
-                correct_ans=row[6],
-            )
-            for row in res.fetchall()
-        ]
+        return [_term_from_row(row) for row in res.fetchall()]
+
+    def stream_by_group_id(self, group_id: int, batch_size: int = 500) -> Iterator[Sequence[Term]]:
+        return _stream(
+            lambda after_id, limit: self.get_by_group_id(group_id, after_id=after_id, limit=limit), batch_size
+        )
+
+    def get_words_by_group_id(self, group_id: int) -> list[str]:
+        res = self._db.execute("SELECT term FROM terms WHERE group_id = ?", (group_id,))
+
+        return [row[0] for row in res.fetchall()]
+
+    def get_due(self, group_id: int, due_before: int, limit: int | None = None) -> list[Term]:
+        """Return the terms of a group due at `due_before` or earlier, the most overdue first."""
+        res = self._db.execute(
+            f"SELECT {_TERM_COLUMNS} FROM terms WHERE group_id = ? AND due_at <= ? ORDER BY due_at, id LIMIT ?",  # noqa: S608
+            (group_id, due_before, -1 if limit is None else limit),
+        )
+
+        return [_term_from_row(row) for row in res.fetchall()]
+
+    def get_ids_by_group_id(self, group_id: int) -> list[int]:
+        """Return the ids of the terms of a group, read from its index without loading the terms."""
+        res = self._db.execute("SELECT id FROM terms WHERE group_id = ? ORDER BY id", (group_id,))
+
+        return [row[0] for row in res.fetchall()]
+
+    def get_many(self, term_ids: Sequence[int]) -> list[Term]:
+        """Return the terms with the ids that still exist, in the order of the ids, at most 999 at once."""
+        res = self._db.execute(
+            f"SELECT {_TERM_COLUMNS} FROM terms WHERE id IN ({', '.join('?' * len(term_ids))})",  # noqa: S608
+            tuple(term_ids),
+        )
+        terms = {term.id: term for term in map(_term_from_row, res.fetchall())}
+
+        return [terms[term_id] for term_id in term_ids if term_id in terms]
+
+    def get_content_hashes(self, group_id: int, hashes: Sequence[str]) -> set[str]:
+        """Return which of the content hashes belong to terms of the group already, at most 999 at once."""
+        res = self._db.execute(
+            f"SELECT content_hash FROM terms WHERE group_id = ? AND content_hash IN ({', '.join('?' * len(hashes))})",  # noqa: S608
+            (group_id, *hashes),
+        )
+
+        return {row[0] for row in res.fetchall()}
+
+    def search(self, query: str, group_id: int | None = None, limit: int = 100) -> list[Term]:
+        """Return the terms whose term or definition has words starting with every word of `query`, best first."""
+        match = _search_query(query)
+        if not match:
+            return []
+        res = self._db.execute(_SEARCH, (match, group_id, group_id, limit))
+
+        return [_term_from_row(row) for row in res.fetchall()]
+
+    def get_hardest(self, user_id: int, limit: int = 10) -> list[Term]:
+        """Return the answered terms of the user's groups with the highest difficulty, hardest first."""
+        res = self._db.execute(
+            f"SELECT {', '.join(f'terms.{column}' for column in ('id', *_TERM_FIELDS))} FROM terms"  # noqa: S608
+            " JOIN term_groups ON term_groups.id = terms.group_id"
+            " WHERE term_groups.user_id = ? AND terms.total_ans > 0 ORDER BY terms.difficulty DESC, terms.id LIMIT ?",
+            (user_id, limit),
+        )
+
+        return [_term_from_row(row) for row in res.fetchall()]
 
     def update(self, term: Term) -> None:
+        self._db.execute(_TERM_UPDATE, (*_term_values(term), term.id))
+        self._uow.commit()
+
+    def update_text(self, term_id: int, term: str, definition: str) -> None:
+        """Write the text of a term, leaving its answers and schedule as the quizzes left them."""
         self._db.execute(
-            "UPDATE terms SET group_id = ?, term = ?, definition = ?, mastery_coef = ?, total_ans = ?, correct_ans = ? WHERE id = ?",  # noqa: E501
-            (term.group_id, term.term, term.definition, term.mastery_coef, term.total_ans, term.correct_ans, term.id),
+            "UPDATE terms SET term = ?, definition = ?, content_hash = ? WHERE id = ?",
+            (term, definition, content_hash(term, definition), term_id),
         )
-        self._db.commit()
+        self._uow.commit()
+
+    def update_many(self, terms: Sequence[Term]) -> None:
+        with self._uow:
+            self._db.executemany(_TERM_UPDATE, [(*_term_values(term), term.id) for term in terms])
+            self._uow.commit()
+
+    def update_schedule_many(self, terms: Sequence[Term]) -> None:
+        """Write the review schedule and difficulty of the terms, leaving their text and answer counts alone."""
+        with self._uow:
+            self._db.executemany(
+                _SCHEDULE_UPDATE, [(*(getattr(term, field) for field in _SCHEDULE_FIELDS), term.id) for term in terms]
+            )
+            self._uow.commit()
 
     def delete(self, term_id: int) -> None:
         self._db.execute("DELETE FROM terms WHERE id = ?", (term_id,))
-        self._db.commit()
+        self._uow.commit()
+
+    def delete_many(self, term_ids: Sequence[int]) -> None:
+        with self._uow:
+            self._db.executemany("DELETE FROM terms WHERE id = ?", [(term_id,) for term_id in term_ids])
+            self._uow.commit()
 
 
 class PointsStore:
     """Class for managing points in the database."""
 
-    def __init__(self, db: sqlite3.Connection) -> None:
+    def __init__(self, db: sqlite3.Connection, unit_of_work: UnitOfWork | None = None) -> None:
         self._db = db
-        self._create_table()
-
-    def _create_table(self) -> None:
-        self._db.execute("""CREATE TABLE IF NOT EXISTS points (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER,
-            points INTEGER,
-            FOREIGN KEY (user_id) REFERENCES users(id)
-        )""")
+        self._uow = unit_of_work or UnitOfWork(db)
 
     def create(self, point: Point) -> Point:
         cur = self._db.cursor()
         cur.execute("INSERT INTO points (user_id, points) VALUES (?, ?)", (point.user_id, point.points))
         point.id = cur.lastrowid
         cur.close()
-        self._db.commit()
+        self._uow.commit()
 
         return point
 
-    def list(self) -> list[Point]:
-        res = self._db.execute("SELECT id, user_id, points FROM points")
+    def create_many(self, points: Sequence[Point]) -> list[int]:
+        with self._uow:
+            ids = _insert_many(
+                self._db,
+                "INSERT INTO points (user_id, points) VALUES (?, ?)",
+                [(point.user_id, point.points) for point in points],
+            )
+            self._uow.commit()
+
+        for point, point_id in zip(points, ids, strict=True):
+            point.id = point_id
+        return ids
+
+    def list(self, *, after_id: int = 0, limit: int | None = None) -> list[Point]:
+        res = self._db.execute(
+            "SELECT id, user_id, points FROM points WHERE id > ? ORDER BY id LIMIT ?",
+            (after_id, -1 if limit is None else limit),
+        )
 
         return [Point(id=row[0], user_id=row[1], points=row[2]) for row in res.fetchall()]
 
+    def stream(self, batch_size: int = 500) -> Iterator[Sequence[Point]]:
+        return _stream(lambda after_id, limit: self.list(after_id=after_id, limit=limit), batch_size)
+
     def get(self, point_id: int) -> Point | None:
         res = self._db.execute("SELECT id, user_id, points FROM points WHERE id = ?", (point_id,))
         row = res.fetchone()
@@ -305,8 +721,169 @@ class PointsStore:
         self._db.execute(
             "UPDATE points SET user_id = ?, points = ? WHERE id = ?", (point.user_id, point.points, point.id)
         )
-        self._db.commit()
+        self._uow.commit()
+
+    def update_many(self, points: Sequence[Point]) -> None:
+        with self._uow:
+            self._db.executemany(
+                "UPDATE points SET user_id = ?, points = ? WHERE id = ?",
+                [(point.user_id, point.points, point.id) for point in points],
+            )
+            self._uow.commit()
 
     def delete(self, point_id: int) -> None:
         self._db.execute("DELETE FROM points WHERE id = ?", (point_id,))
-        self._db.commit()
+        self._uow.commit()
+
+    def delete_many(self, point_ids: Sequence[int]) -> None:
+        with self._uow:
+            self._db.executemany("DELETE FROM points WHERE id = ?", [(point_id,) for point_id in point_ids])
+            self._uow.commit()
+
+
+# A streak grows on the day after the last one with answers and restarts after a gap
+_STREAK = """CASE
+    WHEN excluded.last_day <= last_day THEN streak
+    WHEN excluded.last_day = last_day + 1 THEN streak + 1
+    ELSE 1
+END"""
+_RECORD_USER = f"""INSERT INTO user_stats (user_id, points, answers, correct, streak, best_streak, last_day)
+VALUES (?, ?, ?, ?, 1, 1, ?)
+ON CONFLICT (user_id) DO UPDATE SET
+    points = points + excluded.points,
+    answers = answers + excluded.answers,
+    correct = correct + excluded.correct,
+    streak = {_STREAK},
+    best_streak = MAX(best_streak, {_STREAK}),
+    last_day = MAX(last_day, excluded.last_day)"""  # noqa: S608
+_RECORD_DAY = """INSERT INTO daily_stats (user_id, day, points, answers, correct) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (user_id, day) DO UPDATE SET
+    points = points + excluded.points,
+    answers = answers + excluded.answers,
+    correct = correct + excluded.correct"""
+_USER_STATS_COLUMNS = "user_id, points, answers, correct, streak, best_streak, last_day"
+
+
+class UserStatsStore:
+    """Class for managing the running statistics of users in the database.
+
+    Totals are kept per user and per day and updated in place, so reading the
+    total of a user is a primary key lookup and the leaderboard reads the top of
+    an index instead of summing rows.
+    """
+
+    def __init__(self, db: sqlite3.Connection, unit_of_work: UnitOfWork | None = None) -> None:
+        self._db = db
+        self._uow = unit_of_work or UnitOfWork(db)
+
+    def record(self, user_id: int, *, points: int, answers: int, correct: int, day: int | None = None) -> None:
+        """Add the outcome of a session to the totals of the user and of the day, `day` being a date ordinal."""
+        # Streaks follow the calendar days of the user, so the local date is wanted
+        day = date.today().toordinal() if day is None else day  # noqa: DTZ011
+        with self._uow:
+            self._db.execute(_RECORD_USER, (user_id, points, answers, correct, day))
+            self._db.execute(_RECORD_DAY, (user_id, day, points, answers, correct))
+            self._uow.commit()
+
+    def get(self, user_id: int) -> UserStats | None:
+        res = self._db.execute(f"SELECT {_USER_STATS_COLUMNS} FROM user_stats WHERE user_id = ?", (user_id,))  # noqa: S608
+        row = res.fetchone()
+
+        if row:
+            return UserStats(*row)
+        return None
+
+    def leaderboard(self, limit: int = 10) -> list[UserStats]:
+        """Return the users with the most points, best first."""
+        res = self._db.execute(
+            f"SELECT {_USER_STATS_COLUMNS} FROM user_stats ORDER BY points DESC, user_id LIMIT ?",  # noqa: S608
+            (limit,),
+        )
+
+        return [UserStats(*row) for row in res.fetchall()]
+
+    def history(self, user_id: int, *, since_day: int = 0, limit: int | None = None) -> list[DailyStats]:
+        """Return the totals of the days with answers from `since_day` on, oldest first."""
+        res = self._db.execute(
+            "SELECT user_id, day, points, answers, correct FROM daily_stats"
+            " WHERE user_id = ? AND day >= ? ORDER BY day LIMIT ?",
+            (user_id, since_day, -1 if limit is None else limit),
+        )
+
+        return [DailyStats(*row) for row in res.fetchall()]
+
+
+class AnswersStore:
+    """Class for logging answers and reading their rollups in the database.
+
+    The log is append-only. A trigger adds every answer to the counts and mastery
+    of its term and to the per group and per hour totals of its user, so the
+    rollups are read with a primary key range scan however long the log grows.
+    """
+
+    def __init__(self, db: sqlite3.Connection, unit_of_work: UnitOfWork | None = None) -> None:
+        self._db = db
+        self._uow = unit_of_work or UnitOfWork(db)
+
+    def record_many(self, answers: Sequence[Answer]) -> list[int]:
+        with self._uow:
+            ids = _insert_many(
+                self._db,
+                "INSERT INTO answers (term_id, user_id, answered_at, correct, latency_ms) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (answer.term_id, answer.user_id, answer.answered_at, int(answer.correct), answer.latency_ms)
+                    for answer in answers
+                ],
+            )
+            self._uow.commit()
+
+        for answer, answer_id in zip(answers, ids, strict=True):
+            answer.id = answer_id
+        return ids
+
+    def get_by_term_id(self, term_id: int, *, since: int = 0, limit: int | None = None) -> list[Answer]:
+        """Return the answers of a term given at `since` or later, oldest first."""
+        res = self._db.execute(
+            "SELECT term_id, user_id, answered_at, correct, latency_ms, id FROM answers"
+            " WHERE term_id = ? AND answered_at >= ? ORDER BY answered_at, id LIMIT ?",
+            (term_id, since, -1 if limit is None else limit),
+        )
+
+        return [Answer(*row[:3], bool(row[3]), *row[4:]) for row in res.fetchall()]
+
+    def latency_percentiles(
+        self, user_id: int, percentiles: Sequence[int] = (50, 90, 99), *, since: int = 0
+    ) -> dict[int, int | None]:
+        """Return the answer times of the user at each percentile, by the nearest rank method, in one query.
+
+        Answers are ranked by their time once, and every percentile is the smallest time
+        whose rank reaches that share of the answers, or None if no time was recorded.
+        """
+        columns = ", ".join("MIN(CASE WHEN rank * 100 >= ? * total THEN latency_ms END)" for _ in percentiles)
+        res = self._db.execute(
+            f"""WITH ranked AS (
+                SELECT latency_ms, ROW_NUMBER() OVER (ORDER BY latency_ms) AS rank, COUNT(*) OVER () AS total
+                FROM answers WHERE user_id = ? AND answered_at >= ? AND latency_ms IS NOT NULL
+            )
+            SELECT {columns} FROM ranked""",  # noqa: S608
+            (user_id, since, *percentiles),
+        )
+
+        return dict(zip(percentiles, res.fetchone(), strict=True))
+
+    def accuracy_by_group(self, user_id: int) -> list[GroupStats]:
+        """Return the answer totals of the user per term group."""
+        res = self._db.execute(
+            "SELECT user_id, group_id, answers, correct FROM group_stats WHERE user_id = ? ORDER BY group_id",
+            (user_id,),
+        )
+
+        return [GroupStats(*row) for row in res.fetchall()]
+
+    def accuracy_by_hour(self, user_id: int) -> list[HourStats]:
+        """Return the answer totals of the user per local hour of the day, for the hours with answers."""
+        res = self._db.execute(
+            "SELECT user_id, hour, answers, correct FROM hour_stats WHERE user_id = ? ORDER BY hour", (user_id,)
+        )
+
+        return [HourStats(*row) for row in res.fetchall()]
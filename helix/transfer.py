@@ -0,0 +1,210 @@
+"""Module for importing and exporting the terms of a group.
+
+Files are streamed in chunks, so memory use stays flat however large they are.
+Supported formats are CSV and TSV files with a term and a definition per row,
+JSON Lines with "term" and "definition" keys, and Anki plain text notes, which
+are tab separated after leading `#key:value` header lines.
+
+Classes:
+    ImportReport: Counts of the rows imported or skipped by `import_terms`.
+
+Functions:
+    detect_format: Guess the format of a file from its extension.
+    import_terms: Stream a file into a group, skipping invalid rows and duplicates.
+    export_terms: Stream the terms of a group into a file.
+
+Examples:
+    report = import_terms(store, group.id, "deck.csv", progress=lambda done, total: print(f"{done / total:.0%}"))
+    count = export_terms(store, group.id, "deck.jsonl")
+
+"""
+
+import csv
+import json
+import logging
+import os
+import re
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import batched, chain
+from typing import BinaryIO
+
+from models import Term, content_hash
+from store import Store
+
+FORMATS = {".csv": "csv", ".tsv": "tsv", ".jsonl": "jsonl", ".txt": "anki"}
+CHUNK_SIZE = 500
+MAX_FIELD_LENGTH = 10_000
+
+_DELIMITERS = {"csv": ",", "tsv": "\t", "anki": "\t"}
+_HEADER = ["term", "definition"]
+_ANKI_HEADER = re.compile(r"#[a-z ]+:")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+
+
+def detect_format(path: str | os.PathLike[str]) -> str:
+    """Return the format of a file from its extension, raising ValueError for unknown ones."""
+    extension = os.path.splitext(path)[1].lower()  # noqa: PTH122
+    if extension not in FORMATS:
+        msg = f"Unsupported file type {extension!r}, expected one of {', '.join(FORMATS)}"
+        raise ValueError(msg)
+    return FORMATS[extension]
+
+
+class _Lines:
+    """Decoded lines of a binary file, counting the bytes read for progress reports."""
+
+    def __init__(self, file: BinaryIO) -> None:
+        self.file = file
+        self.position = 0
+
+    def __iter__(self) -> Iterator[str]:
+        for number, line in enumerate(self.file):
+            self.position += len(line)
+            text = line.decode()
+            yield text.removeprefix("\ufeff") if number == 0 else text
+
+
+def _skip_anki_header(lines: Iterable[str]) -> tuple[int, Iterator[str]]:
+    """Return how many leading header lines of Anki notes were dropped and the lines after them.
+
+    Only the leading lines are headers, a later `#` may start a term.
+    """
+    lines = iter(lines)
+    skipped = 0
+    for line in lines:
+        if not _ANKI_HEADER.match(line):
+            return skipped, chain([line], lines)
+        skipped += 1
+    return skipped, lines
+
+
+def _records(lines: Iterable[str], file_format: str) -> Iterator[tuple[int, object]]:
+    """Yield the line number and the raw fields of every row of a file."""
+    if file_format == "jsonl":
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                yield number, None
+                continue
+            yield number, [record.get("term"), record.get("definition")] if isinstance(record, dict) else None
+        return
+
+    skipped = 0
+    if file_format == "anki":
+        skipped, lines = _skip_anki_header(lines)
+    reader = csv.reader(lines, delimiter=_DELIMITERS[file_format])
+    first = True
+    for row in reader:
+        if not row:
+            continue
+        # A column header is only taken from the first row, later "term,definition" rows are terms
+        if not (first and [field.strip().casefold() for field in row[:2]] == _HEADER):
+            yield skipped + reader.line_num, row
+        first = False
+
+
+def _validate(fields: object) -> tuple[str, str] | str:
+    """Return the term and definition of a row, or why the row is invalid."""
+    if not isinstance(fields, list) or len(fields) < 2:  # noqa: PLR2004
+        return "expected a term and a definition"
+    term, definition = fields[0], fields[1]
+    if not isinstance(term, str) or not isinstance(definition, str):
+        return "the term and the definition have to be text"
+    term, definition = term.strip(), definition.strip()
+    if not term or not definition:
+        return "empty term or definition"
+    if len(term) > MAX_FIELD_LENGTH or len(definition) > MAX_FIELD_LENGTH:
+        return f"longer than {MAX_FIELD_LENGTH} characters"
+    return term, definition
+
+
+def import_terms(
+    store: Store,
+    group_id: int,
+    path: str | os.PathLike[str],
+    *,
+    file_format: str | None = None,
+    progress: Callable[[int, int], None] | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> ImportReport:
+    """Import the terms of a file into a group in one transaction.
+
+    Rows are parsed and written `chunk_size` at a time. Invalid rows are logged and
+    skipped, as are terms whose text the group has already. `progress` is called
+    after every chunk with the bytes read so far and the size of the file.
+    """
+    file_format = file_format or detect_format(path)
+    total = os.path.getsize(path)  # noqa: PTH202
+    report = ImportReport()
+
+    with open(path, "rb") as file, store.transaction():  # noqa: PTH123
+        lines = _Lines(file)
+        for chunk in batched(_records(lines, file_format), chunk_size):
+            terms: dict[str, Term] = {}
+            invalid = 0
+            for number, fields in chunk:
+                valid = _validate(fields)
+                if isinstance(valid, str):
+                    logger.warning("Skipping line %d of %s: %s", number, path, valid)
+                    invalid += 1
+                    continue
+                terms.setdefault(content_hash(*valid), Term(*valid, group_id))
+
+            # Duplicates within the chunk collapse in the dict, earlier chunks are in the database already
+            existing = store.terms.get_content_hashes(group_id, list(terms)) if terms else set()
+            new_terms = [term for key, term in terms.items() if key not in existing]
+            store.terms.create_many(new_terms)
+
+            report.imported += len(new_terms)
+            report.invalid += invalid
+            report.duplicates += len(chunk) - invalid - len(new_terms)
+            if progress:
+                progress(lines.position, total)
+
+    return report
+
+
+def export_terms(
+    store: Store,
+    group_id: int,
+    path: str | os.PathLike[str],
+    *,
+    file_format: str | None = None,
+    batch_size: int = CHUNK_SIZE,
+) -> int:
+    """Write the terms of a group into a file, fetching them in batches, and return how many were written."""
+    file_format = file_format or detect_format(path)
+    count = 0
+
+    with open(path, "w", newline="", encoding="utf-8") as file:  # noqa: PTH123
+        writer = None
+        if file_format == "anki":
+            file.write("#separator:tab\n#html:false\n")
+        if file_format != "jsonl":
+            writer = csv.writer(file, delimiter=_DELIMITERS[file_format])
+        if file_format in ("csv", "tsv"):
+            writer.writerow(_HEADER)
+
+        for batch in store.terms.stream_by_group_id(group_id, batch_size):
+            if writer is None:
+                file.writelines(
+                    json.dumps({"term": term.term, "definition": term.definition}, ensure_ascii=False) + "\n"
+                    for term in batch
+                )
+            else:
+                writer.writerows((term.term, term.definition) for term in batch)
+            count += len(batch)
+
+    return count
@@ -1,10 +1,22 @@
+import os
 import sqlite3
 
 import pytest
 
+from helix.migrations import migrate
+
 
 @pytest.fixture
 def db():
     connection = sqlite3.connect(":memory:")
+    migrate(connection)
     yield connection
     connection.close()
+
+
+@pytest.fixture(scope="session")
+def app():
+    """One application for every test, able to load images and build widgets without a display."""
+    widgets = pytest.importorskip("PySide6.QtWidgets")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return widgets.QApplication.instance() or widgets.QApplication([])
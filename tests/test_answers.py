@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from helix.answers import ExactMatcher, FuzzyMatcher, bounded_distance, normalize
+
+
+@pytest.fixture
+def matcher():
+    return FuzzyMatcher(synonyms={"car": ["automobile"]})
+
+
+def test_normalize():
+    assert normalize("  Café-au-LAIT!  ") == "cafe au lait"
+    assert normalize("Straße") == "strasse"
+    assert normalize("ﬁne") == "fine"
+
+
+@pytest.mark.parametrize(
+    ("source", "target", "distance"),
+    [
+        ("kitten", "kitten", 0),
+        ("kitten", "sitten", 1),
+        ("kitten", "kiten", 1),
+        ("kitten", "iktten", 1),
+        ("kitten", "sitting", 3),
+        ("", "abc", 3),
+    ],
+)
+def test_bounded_distance(source, target, distance):
+    assert bounded_distance(source, target, 5) == distance
+
+
+def test_bounded_distance_stops_at_bound():
+    assert bounded_distance("kitten", "sitting", 1) == 2
+    assert bounded_distance("a", "a" * 100, 2) == 3
+
+
+def full_distance(source, target):
+    """Optimal string alignment distance filling the whole table, to check the banded one against."""
+    table = [[i + j if not i or not j else 0 for j in range(len(target) + 1)] for i in range(len(source) + 1)]
+    for i in range(1, len(source) + 1):
+        for j in range(1, len(target) + 1):
+            table[i][j] = min(
+                table[i - 1][j] + 1,
+                table[i][j - 1] + 1,
+                table[i - 1][j - 1] + (source[i - 1] != target[j - 1]),
+            )
+            if i > 1 and j > 1 and source[i - 1] == target[j - 2] and source[i - 2] == target[j - 1]:
+                table[i][j] = min(table[i][j], table[i - 2][j - 2] + 1)
+    return table[-1][-1]
+
+
+def test_bounded_distance_matches_full_table():
+    rng = random.Random(0)
+    for _ in range(500):
+        source = "".join(rng.choices("abc", k=rng.randint(0, 12)))
+        target = "".join(rng.choices("abc", k=rng.randint(0, 12)))
+        for bound in range(4):
+            assert bounded_distance(source, target, bound) == min(full_distance(source, target), bound + 1)
+
+
+def test_bounded_distance_of_long_texts_outside_band():
+    text = "a large mammal with a trunk, " * 10
+
+    # Shifting the whole text by three characters needs a path off the band of two
+    assert bounded_distance(text, "xyz" + text[:-3], 2) == 3
+    assert bounded_distance(text, text[:100] + "x" + text[101:], 2) == 1
+    assert bounded_distance(text, text[1:] + "x", 2) == 2
+
+
+def test_fuzzy_matcher_tolerates_typos(matcher):
+    assert matcher.matches("elephnat", "elephant")
+    assert matcher.matches("Élephant ", "elephant")
+    assert not matcher.matches("elefnat", "elephant")
+    assert not matcher.matches("cot", "cat")
+
+
+def test_fuzzy_matcher_accepts_synonyms_and_alternatives(matcher):
+    assert matcher.matches("Automobil", "car")
+    assert matcher.matches("colour", "color; colour")
+    assert not matcher.matches("bus", "car")
+
+
+def test_fuzzy_matcher_caches_correct_answers(matcher):
+    matcher.matches("cat", "cat")
+    matcher.matches("cap", "cat")
+
+    assert matcher.accepted.cache_info().hits == 1
+
+
+def test_fuzzy_matcher_rejects_long_near_matches(matcher):
+    definition = "a large mammal with a trunk, " * 10
+
+    assert matcher.matches(definition[:50] + definition[51:], definition)
+    assert not matcher.matches("xyz" + definition[:-3], definition)
+
+
+def test_exact_matcher():
+    assert ExactMatcher().matches(" Cat", "cat")
+    assert not ExactMatcher().matches("cta", "cat")
@@ -0,0 +1,89 @@
+import time
+
+import pytest
+
+from helix.models import Answer, Term, TermGroup, User
+from helix.store import AnswersStore, TermGroupsStore, TermsStore, UsersStore
+
+NOON = 1_700_000_000
+
+
+@pytest.fixture
+def store(db):
+    return AnswersStore(db)
+
+
+@pytest.fixture
+def terms(db):
+    user = UsersStore(db).create(User(username="user"))
+    group = TermGroupsStore(db).create(TermGroup(name="group", user_id=user.id))
+    store = TermsStore(db)
+    return [store.create(Term(term=f"term{i}", definition=f"definition{i}", group_id=group.id)) for i in range(2)]
+
+
+def test_record_many_rolls_up_into_the_term(store, terms, db):
+    first, second = terms
+    ids = store.record_many(
+        [
+            Answer(first.id, 1, NOON, correct=True, latency_ms=900),
+            Answer(first.id, 1, NOON + 60, correct=False),
+            Answer(first.id, 1, NOON + 120, correct=True),
+            Answer(second.id, 1, NOON, correct=False),
+        ]
+    )
+    fetched = TermsStore(db).get(first.id)
+
+    assert len(ids) == 4
+    assert (fetched.total_ans, fetched.correct_ans) == (3, 2)
+    assert fetched.mastery_coef == pytest.approx(2 / 3)
+    assert TermsStore(db).get(second.id).mastery_coef == 0
+
+
+def test_get_by_term_id(store, terms):
+    term = terms[0]
+    store.record_many(
+        [Answer(term.id, 1, NOON + 60, correct=False), Answer(term.id, 1, NOON, correct=True, latency_ms=5)]
+    )
+
+    assert [(answer.answered_at, answer.correct, answer.latency_ms) for answer in store.get_by_term_id(term.id)] == [
+        (NOON, True, 5),
+        (NOON + 60, False, None),
+    ]
+    assert [answer.answered_at for answer in store.get_by_term_id(term.id, since=NOON + 1)] == [NOON + 60]
+
+
+def test_accuracy_rollups(store, terms):
+    store.record_many(
+        [Answer(term.id, 1, NOON + offset, correct=offset == 0) for term in terms for offset in (0, 3600)]
+    )
+    hours = [time.localtime(NOON).tm_hour, time.localtime(NOON + 3600).tm_hour]
+
+    assert [(stats.group_id, stats.answers, stats.correct) for stats in store.accuracy_by_group(1)] == [
+        (terms[0].group_id, 4, 2)
+    ]
+    assert [(stats.hour, stats.answers, stats.correct) for stats in store.accuracy_by_hour(1)] == sorted(
+        [
+            (hours[0], 2, 2),
+            (hours[1], 2, 0),
+        ]
+    )
+    assert store.accuracy_by_group(2) == []
+
+
+def test_update_schedule_many_writes_only_the_schedule(store, terms, db):
+    term = terms[0]
+    store.record_many([Answer(term.id, 1, NOON, correct=True)])
+    term.term, term.due_at, term.ease, term.total_ans = "changed", NOON + 86400, 2.6, 0
+    TermsStore(db).update_schedule_many([term])
+    fetched = TermsStore(db).get(term.id)
+
+    assert (fetched.term, fetched.due_at, fetched.ease, fetched.total_ans) == ("term0", NOON + 86400, 2.6, 1)
+
+
+def test_latency_percentiles(store, terms):
+    term = terms[0]
+    store.record_many([Answer(term.id, 1, NOON, correct=True, latency_ms=ms) for ms in range(1000, 0, -100)])
+    store.record_many([Answer(term.id, 1, NOON, correct=True), Answer(term.id, 2, NOON, correct=True, latency_ms=1)])
+
+    assert store.latency_percentiles(1, (50, 90, 100)) == {50: 500, 90: 900, 100: 1000}
+    assert store.latency_percentiles(1, (50,), since=NOON + 1) == {50: None}
@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from helix.async_store import AsyncStore  # noqa: E402
+from helix.models import User  # noqa: E402
+from helix.store import Store  # noqa: E402
+
+
+@pytest.fixture
+def db(app, tmp_path):
+    db = AsyncStore(lambda: Store(str(tmp_path / "database.db")))
+    yield db
+    db.close()
+
+
+def deliver(app, db):
+    db.wait()
+    app.processEvents()
+
+
+def test_jobs_run_on_one_database_thread(db):
+    threads = {db.submit(lambda store: threading.current_thread()).result() for _ in range(5)}
+
+    assert len(threads) == 1
+    assert threading.current_thread() not in threads
+
+
+def test_callbacks_run_on_the_gui_thread(app, db):
+    results = []
+    db.submit(lambda store: store.users.create(User(username="user")))
+    db.submit(
+        lambda store: store.users.list(),
+        lambda users: results.append(([user.username for user in users], threading.current_thread())),
+    )
+
+    assert results == []
+
+    deliver(app, db)
+
+    assert results == [(["user"], threading.current_thread())]
+
+
+def test_writes_are_serialized_in_order(app, db):
+    for i in range(20):
+        db.submit(lambda store, i=i: store.users.create(User(username=f"user {i}")))
+
+    users = db.submit(lambda store: store.users.list()).result()
+
+    assert [user.username for user in users] == [f"user {i}" for i in range(20)]
+
+
+def test_errors_go_to_the_error_callback(app, db):
+    errors = []
+    db.submit(lambda store: 1 / 0, lambda _: errors.append("called"), errors.append)
+    deliver(app, db)
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], ZeroDivisionError)
+
+
+def test_close_runs_queued_jobs(tmp_path, app):
+    db = AsyncStore(lambda: Store(str(tmp_path / "database.db")))
+    db.submit(lambda store: store.users.create(User(username="user")))
+    db.close()
+
+    store = Store(str(tmp_path / "database.db"))
+    assert [user.username for user in store.users.list()] == ["user"]
+    store.close()
+
+
+def test_held_back_writes_commit_when_idle(tmp_path, app):
+    path = str(tmp_path / "database.db")
+    db = AsyncStore(lambda: Store(path, max_pending_writes=100))
+    db.submit(lambda store: store.users.create(User(username="user"))).result()
+    db.wait()
+
+    other = Store(path)
+    assert [user.username for user in other.users.list()] == ["user"]
+    other.close()
+    db.close()
@@ -0,0 +1,122 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QMainWindow  # noqa: E402
+
+from helix import categories_screen  # noqa: E402
+from helix.async_store import AsyncStore  # noqa: E402
+from helix.models import TermGroup, User  # noqa: E402
+from helix.navigator import Navigator  # noqa: E402
+from helix.store import Store, TermGroupsStore  # noqa: E402
+
+
+@pytest.fixture
+def db(app, tmp_path, monkeypatch):
+    db = AsyncStore(lambda: Store(str(tmp_path / "database.db")))
+    monkeypatch.setattr(categories_screen, "get_async_store", lambda: db)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def user(db):
+    return db.submit(lambda store: store.users.create(User(username="user"))).result()
+
+
+def deliver(app, db):
+    # Callbacks may queue further jobs, e.g. the default category once the list is loaded
+    for _ in range(3):
+        db.wait()
+        app.processEvents()
+
+
+def open_screen(app, db, user):
+    screen = Navigator(QMainWindow()).open(categories_screen.CategoriesScreen, user)
+    deliver(app, db)
+    return screen
+
+
+def names(screen):
+    model = screen.categories_model
+    return [model.item(row).name for row in range(model.rowCount())]
+
+
+def stored_names(db, user):
+    return [group.name for group in db.submit(lambda store: store.term_groups.get_by_user_id(user.id)).result()]
+
+
+def test_default_category_added_for_new_user(app, db, user):
+    screen = open_screen(app, db, user)
+
+    assert names(screen) == ["Default"]
+    assert stored_names(db, user) == ["Default"]
+
+
+def test_no_default_category_when_user_has_one(app, db, user):
+    db.submit(lambda store: store.term_groups.create(TermGroup(name="Animals", user_id=user.id)))
+    screen = open_screen(app, db, user)
+
+    assert names(screen) == ["Animals"]
+    assert stored_names(db, user) == ["Animals"]
+
+
+def test_add_category_appends_row(app, db, user):
+    screen = open_screen(app, db, user)
+    screen.add_new_category_screen()
+    screen.category_text.setText(" Animals ")
+    screen.redirect_back()
+    deliver(app, db)
+
+    assert names(screen) == ["Default", "Animals"]
+    assert stored_names(db, user) == ["Default", "Animals"]
+    assert screen.category_text.isHidden()
+
+
+def test_delete_category_removes_row(app, db, user):
+    screen = open_screen(app, db, user)
+    screen.add_new_category("Animals")
+    deliver(app, db)
+
+    screen.delete_category(0)
+    deliver(app, db)
+
+    assert names(screen) == ["Animals"]
+    assert stored_names(db, user) == ["Animals"]
+
+
+@pytest.mark.parametrize("name", ["", "   "])
+def test_blank_category_name_is_rejected(app, db, user, name):
+    screen = open_screen(app, db, user)
+    screen.add_new_category_screen()
+    screen.category_text.setText(name)
+    screen.redirect_back()
+    deliver(app, db)
+
+    assert names(screen) == ["Default"]
+    assert stored_names(db, user) == ["Default"]
+    assert not screen.category_text.isHidden()
+
+
+def test_failed_load_is_shown(app, db, user, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(categories_screen.QMessageBox, "warning", lambda *args: warnings.append(args))
+
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(TermGroupsStore, "get_by_user_id", locked)
+        screen = open_screen(app, db, user)
+
+    assert names(screen) == []
+    assert len(warnings) == 1
+    assert "database is locked" in warnings[0][2]
+
+    screen.refresh(user)
+    deliver(app, db)
+
+    assert names(screen) == ["Default"]
+    assert len(warnings) == 1
@@ -0,0 +1,41 @@
+import pytest
+
+from helix.store import PROFILES, ConnectionProfile, Store
+
+
+def pragma(store, name):
+    return store._db.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+def test_durable_profile_is_default(tmp_path):
+    store = Store(str(tmp_path / "database.db"))
+
+    assert pragma(store, "journal_mode") == "wal"
+    assert pragma(store, "synchronous") == 2
+    assert pragma(store, "cache_size") == PROFILES["durable"].cache_size
+    store.close()
+
+
+def test_fast_profile(tmp_path):
+    store = Store(str(tmp_path / "database.db"), profile="fast")
+
+    assert pragma(store, "journal_mode") == "wal"
+    assert pragma(store, "synchronous") == 1
+    assert pragma(store, "temp_store") == 2
+    assert pragma(store, "mmap_size") == PROFILES["fast"].mmap_size
+    store.close()
+
+
+def test_custom_profile(tmp_path):
+    profile = ConnectionProfile(synchronous="OFF", foreign_keys=True)
+    store = Store(str(tmp_path / "database.db"), profile=profile)
+
+    assert pragma(store, "journal_mode") == "delete"
+    assert pragma(store, "synchronous") == 0
+    assert pragma(store, "foreign_keys") == 1
+    store.close()
+
+
+def test_unknown_profile(tmp_path):
+    with pytest.raises(ValueError, match="Unknown connection profile"):
+        Store(str(tmp_path / "database.db"), profile="reckless")
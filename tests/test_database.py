@@ -0,0 +1,43 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+import database  # noqa: E402
+import settings  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def path(tmp_path, monkeypatch):
+    path = tmp_path / "database.db"
+    monkeypatch.setattr(settings, "DATABASE", str(path))
+    yield path
+    database.close_store()
+
+
+def test_store_is_opened_lazily(path):
+    db = database.get_async_store()
+    db.wait()
+
+    assert not path.exists()
+
+    db.submit(lambda store: store.users.list()).result()
+
+    assert path.exists()
+
+
+def test_store_is_durable_by_default():
+    synchronous = database.get_async_store().submit(lambda store: store._db.execute("PRAGMA synchronous").fetchone()[0])
+
+    assert settings.DATABASE_PROFILE == "durable"
+    assert synchronous.result() == 2
+
+
+def test_async_store_is_shared_and_closed():
+    db = database.get_async_store()
+
+    assert database.get_async_store() is db
+
+    database.close_store()
+
+    assert database._async_store is None
+    assert database.get_async_store() is not db
@@ -0,0 +1,52 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QMainWindow  # noqa: E402
+
+from helix import dictionary_screen  # noqa: E402
+from helix.async_store import AsyncStore  # noqa: E402
+from helix.models import TermGroup, User  # noqa: E402
+from helix.navigator import Navigator  # noqa: E402
+from helix.store import Store, TermsStore  # noqa: E402
+
+
+@pytest.fixture
+def db(app, tmp_path, monkeypatch):
+    db = AsyncStore(lambda: Store(str(tmp_path / "database.db")))
+    monkeypatch.setattr(dictionary_screen, "get_async_store", lambda: db)
+    yield db
+    db.close()
+
+
+def deliver(app, db):
+    for _ in range(2):
+        db.wait()
+        app.processEvents()
+
+
+def test_failed_add_shows_term_again(app, db, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(dictionary_screen.QMessageBox, "warning", lambda *args: warnings.append(args))
+    user = db.submit(lambda store: store.users.create(User(username="user"))).result()
+    group = db.submit(lambda store: store.term_groups.create(TermGroup(name="group", user_id=user.id))).result()
+    screen = Navigator(QMainWindow()).open(dictionary_screen.DictionaryScreen, group, user)
+    deliver(app, db)
+
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(TermsStore, "create", locked)
+    screen.add_new_term_screen()
+    screen.word_input.setText("cat")
+    screen.definition_input.setText("meows")
+    screen.save_term()
+    deliver(app, db)
+
+    assert len(warnings) == 1
+    assert "database is locked" in warnings[0][2]
+    assert screen.terms_model.rowCount() == 0
+    assert not screen.word_input.isHidden()
+    assert (screen.word_input.text(), screen.definition_input.text()) == ("cat", "meows")
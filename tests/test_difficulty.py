@@ -0,0 +1,38 @@
+import pytest
+
+from helix.difficulty import DifficultyModel
+from helix.models import Term
+
+
+@pytest.fixture
+def model():
+    return DifficultyModel(alpha=0.5, slow_ms=10_000, slow_weight=0.5)
+
+
+def answer(model, term, *, correct, latency_ms=None):
+    term.total_ans += 1
+    model.update(term, correct=correct, latency_ms=latency_ms)
+
+
+def test_cost(model):
+    assert model.cost(correct=False, latency_ms=100) == 1.0
+    assert model.cost(correct=True, latency_ms=None) == 0.0
+    assert model.cost(correct=True, latency_ms=5_000) == 0.25
+    assert model.cost(correct=True, latency_ms=60_000) == 0.5
+
+
+def test_first_answer_starts_the_averages(model):
+    term = Term(term="term", definition="definition", group_id=1)
+    answer(model, term, correct=False, latency_ms=4_000)
+
+    assert (term.difficulty, term.latency_ms) == (1.0, 4_000)
+
+
+def test_recent_answers_weigh_most(model):
+    term = Term(term="term", definition="definition", group_id=1)
+    answer(model, term, correct=False, latency_ms=8_000)
+    answer(model, term, correct=True, latency_ms=2_000)
+    answer(model, term, correct=True)
+
+    assert term.difficulty == pytest.approx((1.0 + 0.1) / 2 / 2)
+    assert term.latency_ms == 5_000
@@ -0,0 +1,77 @@
+import random
+
+from helix.distractors import DistractorIndex
+
+
+def make_index(answers):
+    return DistractorIndex(answers, rng=random.Random(0))
+
+
+def test_pick_excludes_correct_answer():
+    index = make_index(["cat", "Cat ", "dog", "cow", "owl"])
+    picked = index.pick("cat", 3)
+
+    assert sorted(picked) == ["cow", "dog", "owl"]
+
+
+def test_pick_returns_distinct_answers():
+    index = make_index(["dog", "dog", "dog", "cow"])
+
+    assert sorted(index.pick("cat", 3)) == ["cow", "dog"]
+
+
+def test_pick_prefers_similar_lengths():
+    index = make_index(["ox", "yak", "dog", "hippopotamus", "rhinoceros"])
+
+    assert sorted(index.pick("cat", 3)) == ["dog", "ox", "yak"]
+
+
+def test_pick_falls_back_to_other_lengths():
+    index = make_index(["cat", "hippopotamus"])
+
+    assert index.pick("cat", 3) == ["hippopotamus"]
+
+
+def test_pick_skips_empty_buckets(monkeypatch):
+    index = make_index(["cat", "dog", "x" * 30_000])
+    visited = []
+    candidates = index._candidates
+    monkeypatch.setattr(index, "_candidates", lambda key, probes: visited.append(key) or candidates(key, probes))
+
+    assert sorted(index.pick("cat", 3)) == ["dog", "x" * 30_000]
+    assert visited == [1, 10_000]
+
+
+def test_pick_from_empty_index():
+    assert make_index([]).pick("cat", 3) == []
+
+
+class CountingRandom(random.Random):
+    """Random numbers that count the draws, each draw is one probe of a bucket."""
+
+    def __init__(self, seed):
+        super().__init__(seed)
+        self.draws = 0
+
+    def randrange(self, *args):
+        self.draws += 1
+        return super().randrange(*args)
+
+
+def probes_per_pick(size, picks=1_000):
+    rng = CountingRandom(0)
+    index = DistractorIndex((f"word{i}" for i in range(size)), rng=rng)
+    probes = []
+    for i in range(picks):
+        before = rng.draws
+        assert len(index.pick(f"word{i}", 3)) == 3
+        probes.append(rng.draws - before)
+    return probes
+
+
+def test_pick_cost_does_not_grow_with_group():
+    small, large = probes_per_pick(1_000), probes_per_pick(100_000)
+
+    # At most 4 * count probes of the answer's own bucket, however many answers it holds
+    assert max(large) <= 12
+    assert sum(large) <= sum(small) * 1.1
@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+HELIX = Path(__file__).parent.parent / "helix"
+OWN_MODULES = {path.stem for path in HELIX.glob("*.py")}
+
+# Microseconds, generous so slow machines pass, yet far below loading a second Qt binding or every screen
+STARTUP_BUDGET = 2_000_000
+OWN_MODULES_BUDGET = 200_000
+
+
+def import_times(module):
+    """Import a module in a new interpreter and return the self and cumulative import time of every module."""
+    env = {**os.environ, "PYTHONPATH": str(HELIX), "QT_QPA_PLATFORM": "offscreen"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=HELIX,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+@pytest.fixture(scope="module")
+def startup():
+    # The first run compiles the modules, only the second one is measured
+    import_times("main")
+    return import_times("main")
+
+
+def test_startup_loads_only_first_screen(startup):
+    assert {name for name in startup if name.endswith("_screen")} == {"start_screen"}
+    assert "quiz" not in startup
+    assert "transfer" not in startup
+
+
+def test_startup_loads_one_qt_binding(startup):
+    assert "PySide6.QtWidgets" in startup
+    assert not any(name.split(".")[0] == "PyQt5" for name in startup)
+
+
+def test_startup_within_budget(startup):
+    assert startup["main"][1] < STARTUP_BUDGET
+    assert sum(own for name, (own, _) in startup.items() if name in OWN_MODULES) < OWN_MODULES_BUDGET
@@ -0,0 +1,145 @@
+from dataclasses import dataclass
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import Qt  # noqa: E402
+
+from helix.list_view import ItemRole, LazyListModel  # noqa: E402
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+
+
+@pytest.fixture
+def rows():
+    return [Row(id=i, name=f"row {i}") for i in range(1, 6)]
+
+
+@pytest.fixture
+def model(rows):
+    calls = []
+
+    def fetch_page(after_id, limit, deliver):
+        calls.append(after_id)
+        deliver([row for row in rows if row.id > after_id][:limit])
+
+    model = LazyListModel(fetch_page, lambda row: row.name, page_size=2)
+    model.calls = calls
+    return model
+
+
+def test_fetches_one_page_at_a_time(model):
+    model.reload()
+
+    assert model.rowCount() == 2
+    assert model.canFetchMore()
+
+    model.fetchMore()
+    model.fetchMore()
+
+    assert model.rowCount() == 5
+    assert not model.canFetchMore()
+    assert model.calls == [0, 2, 4]
+
+
+def test_data(model, rows):
+    model.reload()
+    index = model.index(1)
+
+    assert model.data(index) == "row 2"
+    assert model.data(index, ItemRole) is rows[1]
+    assert model.data(index, Qt.ItemDataRole.ToolTipRole) is None
+
+
+def test_append_waits_for_last_page(model):
+    model.reload()
+    model.append_item(Row(id=6, name="row 6"))
+
+    assert model.rowCount() == 2
+
+    model.fetchMore()
+    model.fetchMore()
+    model.append_item(Row(id=7, name="row 7"))
+
+    assert model.rowCount() == 6
+    assert model.item(5).name == "row 7"
+
+
+def test_update_and_remove_single_rows(model):
+    model.reload()
+    changed = []
+    model.dataChanged.connect(lambda first, last: changed.append((first.row(), last.row())))
+    model.update_row(1, Row(id=2, name="renamed"))
+    model.remove_row(0)
+
+    assert changed == [(1, 1)]
+    assert [model.item(row).name for row in range(model.rowCount())] == ["renamed"]
+
+
+def test_pages_delivered_later(rows):
+    pending = []
+    model = LazyListModel(lambda after_id, limit, deliver: pending.append((after_id, deliver)), lambda row: row.name, 2)
+    loaded = []
+    model.page_loaded.connect(lambda: loaded.append(model.rowCount()))
+    model.reload()
+    model.fetchMore()
+
+    assert len(pending) == 1
+    assert model.rowCount() == 0
+
+    pending.pop()[1](rows[:2])
+    model.fetchMore()
+
+    assert model.rowCount() == 2
+    assert loaded == [2]
+    assert pending[0][0] == 2
+
+
+def test_reload_drops_pages_requested_before(rows):
+    pending = []
+    model = LazyListModel(lambda after_id, limit, deliver: pending.append(deliver), lambda row: row.name, 2)
+    model.reload()
+    model.reload(lambda after_id, limit, deliver: deliver(rows[3:]))
+    pending[0](rows[:2])
+
+    assert [model.item(row).name for row in range(model.rowCount())] == ["row 4", "row 5"]
+
+
+def test_failed_page_is_fetched_again_on_reload(rows):
+    pending = []
+    model = LazyListModel(lambda after_id, limit, deliver: pending.append(deliver), lambda row: row.name, 2)
+    failures = []
+    model.load_failed.connect(failures.append)
+    model.reload()
+    error = RuntimeError("database is locked")
+    pending.pop()(error)
+
+    assert failures == [error]
+    assert not model.canFetchMore()
+    model.fetchMore()
+    assert pending == []
+
+    model.reload()
+    pending.pop()(rows[:2])
+
+    assert model.rowCount() == 2
+    assert model.canFetchMore()
+
+
+def test_reload_drops_failures_of_pages_requested_before(rows):
+    pending = []
+    model = LazyListModel(lambda after_id, limit, deliver: pending.append(deliver), lambda row: row.name, 2)
+    failures = []
+    model.load_failed.connect(failures.append)
+    model.reload()
+    model.reload()
+    pending[0](RuntimeError("database is locked"))
+    pending[1](rows[:2])
+
+    assert failures == []
+    assert model.rowCount() == 2
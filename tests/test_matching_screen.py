@@ -0,0 +1,65 @@
+import random
+import sqlite3
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QMainWindow  # noqa: E402
+
+from helix import matching_screen  # noqa: E402
+from helix.async_store import AsyncStore  # noqa: E402
+from helix.models import Term  # noqa: E402
+from helix.navigator import Navigator  # noqa: E402
+from helix.store import Store  # noqa: E402
+
+
+class LockedQuiz:
+    points = 1
+
+    def update_mastery_many(self, answers):
+        raise sqlite3.OperationalError("database is locked")
+
+
+@pytest.fixture
+def db(app, tmp_path, monkeypatch):
+    db = AsyncStore(lambda: Store(str(tmp_path / "database.db")))
+    monkeypatch.setattr(matching_screen, "get_async_store", lambda: db)
+    yield db
+    db.close()
+
+
+def test_failed_round_save_is_shown(app, db, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(matching_screen.QMessageBox, "warning", lambda *args: warnings.append(args))
+    screen = matching_screen.MatchingScreen()
+    screen.setup_ui(Navigator(QMainWindow()))
+    screen.quiz = LockedQuiz()
+    screen.category_id = 1
+    screen.rounds_left = 3
+    screen.answered = 0
+    screen.round = [Term("cat", "meows", 1, id=1), Term("dog", "barks", 1, id=2)]
+    screen.missed = {2}
+
+    screen.finish_round()
+    db.wait()
+    app.processEvents()
+
+    assert len(warnings) == 1
+    assert "database is locked" in warnings[0][2]
+    assert not screen.final_label.isHidden()
+    assert screen.score_label.text() == "Score: 1/2"
+
+
+def test_same_definition_matches_either_term(app, db):
+    screen = matching_screen.MatchingScreen()
+    screen.setup_ui(Navigator(QMainWindow()))
+    screen.quiz = type("Quiz", (), {"rng": random.Random(0)})()
+    cat, kitten, dog = Term("cat", "pet", 1, id=1), Term("kitten", "pet", 1, id=2), Term("dog", "barks", 1, id=3)
+    screen.show_round([cat, kitten, dog])
+
+    screen.on_term_clicked(0)
+    screen.on_definition_clicked(screen.definitions.index(kitten))
+
+    assert screen.missed == set()
+    assert screen.message_label.text() == "Correct!"
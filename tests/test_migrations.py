@@ -0,0 +1,124 @@
+import sqlite3
+
+import pytest
+
+from helix.migrations import MIGRATIONS, migrate, schema_version
+from helix.models import content_hash
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+def index_names(connection):
+    rows = connection.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")
+    return {row[0] for row in rows}
+
+
+def test_migrate_fresh_database(connection):
+    version = migrate(connection)
+
+    assert version == len(MIGRATIONS)
+    assert schema_version(connection) == len(MIGRATIONS)
+    assert {"terms_group_id", "term_groups_user_id", "points_user_id"} <= index_names(connection)
+
+
+def test_migrate_is_noop_when_up_to_date(connection):
+    migrate(connection)
+    connection.execute("DROP INDEX terms_group_id")
+    migrate(connection)
+
+    assert "terms_group_id" not in index_names(connection)
+
+
+def test_migrate_upgrades_legacy_database_in_place(connection):
+    connection.execute("""CREATE TABLE terms (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        group_id INTEGER,
+        term TEXT,
+        definition TEXT,
+        mastery_coef INTEGER,
+        total_ans INTEGER,
+        correct_ans INTEGER
+    )""")
+    connection.execute("INSERT INTO terms (group_id, term, definition) VALUES (1, 'term', 'definition')")
+    connection.commit()
+
+    migrate(connection)
+
+    assert connection.execute("SELECT term, definition FROM terms").fetchall() == [("term", "definition")]
+    assert "terms_group_id" in index_names(connection)
+    assert connection.execute("SELECT rowid FROM terms_fts WHERE terms_fts MATCH 'definition'").fetchall() == [(1,)]
+
+
+def test_group_lookup_uses_index(connection):
+    migrate(connection)
+    plan = connection.execute("EXPLAIN QUERY PLAN SELECT id FROM terms WHERE group_id = ?", (1,)).fetchall()
+
+    assert "terms_group_id" in plan[0][3]
+
+
+def test_due_lookup_uses_index(connection):
+    migrate(connection)
+    plan = connection.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM terms WHERE group_id = ? AND due_at <= ? ORDER BY due_at", (1, 0)
+    ).fetchall()
+
+    assert "terms_group_id_due_at" in plan[0][3]
+    assert all("TEMP B-TREE" not in row[3] for row in plan)
+
+
+def test_migrate_backfills_content_hash(connection):
+    connection.execute("""CREATE TABLE terms (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        group_id INTEGER,
+        term TEXT,
+        definition TEXT,
+        mastery_coef INTEGER,
+        total_ans INTEGER,
+        correct_ans INTEGER
+    )""")
+    connection.execute("INSERT INTO terms (group_id, term, definition) VALUES (1, 'Term', 'definition')")
+    connection.commit()
+
+    migrate(connection)
+
+    assert connection.execute("SELECT content_hash FROM terms").fetchone()[0] == content_hash("term ", "definition")
+
+
+def test_migrate_sums_points_into_user_stats(connection):
+    connection.execute("CREATE TABLE points (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER, points INTEGER)")
+    connection.executemany("INSERT INTO points (user_id, points) VALUES (?, ?)", [(1, 3), (1, 4), (2, 5), (None, 9)])
+    connection.commit()
+
+    migrate(connection)
+
+    assert connection.execute("SELECT user_id, points FROM user_stats ORDER BY user_id").fetchall() == [(1, 7), (2, 5)]
+
+
+def test_migrate_rolls_up_term_totals_per_group(connection):
+    connection.execute("CREATE TABLE term_groups (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER, name TEXT)")
+    connection.execute("""CREATE TABLE terms (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        group_id INTEGER,
+        term TEXT,
+        definition TEXT,
+        mastery_coef INTEGER,
+        total_ans INTEGER,
+        correct_ans INTEGER
+    )""")
+    connection.executemany("INSERT INTO term_groups (user_id, name) VALUES (?, ?)", [(1, "a"), (1, "b")])
+    connection.executemany(
+        "INSERT INTO terms (group_id, term, definition, total_ans, correct_ans) VALUES (?, 't', 'd', ?, ?)",
+        [(1, 3, 2), (1, 4, 1), (2, 0, 0)],
+    )
+    connection.commit()
+
+    migrate(connection)
+
+    assert connection.execute("SELECT user_id, group_id, answers, correct FROM group_stats").fetchall() == [
+        (1, 1, 7, 3)
+    ]
@@ -0,0 +1,93 @@
+import pytest
+
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from helix.navigator import Navigator  # noqa: E402
+from helix.settings import SCREEN_SIZE  # noqa: E402
+
+
+class FakeScreen:
+    built = 0
+
+    def setup_ui(self, navigator):
+        type(self).built += 1
+        self.navigator = navigator
+        self.centralwidget = QtWidgets.QWidget()
+        self.refreshed = []
+
+    def refresh(self, *args):
+        self.refreshed.append(args)
+
+
+def make_screen_types(count):
+    return [type(f"Screen{number}", (FakeScreen,), {"built": 0}) for number in range(count)]
+
+
+@pytest.fixture
+def window(app):
+    window = QtWidgets.QMainWindow()
+    yield window
+    window.deleteLater()
+
+
+def test_open_builds_screen_once(window):
+    navigator = Navigator(window)
+    (screen_type,) = make_screen_types(1)
+
+    first = navigator.open(screen_type, "a")
+    second = navigator.open(screen_type, "b", 2)
+
+    assert first is second
+    assert screen_type.built == 1
+    assert first.refreshed == [("a",), ("b", 2)]
+    assert first.navigator is navigator
+
+
+def test_open_shows_screen(window):
+    navigator = Navigator(window)
+    first_type, second_type = make_screen_types(2)
+
+    first = navigator.open(first_type)
+    second = navigator.open(second_type)
+    assert navigator.stack.currentWidget() is second.centralwidget
+
+    navigator.open(first_type)
+    assert navigator.stack.currentWidget() is first.centralwidget
+    assert navigator.stack.count() == 2
+
+
+def test_window_has_screen_size(window):
+    Navigator(window)
+
+    assert (window.minimumWidth(), window.minimumHeight()) == SCREEN_SIZE
+    assert (window.maximumWidth(), window.maximumHeight()) == SCREEN_SIZE
+
+
+def test_least_recently_used_screen_is_dropped(window):
+    navigator = Navigator(window, capacity=2)
+    first_type, second_type, third_type = make_screen_types(3)
+
+    first = navigator.open(first_type)
+    navigator.open(second_type)
+    navigator.open(first_type)
+    navigator.open(third_type)
+
+    assert first_type in navigator
+    assert second_type not in navigator
+    assert third_type in navigator
+    assert navigator.stack.count() == 2
+    assert navigator.stack.indexOf(first.centralwidget) != -1
+
+    navigator.open(second_type)
+    assert second_type.built == 2
+
+
+def test_opened_screen_is_kept(window):
+    navigator = Navigator(window, capacity=0)
+    first_type, second_type = make_screen_types(2)
+
+    navigator.open(first_type)
+    second = navigator.open(second_type)
+
+    assert first_type not in navigator
+    assert navigator.stack.currentWidget() is second.centralwidget
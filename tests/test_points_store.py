@@ -60,3 +60,35 @@ def test_delete_point(store):
     deleted_point = store.get(created_point.id)
 
     assert deleted_point is None
+
+
+def test_create_many_points(store):
+    points = [Point(user_id=i, points=i * 10) for i in range(1, 4)]
+    ids = store.create_many(points)
+
+    assert ids == [point.id for point in points]
+    assert store.get(ids[2]).points == 30
+
+
+def test_update_many_points(store):
+    points = [Point(user_id=i, points=0) for i in range(1, 3)]
+    store.create_many(points)
+    for point in points:
+        point.points = 5
+    store.update_many(points)
+
+    assert [point.points for point in store.list()] == [5, 5]
+
+
+def test_delete_many_points(store):
+    points = [Point(user_id=i, points=0) for i in range(1, 4)]
+    ids = store.create_many(points)
+    store.delete_many(ids[1:])
+
+    assert [point.user_id for point in store.list()] == [1]
+
+
+def test_stream_points(store):
+    store.create_many([Point(user_id=i, points=0) for i in range(3)])
+
+    assert [len(batch) for batch in store.stream(batch_size=1)] == [1, 1, 1]
@@ -0,0 +1,127 @@
+import random
+
+import pytest
+
+from helix.models import Term, TermGroup, User
+from helix.quiz import MODE_CHOICE, MODE_WEAK, REVIEW_LIMIT, Quiz
+from helix.store import Store
+
+
+@pytest.fixture
+def store():
+    store = Store(":memory:")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def group(store):
+    user = store.users.create(User(username="user"))
+    group = store.term_groups.create(TermGroup(user_id=user.id, name="group"))
+    store.terms.create_many([Term(group_id=group.id, term=f"term{i}", definition=f"definition{i}") for i in range(10)])
+    return group
+
+
+@pytest.fixture
+def quiz(store, group):
+    return Quiz(store, group.user_id, rng=random.Random(0))
+
+
+def test_get_choices(quiz, group):
+    term = quiz.store.terms.get_by_group_id(group.id, limit=1)[0]
+    choices = quiz.get_choices(term)
+
+    assert len(choices) == 4
+    assert term.term in choices
+    assert len(set(choices)) == 4
+
+
+def test_matching_round_is_written_at_once(quiz, group, monkeypatch):
+    terms = quiz.get_matching_round(group.id)
+    updates = []
+    monkeypatch.setattr(quiz.store.terms, "update", updates.append)
+    quiz.update_mastery_many([(term, term is not terms[0]) for term in terms], now=0)
+
+    assert updates == []
+    assert quiz.points == len(terms) - 1
+    fetched = {term.id: term for term in quiz.store.terms.get_by_group_id(group.id)}
+    assert [(fetched[term.id].total_ans, fetched[term.id].correct_ans) for term in terms] == [(1, 0)] + [(1, 1)] * (
+        len(terms) - 1
+    )
+
+
+def test_matching_rounds_do_not_repeat_terms(quiz, group):
+    rounds = [quiz.get_matching_round(group.id) for _ in range(4)]
+
+    assert [len(terms) for terms in rounds] == [4, 4, 2, 0]
+    ids = [term.id for terms in rounds for term in terms]
+    assert sorted(ids) == quiz.store.terms.get_ids_by_group_id(group.id)
+    assert ids != sorted(ids)
+
+
+def test_check_answer_tolerates_typos(quiz):
+    assert quiz.check_answer("elephnat", "elephant")
+    assert not quiz.check_choice("elephnat", "elephant")
+
+
+def test_prefetched_questions_are_reused(store, group):
+    quiz = Quiz(store, group.user_id, rng=random.Random(0), mode=MODE_CHOICE)
+    terms = quiz.store.terms.get_by_group_id(group.id, limit=3)
+    quiz.prefetch(terms)
+    prepared = [quiz.question(term) for term in terms]
+
+    assert [question.term for question in prepared] == terms
+    assert all(len(question.choices) == 4 for question in prepared)
+    assert quiz.question(terms[0]) is not prepared[0]
+
+
+def test_write_questions_have_no_choices(quiz, group):
+    term = quiz.store.terms.get_by_group_id(group.id, limit=1)[0]
+
+    assert quiz.question(term).choices == []
+
+
+def test_update_user_points_records_the_session(quiz, group):
+    terms = quiz.store.terms.get_by_group_id(group.id, limit=3)
+    for term, correct in zip(terms, [True, False, True], strict=True):
+        quiz.update_mastery(term, correct=correct)
+    quiz.update_user_points()
+    quiz.update_user_points()
+
+    stats = quiz.store.user_stats.get(group.user_id)
+    assert (stats.points, stats.answers, stats.correct, stats.streak) == (4, 6, 4, 1)
+    assert quiz.store.points.list() == []
+
+
+def test_answers_are_logged_and_rolled_up(quiz, group):
+    term = quiz.store.terms.get_by_group_id(group.id, limit=1)[0]
+    quiz.update_mastery(term, correct=True, now=100)
+    quiz.update_mastery(term, correct=False, now=200)
+    fetched = quiz.store.terms.get(term.id)
+
+    assert [(answer.answered_at, answer.correct) for answer in quiz.store.answers.get_by_term_id(term.id)] == [
+        (100, True),
+        (200, False),
+    ]
+    assert (fetched.total_ans, fetched.correct_ans, fetched.mastery_coef) == (2, 1, 0.5)
+    assert (fetched.total_ans, fetched.correct_ans, fetched.due_at) == (term.total_ans, term.correct_ans, term.due_at)
+
+
+def test_latency_feeds_the_difficulty(quiz, group):
+    term = quiz.store.terms.get_by_group_id(group.id, limit=1)[0]
+    quiz.save_answers([(term, quiz.score_answer(term, correct=True, now=100, latency_ms=20_000))])
+    fetched = quiz.store.terms.get(term.id)
+
+    assert quiz.store.answers.get_by_term_id(term.id)[0].latency_ms == 20_000
+    assert (fetched.difficulty, fetched.latency_ms) == (0.5, 20_000)
+
+
+def test_weak_mode_draws_from_the_whole_group(store, group):
+    quiz = Quiz(store, group.user_id, rng=random.Random(0), mode=MODE_WEAK)
+    terms = quiz.get_quiz_terms(group.id)
+    for term in terms[1:]:
+        term.mastery_coef = 1.0
+    queue = quiz.review_queue(terms)
+
+    assert len(queue) == min(len(terms), REVIEW_LIMIT)
+    assert sum(queue.pop().id == terms[0].id for _ in range(3)) == 1
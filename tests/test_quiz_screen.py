@@ -0,0 +1,77 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QMainWindow  # noqa: E402
+
+from helix import quiz_screen  # noqa: E402
+from helix.async_store import AsyncStore  # noqa: E402
+from helix.models import Term, TermGroup, User  # noqa: E402
+from helix.navigator import Navigator  # noqa: E402
+from helix.quiz import MODE_WRITE  # noqa: E402
+from helix.store import Store  # noqa: E402
+
+
+class LockedQuiz:
+    def save_answers(self, batch):
+        raise sqlite3.OperationalError("database is locked")
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "database.db")
+
+
+@pytest.fixture
+def db(app, path, monkeypatch):
+    db = AsyncStore(lambda: Store(path))
+    monkeypatch.setattr(quiz_screen, "get_async_store", lambda: db)
+    yield db
+    db.close()
+
+
+def test_failed_save_is_shown_and_kept(app, db, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(quiz_screen.QMessageBox, "warning", lambda *args: warnings.append(args))
+    screen = quiz_screen.QuizScreen()
+    screen.setup_ui(Navigator(QMainWindow()))
+    screen.quiz = LockedQuiz()
+    screen.unsaved = [("first", "answer"), ("second", "answer")]
+
+    screen.save_answers()
+    screen.unsaved.append(("third", "answer"))
+    db.wait()
+    app.processEvents()
+
+    assert len(warnings) == 1
+    assert "database is locked" in warnings[0][2]
+    assert screen.unsaved == [("first", "answer"), ("second", "answer"), ("third", "answer")]
+
+
+def test_answers_are_kept_when_closed_mid_quiz(app, path, monkeypatch):
+    # Closed by the test like on quit, instead of by a fixture
+    db = AsyncStore(lambda: Store(path))
+    monkeypatch.setattr(quiz_screen, "get_async_store", lambda: db)
+    user = db.submit(lambda store: store.users.create(User(username="user"))).result()
+    group = db.submit(lambda store: store.term_groups.create(TermGroup(name="group", user_id=user.id))).result()
+    db.submit(
+        lambda store: store.terms.create_many(
+            [Term(term=f"term{i}", definition=f"definition{i}", group_id=group.id) for i in range(5)]
+        )
+    )
+    screen = Navigator(QMainWindow()).open(quiz_screen.QuizScreen, group.id, user, MODE_WRITE)
+    db.wait()
+    app.processEvents()
+
+    for _ in range(3):
+        screen.term_input.setText(screen.term.term)
+        screen.on_submit()
+    # Quitting closes the store right away, without waiting for more answers
+    db.close()
+
+    store = Store(path)
+    assert store._db.execute("SELECT COUNT(*), SUM(correct) FROM answers").fetchone() == (3, 3)
+    assert sum(term.total_ans for term in store.terms.get_by_group_id(group.id)) == 3
+    store.close()
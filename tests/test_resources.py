@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from helix import resources  # noqa: E402
+
+
+def test_assets_are_decoded_once(app):
+    pixmap = resources.get_pixmap("plus.png")
+
+    assert not pixmap.isNull()
+    assert resources.get_pixmap("plus.png") is pixmap
+    assert resources.get_icon("plus.png") is resources.get_icon("plus.png")
+
+
+def test_missing_asset_gives_an_empty_pixmap(app, caplog):
+    assert resources.get_pixmap("missing.png").isNull()
+    assert "missing.png" in caplog.text
+
+
+def test_fonts_are_shared(app):
+    font = resources.get_font("Helvetica", 25, bold=True)
+
+    assert resources.get_font("Helvetica", 25, bold=True) is font
+    assert (font.pointSize(), font.bold(), font.italic()) == (25, True, False)
+    assert resources.get_font("Helvetica", 25) is not font
+
+
+def test_bundle_holds_every_asset():
+    assets = Path(__file__).parent.parent / "assets"
+    bundled = set((assets / "assets.qrc").read_text().split())
+
+    assert all(f"<file>{path.name}</file>" in bundled for path in assets.glob("*.png"))
@@ -0,0 +1,75 @@
+import random
+from collections import Counter
+
+import pytest
+
+from helix.models import Term
+from helix.sampling import MIN_WEIGHT, WEIGHT_SCALE, FenwickTree, WeakTermsQueue, weakness
+
+
+def make_terms(*masteries):
+    return [
+        Term(term=f"term{i}", definition="definition", group_id=1, mastery_coef=mastery, id=i + 1)
+        for i, mastery in enumerate(masteries)
+    ]
+
+
+def test_weakness():
+    new, mastered = make_terms(0.0, 1.0)
+
+    assert (weakness(new), weakness(mastered)) == (WEIGHT_SCALE + MIN_WEIGHT, MIN_WEIGHT)
+
+
+def test_fenwick_tree_finds_cumulative_ranges():
+    tree = FenwickTree([3, 0, 2, 5])
+
+    assert tree.total == 10
+    assert [tree.find(target) for target in range(10)] == [0, 0, 0, 2, 2, 3, 3, 3, 3, 3]
+
+
+def test_fenwick_tree_update():
+    tree = FenwickTree([1] * 7)
+    tree.update(3, 0)
+    tree.update(6, 4)
+
+    assert tree.total == 9
+    assert [tree.find(target) for target in range(9)] == [0, 1, 2, 4, 5, 6, 6, 6, 6]
+
+
+def test_sampling_follows_the_weights():
+    tree, rng = FenwickTree([1, 3, 0, 6]), random.Random(0)
+    counts = Counter(tree.sample(rng) for _ in range(10_000))
+
+    assert counts[2] == 0
+    assert counts[3] / 10_000 == pytest.approx(0.6, abs=0.03)
+    assert counts[1] / 10_000 == pytest.approx(0.3, abs=0.03)
+
+
+def test_weak_terms_come_first():
+    firsts = Counter(WeakTermsQueue(make_terms(1.0, 0.0, 0.9), rng=random.Random(seed)).pop().id for seed in range(500))
+
+    assert firsts.most_common(1)[0][0] == 2
+    assert firsts[1] < firsts[3] < firsts[2]
+
+
+def test_queue_asks_each_term_once_up_to_its_length():
+    queue = WeakTermsQueue(make_terms(*[0.5] * 10), length=4, rng=random.Random(1))
+    upcoming = queue.upcoming(2)
+    drawn = [queue.pop() for _ in range(len(queue))]
+
+    assert len(drawn) == 4
+    assert drawn[:2] == upcoming
+    assert len({term.id for term in drawn}) == 4
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+def test_pushed_term_is_asked_again():
+    queue = WeakTermsQueue(make_terms(0.0), rng=random.Random(0))
+    term = queue.pop()
+    term.mastery_coef = 0.5
+    queue.push(term)
+
+    assert len(queue) == 1
+    assert queue.pop() is term
+    assert not queue
@@ -0,0 +1,82 @@
+import pytest
+
+from helix.models import Term
+from helix.scheduler import DAY, QUALITY_CORRECT, QUALITY_INCORRECT, ReviewQueue, Scheduler
+
+
+@pytest.fixture
+def scheduler():
+    return Scheduler()
+
+
+def make_term(**kwargs):
+    return Term(term="term", definition="definition", group_id=1, **kwargs)
+
+
+def test_correct_answers_grow_interval(scheduler):
+    term = make_term()
+    intervals = []
+    for day in range(4):
+        scheduler.review(term, QUALITY_CORRECT, now=day * DAY)
+        intervals.append(term.interval_days)
+
+    assert intervals[:2] == [1.0, 6.0]
+    assert intervals[2] == pytest.approx(6.0 * term.ease, rel=0.05)
+    assert intervals[3] > intervals[2]
+    assert term.repetitions == 4
+    assert term.due_at == 3 * DAY + round(term.interval_days * DAY)
+
+
+def test_ease_drops_for_hard_answers(scheduler):
+    term = make_term()
+    scheduler.review(term, 3, now=0)
+
+    assert term.ease < 2.5
+
+
+def test_ease_has_a_floor(scheduler):
+    term = make_term(ease=1.3)
+    scheduler.review(term, 3, now=0)
+
+    assert term.ease == 1.3
+
+
+def test_lapse_restarts_repetitions(scheduler):
+    term = make_term(repetitions=3, interval_days=15.0, ease=2.2)
+    scheduler.review(term, QUALITY_INCORRECT, now=1000)
+
+    assert term.repetitions == 0
+    assert term.interval_days == 0.0
+    assert term.ease == 2.2
+    assert term.due_at == 1000 + scheduler.relearn_delay
+
+
+def test_review_queue_orders_by_due_time():
+    terms = [make_term(id=1, due_at=30), make_term(id=2, due_at=10), make_term(id=3, due_at=10)]
+    queue = ReviewQueue(terms)
+
+    assert len(queue) == 3
+    assert queue.peek().id == 2
+
+    queue.push(make_term(id=4, due_at=20))
+
+    assert [queue.pop().id for _ in range(len(queue))] == [2, 3, 4, 1]
+    assert not queue
+    assert queue.peek() is None
+
+
+def test_review_queue_upcoming():
+    queue = ReviewQueue([make_term(id=i, due_at=10 - i) for i in range(1, 6)])
+
+    assert [term.id for term in queue.upcoming(3)] == [5, 4, 3]
+    assert len(queue) == 5
+    assert [term.id for term in queue.upcoming(10)] == [5, 4, 3, 2, 1]
+
+
+def test_hard_terms_are_due_sooner(scheduler):
+    easy, hard = make_term(), make_term(difficulty=1.0)
+    for term in (easy, hard):
+        scheduler.review(term, QUALITY_CORRECT, now=0)
+
+    assert easy.interval_days == hard.interval_days
+    assert hard.due_at == easy.due_at // 2
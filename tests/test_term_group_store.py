@@ -57,3 +57,36 @@ def test_delete_group(store):
     deleted_group = store.get(created_group.id)
 
     assert deleted_group is None
+
+
+def test_create_many_groups(store):
+    groups = [TermGroup(user_id=1, name=f"Group {i}") for i in range(3)]
+    ids = store.create_many(groups)
+
+    assert ids == [group.id for group in groups]
+    assert store.get(ids[1]).name == "Group 1"
+
+
+def test_update_many_groups(store):
+    groups = [TermGroup(user_id=1, name=f"Group {i}") for i in range(2)]
+    store.create_many(groups)
+    for group in groups:
+        group.user_id = 2
+    store.update_many(groups)
+
+    assert [group.name for group in store.get_by_user_id(2)] == ["Group 0", "Group 1"]
+
+
+def test_delete_many_groups(store):
+    groups = [TermGroup(user_id=1, name=f"Group {i}") for i in range(3)]
+    ids = store.create_many(groups)
+    store.delete_many(ids)
+
+    assert store.list() == []
+
+
+def test_stream_by_user_id(store):
+    store.create_many([TermGroup(user_id=i % 2, name=f"Group {i}") for i in range(5)])
+    batches = list(store.stream_by_user_id(0, batch_size=2))
+
+    assert [[group.name for group in batch] for batch in batches] == [["Group 0", "Group 2"], ["Group 4"]]
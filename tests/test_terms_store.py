@@ -1,6 +1,6 @@
 import pytest
 
-from helix.models import Term
+from helix.models import Term, content_hash
 from helix.store import TermsStore
 
 
@@ -106,3 +106,184 @@ def test_delete_term(store):
     deleted_term = store.get(created_term.id)
 
     assert deleted_term is None
+
+
+def test_create_many_terms(store):
+    terms = [Term(group_id=1, term=f"Term {i}", definition=f"Definition {i}") for i in range(3)]
+    ids = store.create_many(terms)
+
+    assert ids == [term.id for term in terms]
+    assert [term.term for term in store.get_by_group_id(1)] == ["Term 0", "Term 1", "Term 2"]
+    assert store.get(ids[1]).definition == "Definition 1"
+
+
+def test_create_many_terms_empty(store):
+    assert store.create_many([]) == []
+
+
+def test_update_many_terms(store):
+    terms = [Term(group_id=1, term=f"Term {i}", definition=f"Definition {i}") for i in range(2)]
+    store.create_many(terms)
+    for term in terms:
+        term.total_ans = 2
+        term.correct_ans = 1
+        term.mastery_coef = 0.5
+    store.update_many(terms)
+
+    assert [(term.total_ans, term.correct_ans, term.mastery_coef) for term in store.list()] == [(2, 1, 0.5)] * 2
+
+
+def test_delete_many_terms(store):
+    terms = [Term(group_id=1, term=f"Term {i}", definition=f"Definition {i}") for i in range(3)]
+    ids = store.create_many(terms)
+    store.delete_many([ids[0], ids[2]])
+
+    assert [term.term for term in store.list()] == ["Term 1"]
+
+
+def test_list_terms_paginated(store):
+    terms = [Term(group_id=1, term=f"Term {i}", definition=f"Definition {i}") for i in range(5)]
+    store.create_many(terms)
+    first_page = store.list(limit=2)
+    second_page = store.list(after_id=first_page[-1].id, limit=2)
+
+    assert [term.term for term in first_page] == ["Term 0", "Term 1"]
+    assert [term.term for term in second_page] == ["Term 2", "Term 3"]
+
+
+def test_get_by_group_id_paginated(store):
+    store.create_many([Term(group_id=i % 2, term=f"Term {i}", definition="") for i in range(6)])
+    page = store.get_by_group_id(1, limit=2)
+    next_page = store.get_by_group_id(1, after_id=page[-1].id, limit=2)
+
+    assert [term.term for term in page] == ["Term 1", "Term 3"]
+    assert [term.term for term in next_page] == ["Term 5"]
+
+
+def test_stream_by_group_id(store):
+    store.create_many([Term(group_id=i % 2, term=f"Term {i}", definition="") for i in range(10)])
+    batches = list(store.stream_by_group_id(0, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [term.term for batch in batches for term in batch] == [f"Term {i}" for i in range(0, 10, 2)]
+
+
+def test_stream_terms_exact_batches(store):
+    store.create_many([Term(group_id=1, term=f"Term {i}", definition="") for i in range(4)])
+
+    assert [len(batch) for batch in store.stream(batch_size=2)] == [2, 2]
+    assert list(store.stream_by_group_id(2)) == []
+
+
+def test_get_due(store):
+    store.create_many(
+        [
+            Term(group_id=1, term="later", definition="", due_at=300),
+            Term(group_id=1, term="overdue", definition="", due_at=50),
+            Term(group_id=1, term="new", definition=""),
+            Term(group_id=2, term="other group", definition="", due_at=0),
+        ]
+    )
+
+    assert [term.term for term in store.get_due(1, due_before=100)] == ["new", "overdue"]
+    assert [term.term for term in store.get_due(1, due_before=1000, limit=2)] == ["new", "overdue"]
+
+
+def test_schedule_is_persisted(store):
+    term = store.create(Term(group_id=1, term="term", definition=""))
+    term.due_at = 86400
+    term.interval_days = 1.0
+    term.ease = 2.6
+    term.repetitions = 1
+    store.update(term)
+    fetched = store.get(term.id)
+
+    assert (fetched.due_at, fetched.interval_days, fetched.ease, fetched.repetitions) == (86400, 1.0, 2.6, 1)
+
+
+def test_get_words_by_group_id(store):
+    store.create_many(
+        [
+            Term(group_id=1, term="first", definition=""),
+            Term(group_id=2, term="other group", definition=""),
+            Term(group_id=1, term="second", definition=""),
+        ]
+    )
+
+    assert store.get_words_by_group_id(1) == ["first", "second"]
+
+
+def test_get_ids_by_group_id(store):
+    ids = store.create_many([Term(group_id=1 + i % 2, term=f"term{i}", definition="") for i in range(6)])
+
+    assert store.get_ids_by_group_id(1) == ids[::2]
+    assert store.get_ids_by_group_id(3) == []
+
+
+def test_get_many_keeps_order_of_ids(store):
+    ids = store.create_many([Term(group_id=1, term=f"term{i}", definition="") for i in range(4)])
+    store.delete(ids[1])
+
+    assert [term.term for term in store.get_many([ids[3], ids[1], ids[0]])] == ["term3", "term0"]
+
+
+def test_search(store):
+    store.create_many(
+        [
+            Term(group_id=1, term="photosynthesis", definition="how plants make food from light"),
+            Term(group_id=1, term="chlorophyll", definition="green pigment used in photosynthesis"),
+            Term(group_id=2, term="photon", definition="particle of light"),
+            Term(group_id=1, term="café", definition="coffee shop"),
+        ]
+    )
+
+    assert [term.term for term in store.search("photosynthesis")] == ["photosynthesis", "chlorophyll"]
+    found = [term.term for term in store.search("pho")]
+    assert sorted(found[:2]) == ["photon", "photosynthesis"]
+    assert found[2] == "chlorophyll"
+    assert [term.term for term in store.search("pho", group_id=2)] == ["photon"]
+    assert [term.term for term in store.search("light plant")] == ["photosynthesis"]
+    assert [term.term for term in store.search("CAFE")] == ["café"]
+    assert len(store.search("pho", limit=1)) == 1
+    assert store.search('" OR *') == []
+
+
+def test_search_follows_edits(store):
+    term = store.create(Term(group_id=1, term="cat", definition="meows"))
+    term.term = "dog"
+    store.update(term)
+
+    assert store.search("cat") == []
+    assert [found.id for found in store.search("dog")] == [term.id]
+
+    store.delete(term.id)
+    assert store.search("dog") == []
+
+
+def test_get_hardest(store, db):
+    db.executemany("INSERT INTO term_groups (id, user_id, name) VALUES (?, ?, 'group')", [(1, 1), (2, 2)])
+    store.create_many(
+        [
+            Term(group_id=1, term="easy", definition="", total_ans=3, difficulty=0.1),
+            Term(group_id=1, term="hard", definition="", total_ans=3, difficulty=0.9),
+            Term(group_id=1, term="new", definition=""),
+            Term(group_id=2, term="other user", definition="", total_ans=3, difficulty=1.0),
+        ]
+    )
+
+    assert [term.term for term in store.get_hardest(1)] == ["hard", "easy"]
+
+
+def test_update_text_keeps_progress(store):
+    term = store.create(Term(group_id=1, term="Term", definition="Definition"))
+    term.total_ans, term.correct_ans, term.mastery_coef, term.due_at = 4, 3, 0.75, 100
+    store.update(term)
+
+    store.update_text(term.id, "New term", "New definition")
+    updated = store.get(term.id)
+
+    assert (updated.term, updated.definition) == ("New term", "New definition")
+    assert (updated.total_ans, updated.correct_ans, updated.mastery_coef, updated.due_at) == (4, 3, 0.75, 100)
+    assert store.get_content_hashes(1, [content_hash("new term", "new definition")]) == {
+        content_hash("New term", "New definition")
+    }
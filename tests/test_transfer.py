@@ -0,0 +1,133 @@
+import json
+
+import pytest
+
+from helix.models import Term, TermGroup, User
+from helix.store import Store
+from helix.transfer import ImportReport, detect_format, export_terms, import_terms
+
+
+@pytest.fixture
+def store():
+    store = Store(":memory:")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def group(store):
+    user = store.users.create(User(username="user"))
+    return store.term_groups.create(TermGroup(user_id=user.id, name="group"))
+
+
+def words(store, group):
+    return [(term.term, term.definition) for term in store.terms.get_by_group_id(group.id)]
+
+
+def test_detect_format():
+    assert detect_format("deck.CSV") == "csv"
+    assert detect_format("notes.txt") == "anki"
+    with pytest.raises(ValueError, match="Unsupported"):
+        detect_format("deck.xlsx")
+
+
+def test_import_csv(store, group, tmp_path):
+    path = tmp_path / "deck.csv"
+    path.write_text('\ufeffterm,definition\ncat,meows\n"dog","barks, loudly"\n\nowl,\n', encoding="utf-8")
+
+    report = import_terms(store, group.id, path)
+
+    assert report == ImportReport(imported=2, duplicates=0, invalid=1)
+    assert words(store, group) == [("cat", "meows"), ("dog", "barks, loudly")]
+
+
+def test_import_skips_duplicates_across_chunks(store, group, tmp_path):
+    store.terms.create(Term("cat", "meows", group.id))
+    path = tmp_path / "deck.tsv"
+    path.write_text("Cat \tmeows\ndog\tbarks\ndog\tbarks\ncow\tmoos\ndog\tBARKS\n")
+
+    report = import_terms(store, group.id, path, chunk_size=2)
+
+    assert report == ImportReport(imported=2, duplicates=3, invalid=0)
+    assert words(store, group) == [("cat", "meows"), ("dog", "barks"), ("cow", "moos")]
+
+
+def test_import_jsonl_and_anki(store, group, tmp_path):
+    jsonl = tmp_path / "deck.jsonl"
+    jsonl.write_text('{"term": "cat", "definition": "meows"}\nnot json\n{"term": 1, "definition": "one"}\n')
+    anki = tmp_path / "deck.txt"
+    anki.write_text("#separator:tab\n#html:false\ndog\tbarks\n")
+
+    assert import_terms(store, group.id, jsonl) == ImportReport(imported=1, duplicates=0, invalid=2)
+    assert import_terms(store, group.id, anki) == ImportReport(imported=1, duplicates=0, invalid=0)
+    assert words(store, group) == [("cat", "meows"), ("dog", "barks")]
+
+
+def test_import_takes_header_from_first_row_only(store, group, tmp_path):
+    path = tmp_path / "deck.csv"
+    path.write_text("cat,meows\nterm,definition\n")
+
+    assert import_terms(store, group.id, path) == ImportReport(imported=2, duplicates=0, invalid=0)
+    assert words(store, group) == [("cat", "meows"), ("term", "definition")]
+
+
+def test_import_anki_keeps_later_hash_lines(store, group, tmp_path):
+    path = tmp_path / "deck.txt"
+    path.write_text("#separator:tab\n#html:false\n#hashtag\tlabel starting with a hash\n#1\tfirst\n")
+
+    assert import_terms(store, group.id, path) == ImportReport(imported=2, duplicates=0, invalid=0)
+    assert words(store, group) == [("#hashtag", "label starting with a hash"), ("#1", "first")]
+
+
+def test_import_reports_line_numbers(store, group, tmp_path, caplog):
+    path = tmp_path / "deck.txt"
+    path.write_text("#separator:tab\ndog\tbarks\nowl\n")
+
+    assert import_terms(store, group.id, path) == ImportReport(imported=1, duplicates=0, invalid=1)
+    assert "Skipping line 3 " in caplog.text
+
+
+def test_import_reports_progress(store, group, tmp_path):
+    path = tmp_path / "deck.csv"
+    path.write_text("".join(f"term{i},definition{i}\n" for i in range(10)))
+    progress = []
+
+    import_terms(store, group.id, path, chunk_size=4, progress=lambda done, total: progress.append((done, total)))
+
+    size = path.stat().st_size
+    assert [total for _, total in progress] == [size] * 3
+    assert progress[-1][0] == size
+    assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+
+def test_import_rolls_back_on_error(store, group, tmp_path):
+    path = tmp_path / "deck.csv"
+    path.write_bytes(b"cat,meows\n" * 10 + b"\xff\n")
+
+    with pytest.raises(UnicodeDecodeError):
+        import_terms(store, group.id, path, chunk_size=2)
+
+    assert words(store, group) == []
+
+
+@pytest.mark.parametrize("name", ["deck.csv", "deck.tsv", "deck.jsonl", "deck.txt"])
+def test_export_round_trip(store, group, tmp_path, name):
+    terms = [Term(f"term {i}", f'definition, "{i}"\twith tab', group.id) for i in range(7)]
+    store.terms.create_many(terms)
+    path = tmp_path / name
+
+    assert export_terms(store, group.id, path, batch_size=3) == 7
+
+    other = store.term_groups.create(TermGroup(user_id=group.user_id, name="other"))
+    assert import_terms(store, other.id, path).imported == 7
+    assert words(store, other) == words(store, group)
+
+
+def test_export_jsonl(store, group, tmp_path):
+    store.terms.create(Term("café", "coffee shop", group.id))
+    path = tmp_path / "deck.jsonl"
+    export_terms(store, group.id, path)
+
+    assert [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()] == [
+        {"term": "café", "definition": "coffee shop"}
+    ]
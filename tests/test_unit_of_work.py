@@ -0,0 +1,161 @@
+import sqlite3
+
+import pytest
+
+from helix.models import User
+from helix.store import Store, UnitOfWork, UsersStore
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "database.db")
+
+
+def count_users(path):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_commit_per_write_by_default(path):
+    store = Store(path)
+    store.users.create(User(username="user1"))
+
+    assert count_users(path) == 1
+    store.close()
+
+
+def test_transaction_commits_once(path):
+    store = Store(path)
+    with store.transaction() as unit_of_work:
+        store.users.create(User(username="user1"))
+        store.users.create(User(username="user2"))
+
+        assert unit_of_work.pending == 2
+        assert count_users(path) == 0
+
+    assert unit_of_work.pending == 0
+    assert count_users(path) == 2
+    store.close()
+
+
+def test_nested_transaction_joins_outer(path):
+    store = Store(path)
+    with store.transaction():
+        with store.transaction():
+            store.users.create(User(username="user1"))
+
+        assert count_users(path) == 0
+
+    assert count_users(path) == 1
+    store.close()
+
+
+def test_transaction_rolls_back_on_error(path):
+    store = Store(path)
+    with pytest.raises(RuntimeError), store.transaction():
+        store.users.create(User(username="user1"))
+        raise RuntimeError
+
+    assert store.users.list() == []
+    assert count_users(path) == 0
+    store.close()
+
+
+def test_write_behind_flushes_on_size(path):
+    store = Store(path, max_pending_writes=3)
+    store.users.create(User(username="user1"))
+    store.users.create(User(username="user2"))
+
+    assert count_users(path) == 0
+
+    store.users.create(User(username="user3"))
+
+    assert count_users(path) == 3
+    store.close()
+
+
+def test_write_behind_flushes_on_delay(path, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("time.monotonic", lambda: now[0])
+    store = Store(path, max_pending_writes=100, max_write_delay=1.0)
+    store.users.create(User(username="user1"))
+
+    assert count_users(path) == 0
+
+    now[0] += 1.5
+    store.users.create(User(username="user2"))
+
+    assert count_users(path) == 2
+    store.close()
+
+
+def test_close_flushes_pending_writes(path):
+    store = Store(path, max_pending_writes=100)
+    store.users.create(User(username="user1"))
+    store.close()
+
+    assert count_users(path) == 1
+
+
+def test_standalone_store_commits_immediately(db):
+    store = UsersStore(db, UnitOfWork(db))
+    store.create(User(username="user1"))
+
+    assert not db.in_transaction
+
+
+def test_transaction_commits_writes_queued_before_it(path):
+    store = Store(path, max_pending_writes=100)
+    store.users.create(User(username="user1"))
+
+    with pytest.raises(RuntimeError), store.transaction():
+        store.users.create(User(username="user2"))
+        raise RuntimeError
+
+    assert count_users(path) == 1
+    store.close()
+
+
+def test_failed_nested_transaction_rolls_back_its_writes_only(path):
+    store = Store(path)
+    with store.transaction():
+        store.users.create(User(username="user1"))
+        with pytest.raises(RuntimeError), store.transaction():
+            store.users.create(User(username="user2"))
+            raise RuntimeError
+        store.users.create(User(username="user3"))
+
+    assert [user.username for user in store.users.list()] == ["user1", "user3"]
+    assert count_users(path) == 2
+    store.close()
+
+
+def test_failed_transaction_rolls_back_nested_ones(path):
+    store = Store(path)
+    with pytest.raises(RuntimeError), store.transaction():
+        with store.transaction():
+            store.users.create(User(username="user1"))
+        raise RuntimeError
+
+    assert count_users(path) == 0
+    store.close()
+
+
+def test_flush_pending_waits_for_open_transaction(path):
+    store = Store(path, max_pending_writes=100)
+    store.users.create(User(username="user1"))
+    store.unit_of_work.flush_pending()
+
+    assert count_users(path) == 1
+
+    with store.transaction():
+        store.users.create(User(username="user2"))
+        store.unit_of_work.flush_pending()
+
+        assert count_users(path) == 1
+
+    assert count_users(path) == 2
+    store.close()
@@ -0,0 +1,65 @@
+import pytest
+
+from helix.store import UserStatsStore
+
+DAY = 738_000
+
+
+@pytest.fixture
+def store(db):
+    return UserStatsStore(db)
+
+
+def test_record_creates_and_adds(store):
+    store.record(1, points=3, answers=5, correct=3, day=DAY)
+    store.record(1, points=2, answers=2, correct=2, day=DAY)
+    stats = store.get(1)
+
+    assert (stats.points, stats.answers, stats.correct) == (5, 7, 5)
+    assert store.get(2) is None
+
+
+def test_streaks(store):
+    for day in (DAY, DAY + 1, DAY + 1, DAY + 2, DAY + 5, DAY + 6):
+        store.record(1, points=1, answers=1, correct=1, day=day)
+    stats = store.get(1)
+
+    assert (stats.streak, stats.best_streak, stats.last_day) == (2, 3, DAY + 6)
+    assert stats.current_streak(DAY + 7) == 2
+    assert stats.current_streak(DAY + 8) == 0
+
+
+def test_late_record_keeps_streak(store):
+    store.record(1, points=1, answers=1, correct=1, day=DAY + 1)
+    store.record(1, points=1, answers=1, correct=1, day=DAY + 2)
+    store.record(1, points=1, answers=1, correct=1, day=DAY)
+
+    assert (store.get(1).streak, store.get(1).last_day) == (2, DAY + 2)
+
+
+def test_history(store):
+    store.record(1, points=1, answers=2, correct=1, day=DAY + 1)
+    store.record(1, points=4, answers=4, correct=4, day=DAY)
+    store.record(1, points=1, answers=1, correct=1, day=DAY)
+    store.record(2, points=9, answers=9, correct=9, day=DAY)
+
+    assert [(day.day, day.points, day.answers) for day in store.history(1)] == [(DAY, 5, 5), (DAY + 1, 1, 2)]
+    assert [day.day for day in store.history(1, since_day=DAY + 1)] == [DAY + 1]
+
+
+def test_leaderboard(store):
+    for user_id, points in [(1, 5), (2, 9), (3, 1), (4, 9)]:
+        store.record(user_id, points=points, answers=points, correct=points, day=DAY)
+
+    assert [stats.user_id for stats in store.leaderboard(limit=3)] == [2, 4, 1]
+
+
+def test_lookups_use_indexes(db):
+    total = db.execute("EXPLAIN QUERY PLAN SELECT points FROM user_stats WHERE user_id = ?", (1,)).fetchall()
+    top = db.execute(
+        "EXPLAIN QUERY PLAN SELECT user_id FROM user_stats ORDER BY points DESC, user_id LIMIT 10"
+    ).fetchall()
+
+    assert "PRIMARY KEY" in total[0][3] or "INTEGER PRIMARY KEY" in total[0][3]
+    assert "user_stats_points" in top[0][3]
+    assert all("TEMP B-TREE" not in row[3] for row in top)
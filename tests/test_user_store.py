@@ -55,3 +55,47 @@ def test_delete_user(store):
     deleted_user = store.get(created_user.id)
 
     assert deleted_user is None
+
+
+def test_create_many_users(store):
+    users = [User(username=f"user{i}") for i in range(3)]
+    ids = store.create_many(users)
+
+    assert ids == [user.id for user in users]
+    assert [user.username for user in store.list()] == ["user0", "user1", "user2"]
+    assert store.get(ids[2]).username == "user2"
+
+
+def test_update_many_users(store):
+    users = [User(username=f"user{i}") for i in range(2)]
+    store.create_many(users)
+    for user in users:
+        user.username = user.username.upper()
+    store.update_many(users)
+
+    assert [user.username for user in store.list()] == ["USER0", "USER1"]
+
+
+def test_delete_many_users(store):
+    users = [User(username=f"user{i}") for i in range(3)]
+    ids = store.create_many(users)
+    store.delete_many(ids[:2])
+
+    assert [user.username for user in store.list()] == ["user2"]
+
+
+def test_list_users_paginated(store):
+    store.create_many([User(username=f"user{i}") for i in range(3)])
+    page = store.list(limit=2)
+
+    assert [user.username for user in page] == ["user0", "user1"]
+    assert [user.username for user in store.list(after_id=page[-1].id)] == ["user2"]
+
+
+def test_stream_users(store):
+    store.create_many([User(username=f"user{i}") for i in range(3)])
+
+    assert [[user.username for user in batch] for batch in store.stream(batch_size=2)] == [
+        ["user0", "user1"],
+        ["user2"],
+    ]